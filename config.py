@@ -5,6 +5,7 @@ Senior Data Engineer Architecture - Configuration Management
 """
 import os
 from pathlib import Path
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -25,6 +26,8 @@ class Settings(BaseSettings):
     # ============================================================
     PLAYWRIGHT_HEADLESS: bool = True  # Ejecutar sin interfaz gráfica / Ruli sen grafika interfaco
     PLAYWRIGHT_TIMEOUT: int = 30000  # Tiempo de espera en milisegundos / Atenditempo en milisekundoj
+    READY_SELECTOR_TIMEOUT: int = 5000  # Espera del selector de contenido del ATS (ms)
+    NETWORKIDLE_TIMEOUT: int = 10000  # Espera de 'networkidle' para sitios desconocidos (ms)
     
     # ============================================================
     # CONFIGURACIÓN DE SCRAPING / SKRAPADO AGORDADO
@@ -35,9 +38,97 @@ class Settings(BaseSettings):
     REQUEST_DELAY_MIN: float = 1.0
     REQUEST_DELAY_MAX: float = 3.0
     
+    # Crawl-delay explícito por host (JSON) / Eksplicita crawl-delay po gastiganto
+    # Ej: CRAWL_DELAY_OVERRIDES='{"boards.greenhouse.io": 0.5}'
+    CRAWL_DELAY_OVERRIDES: Dict[str, float] = {}
+    
+    # Concurrencia del scraper / Samtempeco de la skrapilo / Scraper concurrency
+    SCRAPER_CONCURRENCY: int = 4  # Páginas (contextos) en paralelo / Paralelaj paĝoj (kuntekstoj)
+    SCRAPER_PROCESSES: int = 2  # Procesos scraper (uno por shard de hosts) / Skrapilaj procezoj
+    
+    # Reciclaje de contextos del navegador / Reciklado de retumilaj kuntekstoj
+    CONTEXT_MAX_NAVIGATIONS: int = 100  # Navegaciones por contexto antes de reciclar (0 = sin límite)
+    CONTEXT_MAX_RSS_MB: float = 1500.0  # RSS del proceso + Chromium que fuerza reciclar (0 = sin límite)
+    CONTEXT_RSS_SAMPLE_EVERY: int = 10  # Navegaciones de un worker entre muestras de RSS
+    CONTEXT_RSS_COOLDOWN_SECONDS: float = 60.0  # Pausa tras reciclar por RSS / Paŭzo post reciklado pro RSS
+    CONTEXT_WARM_SPARE: bool = True  # Contexto de reserva ya creado / Rezerva kunteksto jam kreita
+    
+    # Navegador compartido (python -m src.browser_server) / Komuna retumilo
+    BROWSER_SERVER_ENABLED: bool = False  # El scheduler mantiene vivo el servidor / La planilo tenas la servilon viva
+    BROWSER_WS_ENDPOINT: Optional[str] = None  # ws:// explícito; si no, el publicado en el archivo
+    BROWSER_SERVER_HOST: str = "127.0.0.1"
+    BROWSER_SERVER_PORT: int = 9323
+    BROWSER_SERVER_ENDPOINT_FILE: str = "data/browser_server.ws"
+    BROWSER_SERVER_CONNECT_TIMEOUT: float = 5000  # milisegundos / milisekundoj
+    
+    # Ruta rápida HTTP para APIs de ATS / Rapida HTTP-vojo por ATS-API-oj
+    HTTP_FAST_PATH_ENABLED: bool = True  # Usar JSON público en vez de Playwright cuando exista
+    HTTP_TIMEOUT: float = 15.0  # segundos / sekundoj
+    HTTP_MAX_CONNECTIONS: int = 20  # Tamaño del pool httpx / Grandeco de la httpx-aro
+    STATIC_HTML_TIER_ENABLED: bool = True  # Probar HTML estático (lxml) antes de Playwright
+    
+    # Bloqueo de recursos en Playwright / Blokado de rimedoj en Playwright
+    SCRAPER_BLOCK_RESOURCES: bool = True  # Abortar imágenes, fuentes, media, CSS y trackers
+    SCRAPER_BLOCKED_RESOURCE_TYPES: List[str] = ["image", "font", "media", "stylesheet"]
+    SCRAPER_BLOCKED_DOMAINS: List[str] = [
+        "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+        "facebook.net", "hotjar.com", "segment.io", "segment.com",
+        "mixpanel.com", "amplitude.com", "fullstory.com", "px.ads.linkedin.com",
+        "bat.bing.com", "clarity.ms", "newrelic.com",
+        "nr-data.net", "optimizely.com", "intercom.io", "hs-analytics.net",
+    ]
+    
+    # Escritura por lotes en BD / Ara skribado en datumbazon / Buffered DB writes
+    DB_WRITE_BATCH_SIZE: int = 50  # Ofertas por INSERT multi-fila / Ofertoj po plurvica INSERT
+    DB_WRITE_FLUSH_INTERVAL: float = 5.0  # Segundos máximos entre vaciados / Maksimumaj sekundoj
+    DB_WRITE_QUEUE_SIZE: int = 500  # Cola hacia el hilo escritor (backpressure) / Vico al la skriba fadeno
+    
+    # Deduplicación antes de navegar / Senduobligo antaŭ navigi / Pre-navigation dedupe
+    SEEN_URLS_ENABLED: bool = True
+    SEEN_URLS_PATH: str = "data/seen_urls.bloom"  # Filtro de Bloom persistido / Konservita Bloom-filtrilo
+    SEEN_URLS_CAPACITY: int = 1_000_000  # URLs esperadas / Atendataj URL-oj
+    SEEN_URLS_ERROR_RATE: float = 0.01  # Falsos positivos (se confirman en BD) / Falsaj pozitivoj
+    
+    # Re-verificación de ofertas conocidas / Rekontrolo de konataj ofertoj / Recrawl
+    RECRAWL_STALE_HOURS: float = 24.0  # Re-verificar ofertas más antiguas que esto / Pli malnovaj ol tio
+    RECRAWL_BATCH_SIZE: int = 200  # Ofertas por lote de escritura / Ofertoj po skriba aro
+    RECRAWL_BROWSER_FALLBACK: bool = False  # Playwright para ofertas con JavaScript / Retumilo por JS-ofertoj
+    
+    # Frontera persistente / Persista limo / Durable crawl frontier
+    FRONTIER_BATCH_SIZE: int = 50  # URLs por lease / URL-oj po luo
+    FRONTIER_LEASE_SECONDS: int = 900  # Tras esto, otro proceso puede retomar el lote
+    FRONTIER_MAX_ATTEMPTS: int = 5  # Intentos antes de marcar failed / Provoj antaŭ failed
+    FRONTIER_VELOCITY_DAYS: int = 7  # Ventana de velocidad de la empresa / Fenestro de rapido
+    
+    # Descubrimiento de ofertas / Malkovro de ofertoj / Posting discovery
+    # Índices de board, sitemaps o listados paginados (JSON) / Tabulaj indeksoj, retejmapoj aŭ paĝigitaj listoj
+    # Ej: DISCOVERY_SEEDS='["https://boards.greenhouse.io/acme", "https://acme.com/sitemap.xml"]'
+    DISCOVERY_SEEDS: List[str] = []
+    DISCOVERY_INCLUDE_KNOWN_BOARDS: bool = True  # Añadir los boards de las ofertas ya guardadas
+    DISCOVERY_MAX_PAGES: int = 50  # Páginas por listado paginado o sitemaps por índice / Paĝoj po listo
+    DISCOVERY_QUEUE_SIZE: int = 500  # URLs descubiertas en espera (backpressure) / Atendantaj URL-oj
+    
+    # Salarios / Salajroj
+    # USD por unidad de moneda; sobrescribe la tabla estática de src/salary_parser.py
+    # Ej: SALARY_USD_RATES='{"ARS": 0.0009, "EUR": 1.1}'
+    SALARY_USD_RATES: Dict[str, float] = {}
+    
+    # Normalización de ubicaciones / Normaligo de lokoj
+    # Dump de ciudades GeoNames (ej: cities15000.txt) además del gazetteer incluido
+    LOCATION_GAZETTEER_PATH: Optional[str] = None
+    
+    # Archivo de páginas crudas / Arkivo de krudaj paĝoj
+    PAGE_ARCHIVE_ENABLED: bool = True
+    PAGE_ARCHIVE_DIR: str = "data/pages"
+    PAGE_ARCHIVE_MAX_MB: float = 5120.0  # Retención por tamaño (0 = sin límite) / Grandeca reteno
+    PAGE_ARCHIVE_COMPRESSION_LEVEL: int = 6  # zstd (si está instalado) o gzip
+    REEXTRACT_BATCH_SIZE: int = 2000  # Filas por lote de re-extracción offline / Vicoj po aro
+    
     # Retry configuration / Reprova agordado
-    MAX_RETRIES: int = 3
-    RETRY_DELAY: int = 5  # segundos / sekundoj
+    MAX_RETRIES: int = 3  # Reintentos por error transitorio / Reprovoj po pasema eraro
+    RETRY_DELAY: int = 5  # segundos; base de la espera exponencial / bazo de la eksponenta atendo
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # Fallos seguidos que abren el circuito de un host
+    CIRCUIT_OPEN_SECONDS: float = 300.0  # Tiempo aparcado antes de probar de nuevo / Parkumita tempo
     
     # ============================================================
     # CONFIGURACIÓN DE APLICACIÓN / APLIKA AGORDADO
@@ -0,0 +1,22 @@
+"""
+Fixtures compartidas de los tests / Komunaj fiksaĵoj de la testoj
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src import database
+from src.models import Base
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """
+    BD SQLite temporal para get_db(), sin tocar labortrovilo.db
+    Provizora SQLite-datumbazo por get_db()
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(database, 'SessionLocal', sessionmaker(bind=engine, expire_on_commit=False))
+    yield engine
+    engine.dispose()
@@ -0,0 +1,303 @@
+"""
+Ruta Rápida HTTP para APIs Públicas de ATS / Rapida HTTP-vojo por Publikaj ATS-API-oj
+Senior Data Engineer Architecture - Browserless JSON fetcher
+
+Greenhouse, Lever, SmartRecruiters y Workable publican el detalle de cada oferta
+como JSON. Para esas URLs basta un GET con httpx (conexiones reutilizadas) en
+lugar de cargar una página completa en Chromium.
+"""
+import logging
+import re
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+
+from src.extractors import html_to_text, parse_iso_date
+from src.salary_parser import PERIOD_FACTORS, period_of_unit
+from src.schemas import SourcePlatform
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+
+# Endpoints públicos por plataforma / Publikaj finpunktoj po platformo
+# Se pueden sobrescribir (ej: servidor de fixtures local en tests)
+ATS_API_ENDPOINTS: Dict[SourcePlatform, str] = {
+    SourcePlatform.GREENHOUSE: "https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{job_id}",
+    SourcePlatform.LEVER: "https://api.lever.co/v0/postings/{board}/{job_id}",
+    SourcePlatform.SMARTRECRUITERS: "https://api.smartrecruiters.com/v1/companies/{board}/postings/{job_id}",
+    SourcePlatform.WORKABLE: "https://apply.workable.com/api/v2/accounts/{board}/jobs/{job_id}",
+}
+
+# Patrones de URL de oferta → (board, job_id) / Ŝablonoj de oferta URL
+_POSTING_PATTERNS = [
+    (SourcePlatform.GREENHOUSE, re.compile(r'^(?:boards|job-boards)\.greenhouse\.io$'), re.compile(r'^/([^/]+)/jobs/(\d+)')),
+    (SourcePlatform.LEVER, re.compile(r'^jobs\.lever\.co$'), re.compile(r'^/([^/]+)/([0-9a-f-]{36})')),
+    (SourcePlatform.SMARTRECRUITERS, re.compile(r'^jobs\.smartrecruiters\.com$'), re.compile(r'^/([^/]+)/(\d+)')),
+    (SourcePlatform.WORKABLE, re.compile(r'^apply\.workable\.com$'), re.compile(r'^/([^/]+)/j/([0-9A-Za-z]+)')),
+]
+
+
+def _humanize_board(board: str) -> str:
+    """'acme-corp' → 'Acme Corp' / Homigas la tabulan nomon"""
+    return ' '.join(part.capitalize() for part in re.split(r'[-_]+', board) if part) or board
+
+
+def _join_text(*parts: Optional[str]) -> Optional[str]:
+    """Une fragmentos HTML/texto en un solo texto plano / Kunigas fragmentojn"""
+    texts = [html_to_text(part) for part in parts if part]
+    return '\n\n'.join(text for text in texts if text) or None
+
+
+def _from_epoch_ms(value: Any) -> Optional[datetime]:
+    """Convierte milisegundos epoch a datetime UTC / Konvertas epoch-milisekundojn"""
+    try:
+        return datetime.utcfromtimestamp(int(value) / 1000)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def resolve_posting(url: str) -> Optional[Tuple[SourcePlatform, str, str]]:
+    """
+    Identifica una URL de oferta con API pública
+    Identigas oferto-URL kun publika API
+
+    Returns:
+        (plataforma, board, job_id) o None si no hay API conocida
+    """
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+
+    # Embed de Greenhouse: /embed/job_app?for=board&token=id
+    if re.match(r'^(?:boards|job-boards)\.greenhouse\.io$', host) and parsed.path.startswith('/embed/job_app'):
+        query = parse_qs(parsed.query)
+        board = (query.get('for') or [None])[0]
+        job_id = (query.get('token') or [None])[0]
+        if board and job_id and job_id.isdigit():
+            return SourcePlatform.GREENHOUSE, board, job_id
+        return None
+
+    for platform, host_pattern, path_pattern in _POSTING_PATTERNS:
+        if host_pattern.match(host):
+            match = path_pattern.match(parsed.path)
+            if match:
+                return platform, match.group(1), match.group(2)
+    return None
+
+
+# ============================================================
+# PARSERS DE PAYLOAD / PAYLOAD-ANALIZILOJ
+# ============================================================
+
+def _parse_greenhouse(payload: Dict[str, Any], board: str) -> Dict[str, Any]:
+    location = payload.get('location') or {}
+    return {
+        'title': payload.get('title'),
+        'company': payload.get('company_name') or _humanize_board(board),
+        'description': html_to_text(payload.get('content')),
+        'location': location.get('name') if isinstance(location, dict) else None,
+        'posted_date': parse_iso_date(payload.get('first_published') or payload.get('updated_at')),
+        'external_id': str(payload['id']) if payload.get('id') else None,
+    }
+
+
+def _parse_lever(payload: Dict[str, Any], board: str) -> Dict[str, Any]:
+    categories = payload.get('categories') or {}
+    lists = ''.join(
+        f"<h3>{item.get('text', '')}</h3>{item.get('content', '')}"
+        for item in payload.get('lists') or []
+    )
+    fields = {
+        'title': payload.get('text'),
+        'company': _humanize_board(board),
+        'description': _join_text(
+            payload.get('descriptionPlain') or payload.get('description'),
+            lists,
+            payload.get('additionalPlain') or payload.get('additional'),
+        ),
+        'location': categories.get('location'),
+        'is_remote': True if (payload.get('workplaceType') or '').lower() == 'remote' else None,
+        'posted_date': _from_epoch_ms(payload.get('createdAt')),
+        'external_id': payload.get('id'),
+    }
+
+    salary = payload.get('salaryRange') or {}
+    if salary.get('min') is not None:
+        # Anualizado como en src/salary_parser.py / Jarigita kiel en salary_parser
+        factor = PERIOD_FACTORS[period_of_unit(salary.get('interval')) or 'year']
+        fields['salary_min'] = float(salary['min']) * factor
+        fields['salary_max'] = float(salary.get('max') or salary['min']) * factor
+        fields['salary_currency'] = salary.get('currency')
+        interval = (salary.get('interval') or '').replace('-', ' ')
+        fields['salary'] = (
+            f"{salary.get('currency') or ''} {float(salary['min']):,.0f} - "
+            f"{float(salary.get('max') or salary['min']):,.0f} {interval}"
+        ).strip()
+    return fields
+
+
+def _parse_smartrecruiters(payload: Dict[str, Any], board: str) -> Dict[str, Any]:
+    company = payload.get('company') or {}
+    location = payload.get('location') or {}
+    sections = ((payload.get('jobAd') or {}).get('sections') or {})
+    return {
+        'title': payload.get('name'),
+        'company': company.get('name') or _humanize_board(board),
+        'description': _join_text(*(
+            (sections.get(key) or {}).get('text')
+            for key in ('jobDescription', 'qualifications', 'additionalInformation', 'companyDescription')
+        )),
+        'location': ', '.join(
+            part for part in (location.get('city'), location.get('region'), (location.get('country') or '').upper()) if part
+        ) or None,
+        'is_remote': True if location.get('remote') else None,
+        'posted_date': parse_iso_date(payload.get('releasedDate')),
+        'external_id': str(payload['id']) if payload.get('id') else None,
+    }
+
+
+def _parse_workable(payload: Dict[str, Any], board: str) -> Dict[str, Any]:
+    location = payload.get('location') or {}
+    return {
+        'title': payload.get('title'),
+        'company': _humanize_board(board),
+        'description': _join_text(payload.get('description'), payload.get('requirements'), payload.get('benefits')),
+        'location': ', '.join(
+            part for part in (location.get('city'), location.get('region'), location.get('country')) if part
+        ) or None,
+        'is_remote': True if payload.get('remote') else None,
+        'posted_date': parse_iso_date(payload.get('published')),
+        'external_id': payload.get('shortcode'),
+    }
+
+
+_PAYLOAD_PARSERS = {
+    SourcePlatform.GREENHOUSE: _parse_greenhouse,
+    SourcePlatform.LEVER: _parse_lever,
+    SourcePlatform.SMARTRECRUITERS: _parse_smartrecruiters,
+    SourcePlatform.WORKABLE: _parse_workable,
+}
+
+
+# ============================================================
+# FETCHER
+# ============================================================
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Crea el cliente httpx compartido con pool de conexiones
+    Kreas la komunan httpx-klienton kun konekta aro
+    """
+    return httpx.AsyncClient(
+        timeout=settings.HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS
+        ),
+        headers={'User-Agent': settings.USER_AGENT},
+        follow_redirects=True
+    )
+
+
+class ATSApiFetcher:
+    """
+    Cliente HTTP con pool de conexiones para APIs públicas de ATS
+    HTTP-kliento kun konekta aro por publikaj ATS-API-oj
+
+    Uso / Uzo / Usage:
+        fetcher = ATSApiFetcher()
+        fields = await fetcher.fetch_fields(url)  # None → usar Playwright
+        await fetcher.close()
+    """
+
+    def __init__(
+        self,
+        endpoints: Optional[Dict[SourcePlatform, str]] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Args:
+            endpoints: Plantillas de endpoint por plataforma (por defecto ATS_API_ENDPOINTS)
+            client: Cliente httpx compartido (por defecto uno propio con pool)
+        """
+        self.endpoints = {**ATS_API_ENDPOINTS, **(endpoints or {})}
+        self._owns_client = client is None
+        self.client = client or create_http_client()
+
+    def api_url_for(self, url: str) -> Optional[Tuple[SourcePlatform, str, str]]:
+        """
+        Devuelve (plataforma, URL de API, board) o None
+        Redonas (platformo, API-URL, tabulo) aŭ None
+        """
+        posting = resolve_posting(url)
+        if not posting:
+            return None
+        platform, board, job_id = posting
+        template = self.endpoints.get(platform)
+        if not template:
+            return None
+        return platform, template.format(board=board, job_id=job_id), board
+
+    def supports(self, url: str) -> bool:
+        """¿La URL tiene API pública conocida? / Ĉu la URL havas konatan publikan API-on?"""
+        return self.api_url_for(url) is not None
+
+    async def fetch_fields(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene y normaliza la oferta desde la API del ATS
+        Akiras kaj normaligas la oferton el la ATS-API
+
+        Returns:
+            Campos en el mismo formato que JobExtractor.extract(), o None si
+            la API falla y hay que usar Playwright.
+        """
+        resolved = self.api_url_for(url)
+        if not resolved:
+            return None
+        platform, api_url, board = resolved
+
+        try:
+            response = await self.client.get(api_url, headers={'Accept': 'application/json'})
+            if response.status_code != 200:
+                logger.warning(f"⚠️ API {platform.value} respondió {response.status_code}: {api_url}")
+                return None
+            payload = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"⚠️ Error consultando API {platform.value}: {e}")
+            return None
+
+        fields = self.parse_payload(platform, payload, board)
+        if fields:
+            # Respuesta cruda para el archivo de páginas (src/page_archive.py)
+            fields['raw_page'] = ('api', response.text)
+            logger.info(f"⚡ Oferta obtenida por API {platform.value}: {fields['title']}")
+        return fields
+
+    def parse_payload(self, platform: SourcePlatform, payload: Any, board: str) -> Optional[Dict[str, Any]]:
+        """
+        Normaliza un payload JSON ya descargado / Normaligas jam elŝutitan JSON-payload
+
+        Returns:
+            Campos del scraper, o None si el payload no es una oferta válida
+        """
+        if not isinstance(payload, dict):
+            return None
+
+        try:
+            fields = _PAYLOAD_PARSERS[platform](payload, board)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Payload inesperado de API {platform.value}: {e}")
+            return None
+        if not fields.get('title'):
+            return None
+
+        fields['extraction_path'] = f"{platform.value}:api"
+        return fields
+
+    async def close(self):
+        """Cierra el pool de conexiones / Fermas la konektan aron"""
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,305 @@
+"""
+Diff de Listados por Board / Diferenco de Listoj po Tabulo
+Senior Data Engineer Architecture - Board-level listing diff
+
+Para saber si una oferta sigue activa no hace falta visitarla: basta con el
+índice del board de la empresa. Se descarga cada listado una vez por ciclo, se
+compara con las ofertas activas guardadas y las ausentes se desactivan en un
+único UPDATE masivo. Los IDs nuevos se devuelven como URLs canónicas para la
+frontera de scraping (crawl_frontier). Una petición por empresa en lugar de una
+por oferta.
+"""
+import asyncio
+import logging
+import re
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Set
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy import select, update
+
+from src.database import get_db
+from src.models import Job, Company
+from src.schemas import SourcePlatform
+from src.ats_api import create_http_client, resolve_posting
+from src.rate_limiter import HostRateLimiter
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+
+# Índices públicos por plataforma / Publikaj indeksoj po platformo
+# Se pueden sobrescribir (ej: servidor de fixtures local en tests)
+BOARD_LIST_ENDPOINTS: Dict[SourcePlatform, str] = {
+    SourcePlatform.GREENHOUSE: "https://boards-api.greenhouse.io/v1/boards/{board}/jobs",
+    SourcePlatform.LEVER: "https://api.lever.co/v0/postings/{board}?mode=json",
+    SourcePlatform.SMARTRECRUITERS: "https://api.smartrecruiters.com/v1/companies/{board}/postings",
+    SourcePlatform.WORKABLE: "https://apply.workable.com/api/v1/widget/accounts/{board}",
+}
+
+# URL canónica de una oferta del listado (misma forma que src/url_canonicalizer.py)
+# Kanona URL de oferto el la listo (sama formo kiel src/url_canonicalizer.py)
+POSTING_URL_TEMPLATES: Dict[SourcePlatform, str] = {
+    SourcePlatform.GREENHOUSE: "https://boards.greenhouse.io/{board}/jobs/{job_id}",
+    SourcePlatform.LEVER: "https://jobs.lever.co/{board}/{job_id}",
+    SourcePlatform.SMARTRECRUITERS: "https://jobs.smartrecruiters.com/{board}/{job_id}",
+    SourcePlatform.WORKABLE: "https://apply.workable.com/{board}/j/{job_id}",
+}
+
+# Tamaño de página de SmartRecruiters / Paĝa grandeco de SmartRecruiters
+_SMARTRECRUITERS_PAGE = 100
+
+# IDs por sentencia UPDATE ... IN / ID-oj po UPDATE ... IN
+_UPDATE_CHUNK = 10_000
+
+
+# Índice de un board: URL pública sin oferta / Indekso de tabulo: publika URL sen oferto
+_BOARD_PATTERNS = [
+    (SourcePlatform.GREENHOUSE, re.compile(r'^(?:boards|job-boards)\.greenhouse\.io$'), re.compile(r'^/([^/]+)/?$')),
+    (SourcePlatform.LEVER, re.compile(r'^jobs\.lever\.co$'), re.compile(r'^/([^/]+)/?$')),
+    (SourcePlatform.SMARTRECRUITERS, re.compile(r'^(?:jobs|careers)\.smartrecruiters\.com$'), re.compile(r'^/([^/]+)/?$')),
+    (SourcePlatform.WORKABLE, re.compile(r'^apply\.workable\.com$'), re.compile(r'^/([^/]+)/?$')),
+]
+
+
+def resolve_board(url: str) -> Optional[Tuple[SourcePlatform, str]]:
+    """
+    Identifica la URL pública del índice de un board
+    Identigas la publikan URL de la indekso de tabulo
+
+    Returns:
+        (plataforma, board) o None si la URL no es un índice conocido
+    """
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    for platform, host_pattern, path_pattern in _BOARD_PATTERNS:
+        if host_pattern.match(host):
+            match = path_pattern.match(parsed.path)
+            if match:
+                return platform, match.group(1).lower()
+    return None
+
+
+def _listing_ids(platform: SourcePlatform, payload: Any) -> List[str]:
+    """
+    IDs de oferta de un payload de listado / Oferto-ID-oj el lista payload
+    """
+    if platform == SourcePlatform.GREENHOUSE:
+        return [str(job['id']) for job in payload['jobs']]
+    if platform == SourcePlatform.LEVER:
+        return [str(job['id']) for job in payload]
+    if platform == SourcePlatform.SMARTRECRUITERS:
+        return [str(job['id']) for job in payload['content']]
+    if platform == SourcePlatform.WORKABLE:
+        return [str(job['shortcode']) for job in payload['jobs']]
+    raise ValueError(f"Plataforma sin listado: {platform}")
+
+
+class BoardListingCrawler:
+    """
+    Sincroniza el estado activo de las ofertas con el índice de cada board
+    Sinkronigas la aktivan staton de la ofertoj kun la indekso de ĉiu tabulo
+
+    Uso / Uzo / Usage:
+        crawler = BoardListingCrawler()
+        summary = await crawler.run()
+        new_urls = summary['new_urls']  # → frontera de scraping
+    """
+
+    def __init__(
+        self,
+        endpoints: Optional[Dict[SourcePlatform, str]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[HostRateLimiter] = None
+    ):
+        """
+        Args:
+            endpoints: Plantillas de listado por plataforma (por defecto BOARD_LIST_ENDPOINTS)
+            client: Cliente httpx compartido (por defecto uno propio con pool)
+            rate_limiter: Limitador por host compartido (por defecto uno propio)
+        """
+        self.endpoints = {**BOARD_LIST_ENDPOINTS, **(endpoints or {})}
+        self._owns_client = client is None
+        self.client = client or create_http_client()
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+
+    def load_boards(self) -> Dict[Tuple[SourcePlatform, str], Dict[str, Any]]:
+        """
+        Agrupa las ofertas guardadas por (plataforma, board)
+        Grupigas la konservitajn ofertojn po (platformo, tabulo)
+
+        Returns:
+            {(plataforma, board): {'company_ids', 'active': {id oferta: job.id},
+                                   'inactive': {id oferta: job.id}}}
+        """
+        boards: Dict[Tuple[SourcePlatform, str], Dict[str, Any]] = {}
+        with get_db() as db:
+            rows = db.execute(
+                select(Job.id, Job.url, Job.company_id, Job.is_active)
+                .execution_options(yield_per=10_000)
+            )
+            for job_id, url, company_id, is_active in rows:
+                posting = resolve_posting(url)
+                if not posting or posting[0] not in self.endpoints:
+                    continue
+                platform, board, posting_id = posting
+                entry = boards.setdefault(
+                    (platform, board.lower()),
+                    {'company_ids': set(), 'active': {}, 'inactive': {}}
+                )
+                if company_id:
+                    entry['company_ids'].add(company_id)
+                entry['active' if is_active else 'inactive'][posting_id.lower()] = job_id
+        return boards
+
+    async def _get_json(self, url: str) -> Any:
+        await self.rate_limiter.acquire(url)
+        response = await self.client.get(url, headers={'Accept': 'application/json'})
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_listing(self, platform: SourcePlatform, board: str) -> Optional[List[str]]:
+        """
+        Descarga el índice del board / Elŝutas la indekson de la tabulo
+
+        Returns:
+            IDs de las ofertas publicadas, o None si el listado falló
+            (un fallo nunca desactiva ofertas)
+        """
+        list_url = self.endpoints[platform].format(board=board)
+        try:
+            if platform != SourcePlatform.SMARTRECRUITERS:
+                return _listing_ids(platform, await self._get_json(list_url))
+
+            # SmartRecruiters pagina con offset / SmartRecruiters paĝigas per offset
+            ids: List[str] = []
+            while True:
+                payload = await self._get_json(f"{list_url}?limit={_SMARTRECRUITERS_PAGE}&offset={len(ids)}")
+                page_ids = _listing_ids(platform, payload)
+                ids.extend(page_ids)
+                if not page_ids or len(ids) >= payload.get('totalFound', 0):
+                    return ids
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Listado {platform.value}/{board} no disponible: {e}")
+            return None
+
+    async def run(self, concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Un ciclo: descarga cada listado, desactiva ausentes y devuelve las nuevas
+        Unu ciklo: elŝutas ĉiun liston, malaktivigas forestantajn kaj redonas la novajn
+
+        Returns:
+            Resumen con boards, listed, deactivated, reactivated, failed,
+            new_urls (URLs canónicas aún no guardadas) y new_by_company
+            ({company_id: URLs}, para la prioridad en la frontera)
+        """
+        boards = await asyncio.to_thread(self.load_boards)
+        semaphore = asyncio.Semaphore(concurrency or settings.SCRAPER_CONCURRENCY)
+        logger.info(f"📋 Sincronizando {len(boards)} boards...")
+
+        async def fetch(key):
+            async with semaphore:
+                return key, await self.fetch_listing(*key)
+
+        summary: Dict[str, Any] = {
+            'boards': len(boards), 'listed': 0, 'deactivated': 0,
+            'reactivated': 0, 'failed': 0, 'new_urls': [], 'new_by_company': {},
+        }
+        missing_ids: List[int] = []
+        reappeared_ids: List[int] = []
+        synced_companies: Set[int] = set()
+
+        for (platform, board), listing in await asyncio.gather(*(fetch(key) for key in boards)):
+            entry = boards[(platform, board)]
+            if listing is None:
+                summary['failed'] += 1
+                continue
+            if not listing and entry['active']:
+                # Un listado vacío suele ser un error del ATS / Malplena listo kutime estas ATS-eraro
+                logger.warning(f"⚠️ Listado vacío para {platform.value}/{board}, no se desactiva nada")
+                summary['failed'] += 1
+                continue
+
+            listed = {posting_id.lower(): posting_id for posting_id in listing}
+            summary['listed'] += len(listed)
+            synced_companies.update(entry['company_ids'])
+
+            missing_ids.extend(job_id for posting_id, job_id in entry['active'].items() if posting_id not in listed)
+            reappeared_ids.extend(job_id for posting_id, job_id in entry['inactive'].items() if posting_id in listed)
+            new_urls = [
+                POSTING_URL_TEMPLATES[platform].format(board=board, job_id=posting_id)
+                for key, posting_id in listed.items()
+                if key not in entry['active'] and key not in entry['inactive']
+            ]
+            summary['new_urls'].extend(new_urls)
+            company_id = min(entry['company_ids']) if entry['company_ids'] else None
+            summary['new_by_company'].setdefault(company_id, []).extend(new_urls)
+
+        await asyncio.to_thread(self._apply, missing_ids, reappeared_ids, synced_companies)
+        summary['deactivated'] = len(missing_ids)
+        summary['reactivated'] = len(reappeared_ids)
+
+        logger.info(
+            f"📊 Listados: {summary['boards']} boards, {summary['listed']} ofertas publicadas, "
+            f"{summary['deactivated']} desactivadas, {summary['reactivated']} reactivadas, "
+            f"{len(summary['new_urls'])} nuevas, {summary['failed']} fallidos"
+        )
+        return summary
+
+    def _apply(self, missing_ids: List[int], reappeared_ids: List[int], company_ids: Set[int]):
+        """
+        Escribe el diff en una transacción / Skribas la diferencon en unu transakcio
+        """
+        now = datetime.utcnow()
+        company_ids = list(company_ids)
+        with get_db() as db:
+            # Trozos para no superar el límite de parámetros / Pecoj por ne superi la parametran limon
+            for start in range(0, len(missing_ids), _UPDATE_CHUNK):
+                db.execute(
+                    update(Job).where(Job.id.in_(missing_ids[start:start + _UPDATE_CHUNK]))
+                    .values(is_active=False, last_verified=now, updated_at=now)
+                )
+            for start in range(0, len(reappeared_ids), _UPDATE_CHUNK):
+                db.execute(
+                    update(Job).where(Job.id.in_(reappeared_ids[start:start + _UPDATE_CHUNK]))
+                    .values(is_active=True, last_verified=now, updated_at=now)
+                )
+            for start in range(0, len(company_ids), _UPDATE_CHUNK):
+                db.execute(
+                    update(Company).where(Company.id.in_(company_ids[start:start + _UPDATE_CHUNK]))
+                    .values(last_scraped_at=now)
+                )
+            db.commit()
+
+    async def close(self):
+        """Cierra el pool de conexiones / Fermas la konektan aron"""
+        if self._owns_client:
+            await self.client.aclose()
+
+
+async def main():
+    """
+    Sincroniza los boards, encola las ofertas nuevas y consume la frontera
+    Sinkronigas la tabulojn, envicigas la novajn ofertojn kaj konsumas la limon
+    """
+    from src.scraper_engine import LabortroviloScraper
+    from src.frontier import CrawlFrontier
+
+    scraper = LabortroviloScraper()
+    crawler = BoardListingCrawler(client=scraper.http_client, rate_limiter=scraper.rate_limiter)
+    frontier = CrawlFrontier()
+    try:
+        summary = await crawler.run()
+        for company_id, urls in summary['new_by_company'].items():
+            await asyncio.to_thread(frontier.enqueue, urls, 'listing', company_id)
+        if summary['new_urls']:
+            await scraper.initialize()
+            await scraper.scrape_frontier(frontier)
+    finally:
+        await scraper.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
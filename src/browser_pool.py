@@ -0,0 +1,239 @@
+"""
+Reciclaje de Contextos del Navegador / Reciklado de Retumilaj Kuntekstoj
+Senior Data Engineer Architecture - Bounded browser memory
+
+Un lote largo reutiliza la misma página y el mismo contexto para cada URL, y la
+memoria del renderer crece con cada sitio visitado. El ContextRecycler cuenta
+las navegaciones de cada página de worker y muestrea la RSS del proceso
+(Python + driver + Chromium); al superar CONTEXT_MAX_NAVIGATIONS o
+CONTEXT_MAX_RSS_MB el worker cambia a un contexto de reserva ya creado, así que
+reciclar no añade latencia. Los contextos de los workers se devuelven a un pool
+caliente entre lotes en lugar de cerrarse.
+
+La RSS es la de todo el árbol de procesos, compartida por todos los workers:
+cada superación recicla un solo contexto (el de más navegaciones) y abre una
+pausa de CONTEXT_RSS_COOLDOWN_SECONDS para que la memoria baje antes de volver
+a medir. Conectado a un navegador compartido (src/browser_server.py) Chromium
+no es descendiente de este proceso, así que el límite de RSS no se aplica y
+solo cuenta CONTEXT_MAX_NAVIGATIONS.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Optional, Dict, List, Tuple, Callable, Awaitable
+
+from playwright.async_api import BrowserContext, Page
+
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+# Argumentos de Chromium (navegador propio y servidor compartido)
+# Argumentoj de Chromium (propra retumilo kaj komuna servilo)
+CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox'
+]
+
+
+def process_tree_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """
+    RSS total de un proceso y sus descendientes (el navegador lanzado)
+    Tuta RSS de procezo kaj ĝiaj idoj (la lanĉita retumilo)
+
+    Lee /proc (Linux); devuelve None si no está disponible, y entonces solo
+    se aplica el límite de navegaciones.
+    """
+    root_pid = root_pid or os.getpid()
+    try:
+        entries = os.listdir('/proc')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    children: Dict[int, list] = {}
+    rss_pages: Dict[int, int] = {}
+    for name in entries:
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Campos tras "(comm)": estado, ppid, ..., rss (campo 24) / Kampoj post "(comm)"
+        fields = stat[stat.rfind(')') + 2:].split()
+        pid = int(name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss_pages[pid] = int(fields[21])
+
+    if root_pid not in rss_pages:
+        return None
+
+    total, pending = 0, [root_pid]
+    while pending:
+        pid = pending.pop()
+        total += rss_pages.get(pid, 0)
+        pending.extend(children.get(pid, ()))
+    return round(total * page_size / _MB, 1)
+
+
+class ContextRecycler:
+    """
+    Decide cuándo reciclar el contexto de un worker, mantiene uno de reserva
+    y un pool de contextos calientes para los workers
+    Decidas kiam recikli la kuntekston de laboristo, tenas rezervan kaj aron
+    de varmaj kuntekstoj por la laboristoj
+
+    Uso / Uzo / Usage:
+        recycler = ContextRecycler(scraper._new_context)
+        recycler.prewarm()
+        context, page = await recycler.acquire()
+        recycler.record_navigation(page)
+        if recycler.due(page, stats):
+            context, page = await recycler.replacement()
+        recycler.release(context, page)
+    """
+
+    def __init__(
+        self,
+        new_context: Callable[[], Awaitable[Tuple[BrowserContext, Page]]],
+        max_navigations: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        sample_every: Optional[int] = None,
+        warm_spare: Optional[bool] = None,
+        rss_cooldown: Optional[float] = None
+    ):
+        """
+        Args:
+            new_context: Fábrica de (contexto, página)
+            max_navigations: Navegaciones por contexto (0 = sin límite)
+            max_rss_mb: Umbral de RSS del proceso en MB (0 = sin límite)
+            sample_every: Navegaciones del worker entre muestras de RSS
+            warm_spare: Mantener un contexto de reserva ya creado
+            rss_cooldown: Segundos sin reciclar por RSS tras un reciclaje por RSS
+        """
+        self._new_context = new_context
+        self.max_navigations = settings.CONTEXT_MAX_NAVIGATIONS if max_navigations is None else max_navigations
+        self.max_rss_mb = settings.CONTEXT_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.sample_every = max(1, sample_every or settings.CONTEXT_RSS_SAMPLE_EVERY)
+        self.warm_spare = settings.CONTEXT_WARM_SPARE if warm_spare is None else warm_spare
+        self.rss_cooldown = settings.CONTEXT_RSS_COOLDOWN_SECONDS if rss_cooldown is None else rss_cooldown
+        # Con navegador remoto la RSS local no incluye Chromium / Kun fora retumilo
+        self.remote_browser = False
+        self.navigations: Dict[Page, int] = {}
+        self._rss_victim: Optional[Page] = None
+        self._rss_quiet_until = 0.0
+        self._spare: Optional[asyncio.Task] = None
+        self._idle: List[Tuple[BrowserContext, Page]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_navigations or self.max_rss_mb)
+
+    def prewarm(self):
+        """Crea el contexto de reserva en segundo plano / Kreas la rezervan kuntekston fone"""
+        if self.enabled and self.warm_spare and self._spare is None:
+            self._spare = asyncio.create_task(self._new_context())
+
+    def record_navigation(self, page: Page):
+        """Cuenta una navegación de la página / Kalkulas navigadon de la paĝo"""
+        self.navigations[page] = self.navigations.get(page, 0) + 1
+
+    def due(self, page: Page, stats=None) -> Optional[str]:
+        """
+        Motivo para reciclar el contexto de la página, o None
+        Kialo por recikli la kuntekston de la paĝo, aŭ None
+
+        La RSS se muestrea cada sample_every navegaciones del worker y el pico
+        queda en stats.max_rss_mb. Al superar max_rss_mb se elige un único
+        contexto (el de más navegaciones entre los que están en uso), que se
+        recicla en su siguiente llamada.
+        """
+        count = self.navigations.get(page, 0)
+        if not count:
+            return None
+        if self.max_navigations and count >= self.max_navigations:
+            return 'navigations'
+        if page is self._rss_victim:
+            self._rss_victim = None
+            return 'rss'
+        if self.remote_browser or count % self.sample_every:
+            return None
+
+        rss = process_tree_rss_mb()
+        if rss is None:
+            return None
+        if stats is not None:
+            stats.max_rss_mb = max(stats.max_rss_mb, rss)
+        if not self.max_rss_mb or rss < self.max_rss_mb:
+            return None
+
+        # Un reciclaje por superación y luego pausa / Unu reciklado po superado, poste paŭzo
+        now = time.monotonic()
+        if self._rss_victim is not None or now < self._rss_quiet_until:
+            return None
+        idle = {idle_page for _, idle_page in self._idle}
+        busy = {busy_page: n for busy_page, n in self.navigations.items() if busy_page not in idle}
+        self._rss_quiet_until = now + self.rss_cooldown
+        victim = max(busy, key=busy.get) if busy else page
+        if victim is page:
+            return 'rss'
+        self._rss_victim = victim
+        return None
+
+    async def replacement(self) -> Tuple[BrowserContext, Page]:
+        """
+        Entrega la reserva (o crea un contexto) y prepara la siguiente
+        Liveras la rezervon (aŭ kreas kuntekston) kaj preparas la sekvan
+        """
+        spare, self._spare = self._spare, None
+        fresh = await spare if spare is not None else await self._new_context()
+        self.prewarm()
+        return fresh
+
+    async def fill(self, size: int):
+        """Precrea contextos hasta tener size libres / Antaŭkreas kuntekstojn ĝis size liberaj"""
+        missing = size - len(self._idle)
+        if missing > 0:
+            self._idle.extend(await asyncio.gather(*(self._new_context() for _ in range(missing))))
+
+    async def acquire(self) -> Tuple[BrowserContext, Page]:
+        """Contexto del pool (o uno nuevo) para un worker / Kunteksto el la aro por laboristo"""
+        if self._idle:
+            return self._idle.pop()
+        return await self._new_context()
+
+    def release(self, context: BrowserContext, page: Page):
+        """Devuelve el contexto de un worker al pool / Redonas la kuntekston al la aro"""
+        self._idle.append((context, page))
+        if page is self._rss_victim:
+            self._rss_victim = None
+
+    def forget(self, page: Page):
+        """Olvida el contador de una página cerrada / Forgesas la nombrilon de fermita paĝo"""
+        self.navigations.pop(page, None)
+        if page is self._rss_victim:
+            self._rss_victim = None
+
+    async def close(self):
+        """Cierra la reserva y los contextos libres / Fermas la rezervon kaj la liberajn kuntekstojn"""
+        spare, self._spare = self._spare, None
+        idle, self._idle = self._idle, []
+        if spare is not None:
+            try:
+                idle.append(await spare)
+            except Exception as e:
+                logger.warning(f"⚠️ Error creando contexto de reserva: {e}")
+        for context, page in idle:
+            self.forget(page)
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Error cerrando contexto libre: {e}")
@@ -0,0 +1,178 @@
+"""
+Servidor de Navegador Compartido / Komuna Retumila Servilo
+Senior Data Engineer Architecture - Long-lived shared browser service
+
+Cada ejecución del scheduler (y cada scrape lanzado desde admin) arrancaba un
+Chromium nuevo. Este servicio mantiene un único Chromium vivo expuesto por el
+protocolo remoto de Playwright (playwright launch-server); los scrapers se
+conectan con chromium.connect() y solo crean sus contextos, que además quedan
+en el pool caliente del ContextRecycler. Si el servicio no está disponible el
+scraper lanza su propio navegador como antes.
+
+Uso / Uzo / Usage:
+    python -m src.browser_server        # servicio (lo arranca el scheduler si BROWSER_SERVER_ENABLED)
+"""
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+from typing import Optional
+
+from src.browser_pool import CHROMIUM_ARGS
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Tiempo máximo para que el servidor publique su endpoint / Maksimuma tempo por publikigi la finpunkton
+_STARTUP_TIMEOUT = 60.0
+# Espera antes de relanzar un servidor caído / Atendo antaŭ relanĉi falintan servilon
+_RESTART_DELAY = 5.0
+
+
+def resolve_browser_endpoint() -> Optional[str]:
+    """
+    Endpoint ws:// del navegador compartido, si hay uno configurado o publicado
+    Finpunkto ws:// de la komuna retumilo, se iu estas agordita aŭ publikigita
+    """
+    if settings.BROWSER_WS_ENDPOINT:
+        return settings.BROWSER_WS_ENDPOINT
+    try:
+        with open(settings.BROWSER_SERVER_ENDPOINT_FILE, encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+class BrowserServer:
+    """
+    Mantiene vivo un Chromium accesible por el protocolo remoto de Playwright
+    Tenas vivan Chromium atingeblan per la fora protokolo de Playwright
+
+    Uso / Uzo / Usage:
+        server = BrowserServer()
+        endpoint = await server.start()   # ws://127.0.0.1:9323/labortrovilo
+        await server.serve_forever()      # relanza si el navegador muere
+    """
+
+    def __init__(self, port: Optional[int] = None, headless: bool = True):
+        """
+        Args:
+            port: Puerto del servidor (por defecto BROWSER_SERVER_PORT)
+            headless: Ejecutar navegador sin interfaz gráfica
+        """
+        self.port = port or settings.BROWSER_SERVER_PORT
+        self.headless = headless
+        self.endpoint: Optional[str] = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._config_path: Optional[str] = None
+        self._stopping = False
+
+    def _write_config(self) -> str:
+        # Opciones de launchServer / Opcioj de launchServer
+        config = {
+            'headless': self.headless,
+            'args': CHROMIUM_ARGS,
+            'port': self.port,
+            'host': settings.BROWSER_SERVER_HOST,
+            'wsPath': '/labortrovilo',
+        }
+        fd, path = tempfile.mkstemp(prefix='labortrovilo-browser-', suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        return path
+
+    async def start(self) -> str:
+        """
+        Lanza el servidor y publica su endpoint en BROWSER_SERVER_ENDPOINT_FILE
+        Lanĉas la servilon kaj publikigas ĝian finpunkton
+
+        Returns:
+            Endpoint ws:// para chromium.connect()
+        """
+        self._config_path = self._config_path or self._write_config()
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable, '-m', 'playwright', 'launch-server',
+            '--browser', 'chromium', '--config', self._config_path,
+            stdout=asyncio.subprocess.PIPE,
+        )
+
+        # La primera línea de stdout es el endpoint / La unua linio de stdout estas la finpunkto
+        line = await asyncio.wait_for(self._process.stdout.readline(), _STARTUP_TIMEOUT)
+        endpoint = line.decode('utf-8').strip()
+        if not endpoint.startswith('ws'):
+            await self.stop()
+            raise RuntimeError(f"El servidor de navegador no publicó un endpoint: {endpoint!r}")
+
+        self.endpoint = endpoint
+        os.makedirs(os.path.dirname(settings.BROWSER_SERVER_ENDPOINT_FILE) or '.', exist_ok=True)
+        with open(settings.BROWSER_SERVER_ENDPOINT_FILE, 'w', encoding='utf-8') as f:
+            f.write(endpoint)
+
+        logger.info(f"🌐 Navegador compartido escuchando en {endpoint}")
+        return endpoint
+
+    async def serve_forever(self):
+        """
+        Espera al servidor y lo relanza si termina inesperadamente
+        Atendas la servilon kaj relanĉas ĝin se ĝi neatendite finiĝas
+        """
+        while not self._stopping:
+            if self._process is None:
+                await self.start()
+            returncode = await self._process.wait()
+            self._process = None
+            if self._stopping:
+                break
+            logger.warning(f"⚠️ Navegador compartido terminó (código {returncode}), relanzando...")
+            await asyncio.sleep(_RESTART_DELAY)
+
+    async def stop(self):
+        """Detiene el servidor y retira el endpoint / Haltigas la servilon kaj forigas la finpunkton"""
+        self._stopping = True
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
+            try:
+                await asyncio.wait_for(self._process.wait(), 10)
+            except asyncio.TimeoutError:
+                self._process.kill()
+        self._process = None
+
+        for path in (settings.BROWSER_SERVER_ENDPOINT_FILE, self._config_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+        logger.info("✓ Navegador compartido detenido")
+
+
+async def main():
+    """
+    Ejecuta el servicio hasta recibir una señal de parada
+    Rulas la servon ĝis halta signalo
+    """
+    server = BrowserServer()
+    # SIGTERM del scheduler: cancelar para pasar por stop() / SIGTERM de la planilo: nuligi por pasi tra stop()
+    loop, task = asyncio.get_running_loop(), asyncio.current_task()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, task.cancel)
+        except NotImplementedError:
+            pass
+    try:
+        await server.start()
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    try:
+        asyncio.run(main())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
@@ -0,0 +1,162 @@
+"""
+Reintentos y Circuit Breaker por Host / Reprovoj kaj Cirkvit-Rompilo po Gastiganto
+Senior Data Engineer Architecture - Retry policy and per-host circuit breaker
+
+Un host caído o que bloquea costaba el PLAYWRIGHT_TIMEOUT completo en cada una
+de sus URLs. Los errores transitorios (timeouts, conexión, 429, 5xx) se
+reintentan hasta MAX_RETRIES veces con espera exponencial desde RETRY_DELAY y
+jitter; tras CIRCUIT_FAILURE_THRESHOLD fallos seguidos el circuito del host se
+abre, sus URLs se aparcan en la frontera y el crawl sigue con los hosts sanos.
+Pasado CIRCUIT_OPEN_SECONDS se deja pasar una sola petición de prueba
+(semiabierto); el resto de workers sigue aparcando hasta que la prueba informe.
+"""
+import logging
+import random
+import time
+from typing import Dict, Optional
+
+from src.rate_limiter import HostRateLimiter
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Estados del circuito / Statoj de la cirkvito
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+# Respuestas HTTP que vale la pena reintentar / HTTP-respondoj reprovindaj
+TRANSIENT_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+def retry_delay(attempt: int, base: Optional[float] = None) -> float:
+    """
+    Espera antes del reintento número attempt (0 = primero): exponencial con jitter
+    Atendo antaŭ la reprovo numero attempt: eksponenta kun hazardo
+
+    La mitad de la espera es fija y la otra mitad aleatoria, para que los
+    workers que fallan a la vez no reintenten a la vez.
+    """
+    delay = (settings.RETRY_DELAY if base is None else base) * (2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def is_transient_status(status: int) -> bool:
+    """¿Respuesta HTTP transitoria? / Ĉu pasema HTTP-respondo?"""
+    return status in TRANSIENT_STATUS
+
+
+class _HostCircuit:
+    """Estado del circuito de un host / Stato de la cirkvito de gastiganto"""
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None  # Prueba semiabierta en vuelo
+
+
+class HostCircuitBreaker:
+    """
+    Circuit breaker por host / Cirkvit-rompilo po gastiganto
+
+    Uso / Uzo / Usage:
+        breaker = HostCircuitBreaker()
+        if not breaker.allow(url): ...   # aparcar la URL (reserva la prueba si está semiabierto)
+        breaker.record_failure(url)      # timeout, conexión, 429, 5xx
+        breaker.record_success(url)      # el host respondió
+        if breaker.is_open(url): ...     # dejar de reintentar
+    """
+
+    def __init__(self, failure_threshold: Optional[int] = None, open_seconds: Optional[float] = None):
+        """
+        Args:
+            failure_threshold: Fallos consecutivos que abren el circuito
+            open_seconds: Segundos que el circuito permanece abierto
+        """
+        self.failure_threshold = max(1, failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD)
+        self.open_seconds = settings.CIRCUIT_OPEN_SECONDS if open_seconds is None else open_seconds
+        self._circuits: Dict[str, _HostCircuit] = {}
+
+    def state(self, url: str) -> str:
+        """Estado actual del circuito del host / Nuna stato de la cirkvito"""
+        circuit = self._circuits.get(HostRateLimiter.host_for(url))
+        if circuit is None or circuit.failures < self.failure_threshold:
+            return CLOSED
+        if time.monotonic() - circuit.opened_at < self.open_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self, url: str) -> bool:
+        """
+        ¿Se puede enviar una petición al host? / Ĉu eblas sendi peton al la gastiganto?
+
+        En semiabierto solo el primer llamador pasa (la prueba); los demás
+        reciben False hasta que la prueba llame a record_success/record_failure,
+        o hasta que pase open_seconds sin respuesta (prueba perdida).
+        """
+        state = self.state(url)
+        if state != HALF_OPEN:
+            return state == CLOSED
+        circuit = self._circuits[HostRateLimiter.host_for(url)]
+        now = time.monotonic()
+        if circuit.probe_started_at is not None and now - circuit.probe_started_at < self.open_seconds:
+            return False
+        circuit.probe_started_at = now
+        logger.info(f"🟡 Prueba de circuito semiabierto para {HostRateLimiter.host_for(url)}")
+        return True
+
+    def is_open(self, url: str) -> bool:
+        """¿Circuito abierto? No reserva la prueba / Ĉu malfermita cirkvito? Ne rezervas la provon"""
+        return self.state(url) == OPEN
+
+    def record_success(self, url: str):
+        """El host respondió: cierra el circuito / La gastiganto respondis: fermas la cirkviton"""
+        circuit = self._circuits.get(HostRateLimiter.host_for(url))
+        if circuit is None:
+            return
+        circuit.probe_started_at = None
+        if not circuit.failures:
+            return
+        if circuit.failures >= self.failure_threshold:
+            logger.info(f"🟢 Circuito cerrado para {HostRateLimiter.host_for(url)}")
+        circuit.failures = 0
+
+    def record_failure(self, url: str) -> bool:
+        """
+        Registra un fallo transitorio / Registras pasemaj eraron
+
+        Returns:
+            True si este fallo abrió (o reabrió) el circuito
+        """
+        host = HostRateLimiter.host_for(url)
+        circuit = self._circuits.setdefault(host, _HostCircuit())
+        was_half_open = self.state(url) == HALF_OPEN
+        circuit.failures += 1
+        circuit.probe_started_at = None
+        if circuit.failures == self.failure_threshold or was_half_open:
+            circuit.opened_at = time.monotonic()
+            logger.warning(
+                f"🔴 Circuito abierto para {host} tras {circuit.failures} fallos seguidos "
+                f"({self.open_seconds:.0f}s)"
+            )
+            return True
+        return False
+
+    def retry_after(self, url: str) -> float:
+        """Segundos hasta que el host admita una prueba / Sekundoj ĝis la gastiganto akceptos provon"""
+        circuit = self._circuits.get(HostRateLimiter.host_for(url))
+        if circuit is None or circuit.failures < self.failure_threshold:
+            return 0.0
+        now = time.monotonic()
+        if circuit.probe_started_at is not None and now - circuit.opened_at >= self.open_seconds:
+            # Semiabierto con una prueba en vuelo / Duonmalfermita kun provo en flugo
+            return max(0.0, self.open_seconds - (now - circuit.probe_started_at))
+        return max(0.0, self.open_seconds - (now - circuit.opened_at))
+
+    def open_hosts(self) -> Dict[str, float]:
+        """Hosts con el circuito abierto y segundos restantes / Gastigantoj kun malfermita cirkvito"""
+        now = time.monotonic()
+        return {
+            host: self.open_seconds - (now - circuit.opened_at)
+            for host, circuit in self._circuits.items()
+            if circuit.failures >= self.failure_threshold and now - circuit.opened_at < self.open_seconds
+        }
@@ -2,12 +2,13 @@
 Configuración de Base de Datos / Datumbaza Agordado
 Senior Data Engineer Architecture - Database Layer
 """
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, List
 import logging
 
 from config import settings
@@ -17,6 +18,18 @@ from src.models import Base
 logger = logging.getLogger(__name__)
 
 
+def _is_memory_sqlite(database_url: str) -> bool:
+    """
+    SQLite en memoria ('sqlite://', ':memory:', 'mode=memory')
+    SQLite en memoro / In-memory SQLite
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != 'sqlite':
+        return False
+    database = url.database or ''
+    return database in ('', ':memory:') or url.query.get('mode') == 'memory' or 'mode=memory' in database
+
+
 # Crear motor de base de datos / Krei datumbazan motoron / Create database engine
 def create_db_engine():
     """
@@ -37,8 +50,10 @@ def create_db_engine():
         echo=settings.DEBUG_SQL,  # Mostrar queries SQL si está en debug / Montri SQL-demandojn se en sencimiga reĝimo
         pool_pre_ping=True,  # Verificar conexiones antes de usarlas / Kontroli konektojn antaŭ uzi
         connect_args=connect_args,
-        # Para SQLite, usar StaticPool en desarrollo / Por SQLite, uzi StaticPool en evoluigo
-        poolclass=StaticPool if "sqlite" in settings.DATABASE_URL else None
+        # StaticPool solo para SQLite en memoria: con archivo, cada hilo/proceso escritor
+        # necesita su propia conexión para no mezclar transacciones
+        # StaticPool nur por SQLite en memoro / StaticPool only for in-memory SQLite
+        poolclass=StaticPool if _is_memory_sqlite(settings.DATABASE_URL) else None
     )
     
     # Habilitar foreign keys para SQLite / Ebligi fremdajn ŝlosilojn por SQLite
@@ -65,6 +80,52 @@ SessionLocal = sessionmaker(
 )
 
 
+def add_missing_columns(bind=None) -> List[str]:
+    """
+    Añade a las tablas existentes las columnas nuevas del modelo (idempotente)
+    Aldonas al ekzistantaj tabeloj la novajn kolumnojn de la modelo
+    Adds model columns missing from existing tables
+
+    create_all no altera tablas ya creadas: sin este paso, una base de datos
+    anterior falla con "no such column" en cualquier select(Job). Las
+    columnas NOT NULL usan su default escalar como DEFAULT del ALTER TABLE.
+
+    Returns:
+        Columnas añadidas como "tabla.columna"
+    """
+    bind = bind or engine
+    added: List[str] = []
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            missing = [column for column in table.columns if column.name not in existing]
+            for column in missing:
+                column_type = column.type.compile(dialect=connection.dialect)
+                ddl = f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+                default = column.default.arg if column.default is not None and column.default.is_scalar else None
+                if default is not None:
+                    ddl += f' DEFAULT {int(default) if isinstance(default, bool) else repr(default)}'
+                if not column.nullable and default is not None:
+                    ddl += ' NOT NULL'
+                connection.execute(text(ddl))
+                added.append(f"{table.name}.{column.name}")
+
+            # Índices de las columnas añadidas / Indeksoj de la aldonitaj kolumnoj
+            names = {column.name for column in missing}
+            for index in table.indexes:
+                if names & {column.name for column in index.columns}:
+                    index.create(connection, checkfirst=True)
+
+    if added:
+        logger.info(f"🧱 Columnas añadidas a tablas existentes: {', '.join(added)}")
+    return added
+
+
 def init_db():
     """
     Inicializa la base de datos creando todas las tablas
@@ -76,11 +137,11 @@ def init_db():
         
         # Crear todas las tablas / Krei ĉiujn tabelojn
         Base.metadata.create_all(bind=engine)
+        add_missing_columns(engine)
         
         logger.info("✓ Base de datos inicializada correctamente / Database initialized successfully")
         
         # Verificar tablas creadas / Kontroli kreitajn tabelojn
-        from sqlalchemy import inspect
         inspector = inspect(engine)
         tables = inspector.get_table_names()
         logger.info(f"Tablas creadas: {', '.join(tables)}")
@@ -0,0 +1,357 @@
+"""
+Descubrimiento de Ofertas / Malkovro de Ofertoj
+Senior Data Engineer Architecture - Streaming posting discovery
+
+Las URLs de oferta solo llegaban a mano (argumentos o frontera) o como IDs
+nuevos de boards ya conocidos. Aquí se descubren recorriendo tres tipos de
+semilla:
+
+- índices de board de un ATS (JSON público, ver src/board_listing.py)
+- sitemaps XML, incluidos índices de sitemaps y .xml.gz
+- páginas de listado HTML, siguiendo la paginación (rel="next" / "Siguiente")
+
+Las URLs de oferta se entregan canónicas y sin repetir como generador
+asíncrono, así el pool del scraper (scrape_stream) empieza a extraer mientras
+el descubrimiento sigue.
+
+Uso / Uzo / Usage:
+    python -m src.discovery [--frontier] [SEMILLA ...]
+"""
+import argparse
+import asyncio
+import gzip
+import io
+import logging
+import re
+from typing import Optional, Dict, List, Tuple, AsyncIterator
+from urllib.parse import urlparse
+
+import httpx
+import lxml.etree
+import lxml.html
+
+from src.schemas import SourcePlatform
+from src.ats_api import create_http_client
+from src.board_listing import BoardListingCrawler, POSTING_URL_TEMPLATES, resolve_board
+from src.rate_limiter import HostRateLimiter
+from src.url_canonicalizer import canonicalize
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Índice público de cada board (forma que reconoce resolve_board)
+# Publika indekso de ĉiu tabulo (formo rekonata de resolve_board)
+BOARD_URL_TEMPLATES: Dict[SourcePlatform, str] = {
+    SourcePlatform.GREENHOUSE: "https://boards.greenhouse.io/{board}",
+    SourcePlatform.LEVER: "https://jobs.lever.co/{board}",
+    SourcePlatform.SMARTRECRUITERS: "https://jobs.smartrecruiters.com/{board}",
+    SourcePlatform.WORKABLE: "https://apply.workable.com/{board}",
+}
+
+# Tipos de semilla / Specoj de semo
+SEED_BOARD = 'board'
+SEED_SITEMAP = 'sitemap'
+SEED_LISTING = 'listing'
+
+# Límite del protocolo sitemaps sin comprimir / Limo de la retejmapa protokolo
+_MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+# Texto de un enlace "página siguiente" / Teksto de ligilo "sekva paĝo"
+_NEXT_TEXT = re.compile(r'^\s*(?:next(?: page)?|siguiente|próxima|sekva|›|»|>)\s*$', re.IGNORECASE)
+
+# Fin de la producción de semillas / Fino de la semproduktado
+_DONE = object()
+
+
+def is_posting_url(url: str) -> bool:
+    """¿La URL es una oferta concreta de un ATS conocido? / Ĉu la URL estas konkreta oferto?"""
+    return canonicalize(url).external_id is not None
+
+
+def seed_kind(url: str) -> str:
+    """
+    Clasifica una semilla: índice de board, sitemap o listado HTML
+    Klasifikas semon: tabula indekso, retejmapo aŭ HTML-listo
+    """
+    if resolve_board(url):
+        return SEED_BOARD
+    path = urlparse(url).path.lower()
+    if path.endswith(('.xml', '.xml.gz')) or 'sitemap' in path:
+        return SEED_SITEMAP
+    return SEED_LISTING
+
+
+def parse_sitemap(content: bytes) -> Tuple[List[str], List[str]]:
+    """
+    Lee un sitemap o un índice de sitemaps (XML, opcionalmente gzip)
+    Legas retejmapon aŭ indekson de retejmapoj
+
+    Returns:
+        (sitemaps hijos, URLs de página)
+    """
+    if content[:2] == b'\x1f\x8b':
+        with gzip.GzipFile(fileobj=io.BytesIO(content)) as f:
+            content = f.read(_MAX_SITEMAP_BYTES)
+
+    parser = lxml.etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+    root = lxml.etree.fromstring(content, parser=parser)
+    if root is None:
+        return [], []
+
+    locations = [element.text.strip() for element in root.iter('{*}loc') if element.text]
+    if lxml.etree.QName(root).localname == 'sitemapindex':
+        return locations, []
+    return [], locations
+
+
+def parse_listing(html_text: str, base_url: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Enlaces de oferta y página siguiente de un listado HTML
+    Oferto-ligiloj kaj sekva paĝo de HTML-listo
+
+    Returns:
+        (URLs de oferta, URL de la página siguiente del mismo host o None)
+    """
+    try:
+        document = lxml.html.fromstring(html_text, base_url=base_url)
+    except (lxml.etree.ParserError, ValueError):
+        return [], None
+    document.make_links_absolute(base_url, resolve_base_href=True)
+
+    postings = [
+        anchor.get('href') for anchor in document.iter('a')
+        if anchor.get('href') and is_posting_url(anchor.get('href'))
+    ]
+
+    next_url = None
+    candidates = document.xpath('//link[@rel="next"]/@href | //a[contains(concat(" ", @rel, " "), " next ")]/@href')
+    if not candidates:
+        candidates = [
+            anchor.get('href') for anchor in document.iter('a')
+            if anchor.get('href') and (
+                _NEXT_TEXT.match(anchor.text_content() or '') or _NEXT_TEXT.match(anchor.get('aria-label') or '')
+            )
+        ]
+    # La paginación no sale del sitio / La paĝigo ne forlasas la retejon
+    for candidate in candidates:
+        if urlparse(candidate).netloc.lower() == urlparse(base_url).netloc.lower():
+            next_url = candidate
+            break
+    return postings, next_url
+
+
+class DiscoveryCrawler:
+    """
+    Descubre URLs de oferta a partir de semillas y las emite en streaming
+    Malkovras oferto-URL-ojn el semoj kaj elsendas ilin flue
+
+    Uso / Uzo / Usage:
+        crawler = DiscoveryCrawler()
+        async for url in crawler.discover(["https://boards.greenhouse.io/acme"]):
+            ...
+        await scraper.scrape_stream(crawler.discover())  # o directamente al pool
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_pages: Optional[int] = None
+    ):
+        """
+        Args:
+            client: Cliente httpx compartido (por defecto uno propio con pool)
+            rate_limiter: Limitador por host compartido (por defecto uno propio)
+            max_pages: Páginas por listado o sitemaps por semilla (por defecto DISCOVERY_MAX_PAGES)
+        """
+        self._owns_client = client is None
+        self.client = client or create_http_client()
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.max_pages = max_pages or settings.DISCOVERY_MAX_PAGES
+        self.board_listing = BoardListingCrawler(client=self.client, rate_limiter=self.rate_limiter)
+        self.summary: Dict[str, int] = {
+            'seeds': 0, 'boards': 0, 'sitemaps': 0, 'pages': 0, 'failed': 0, 'found': 0, 'yielded': 0,
+        }
+
+    def load_seeds(self) -> List[str]:
+        """
+        Semillas configuradas más los índices de los boards ya conocidos
+        Agorditaj semoj plus la indeksoj de jam konataj tabuloj
+        """
+        seeds = list(settings.DISCOVERY_SEEDS)
+        if settings.DISCOVERY_INCLUDE_KNOWN_BOARDS:
+            for platform, board in self.board_listing.load_boards():
+                template = BOARD_URL_TEMPLATES.get(platform)
+                if template:
+                    seeds.append(template.format(board=board))
+        return list(dict.fromkeys(seeds))
+
+    async def _get(self, url: str) -> Optional[httpx.Response]:
+        await self.rate_limiter.acquire(url)
+        try:
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️ Error descargando {url}: {e}")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"⚠️ {url} respondió {response.status_code}")
+            return None
+        return response
+
+    async def _walk_board(self, seed: str) -> AsyncIterator[str]:
+        platform, board = resolve_board(seed)
+        listing = await self.board_listing.fetch_listing(platform, board)
+        if listing is None:
+            self.summary['failed'] += 1
+            return
+        self.summary['boards'] += 1
+        for posting_id in listing:
+            yield POSTING_URL_TEMPLATES[platform].format(board=board, job_id=posting_id)
+
+    async def _walk_sitemap(self, seed: str) -> AsyncIterator[str]:
+        pending, visited = [seed], set()
+        while pending and len(visited) < self.max_pages:
+            url = pending.pop(0)
+            if url in visited:
+                continue
+            visited.add(url)
+
+            response = await self._get(url)
+            if response is None:
+                self.summary['failed'] += 1
+                continue
+            try:
+                children, locations = await asyncio.to_thread(parse_sitemap, response.content)
+            except (lxml.etree.XMLSyntaxError, OSError, EOFError) as e:
+                logger.warning(f"⚠️ Sitemap ilegible {url}: {e}")
+                self.summary['failed'] += 1
+                continue
+
+            self.summary['sitemaps'] += 1
+            pending.extend(children)
+            for location in locations:
+                if is_posting_url(location):
+                    yield location
+
+    async def _walk_listing(self, seed: str) -> AsyncIterator[str]:
+        url, visited = seed, set()
+        while url and url not in visited and len(visited) < self.max_pages:
+            visited.add(url)
+            response = await self._get(url)
+            if response is None:
+                self.summary['failed'] += 1
+                return
+            postings, url = await asyncio.to_thread(parse_listing, response.text, str(response.url))
+            self.summary['pages'] += 1
+            for posting in postings:
+                yield posting
+
+    async def discover(
+        self,
+        seeds: Optional[List[str]] = None,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Recorre las semillas en paralelo y emite cada oferta una sola vez
+        Trairas la semojn paralele kaj elsendas ĉiun oferton nur unufoje
+
+        Las semillas escriben en una cola acotada (DISCOVERY_QUEUE_SIZE): si el
+        consumidor va más lento, el descubrimiento espera.
+
+        Args:
+            seeds: URLs semilla (por defecto load_seeds())
+            concurrency: Semillas recorridas a la vez (por defecto SCRAPER_CONCURRENCY)
+
+        Yields:
+            URLs canónicas de oferta
+        """
+        if seeds is None:
+            seeds = await asyncio.to_thread(self.load_seeds)
+        self.summary['seeds'] += len(seeds)
+        logger.info(f"🔎 Descubriendo ofertas desde {len(seeds)} semillas...")
+
+        walkers = {SEED_BOARD: self._walk_board, SEED_SITEMAP: self._walk_sitemap, SEED_LISTING: self._walk_listing}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.DISCOVERY_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(concurrency or settings.SCRAPER_CONCURRENCY)
+
+        async def walk(seed: str):
+            async with semaphore:
+                try:
+                    async for url in walkers[seed_kind(seed)](seed):
+                        await queue.put(url)
+                except Exception as e:
+                    logger.warning(f"⚠️ Semilla {seed} abandonada: {e}")
+                    self.summary['failed'] += 1
+
+        async def produce():
+            await asyncio.gather(*(walk(seed) for seed in seeds))
+            await queue.put(_DONE)
+
+        producer = asyncio.create_task(produce())
+        emitted = set()
+        try:
+            while True:
+                url = await queue.get()
+                if url is _DONE:
+                    break
+                self.summary['found'] += 1
+                canonical = canonicalize(url).url
+                if canonical in emitted:
+                    continue
+                emitted.add(canonical)
+                self.summary['yielded'] += 1
+                yield canonical
+        finally:
+            producer.cancel()
+            logger.info(
+                f"📊 Descubrimiento: {self.summary['boards']} boards, {self.summary['sitemaps']} sitemaps, "
+                f"{self.summary['pages']} páginas de listado, {self.summary['yielded']} ofertas únicas "
+                f"({self.summary['found']} enlaces), {self.summary['failed']} fallos"
+            )
+
+    async def close(self):
+        """Cierra el pool de conexiones / Fermas la konektan aron"""
+        if self._owns_client:
+            await self.client.aclose()
+
+
+async def main(argv: Optional[List[str]] = None):
+    """
+    Descubre ofertas y las scrapea en streaming (o las encola en la frontera)
+    Malkovras ofertojn kaj skrapas ilin flue (aŭ envicigas ilin en la limon)
+    """
+    from src.database import init_db
+    from src.frontier import CrawlFrontier
+    from src.scraper_engine import LabortroviloScraper
+
+    parser = argparse.ArgumentParser(description="Labortrovilo - descubrimiento de ofertas")
+    parser.add_argument('--frontier', action='store_true',
+                        help="Encolar en la frontera (src.launcher) en vez de scrapear aquí")
+    parser.add_argument('seeds', nargs='*', help="Semillas (por defecto DISCOVERY_SEEDS y boards conocidos)")
+    args = parser.parse_args(argv)
+
+    init_db()
+    scraper = LabortroviloScraper()
+    crawler = DiscoveryCrawler(client=scraper.http_client, rate_limiter=scraper.rate_limiter)
+    urls = crawler.discover(args.seeds or None)
+    try:
+        if args.frontier:
+            frontier = CrawlFrontier()
+            batch: List[str] = []
+            async for url in urls:
+                batch.append(url)
+                if len(batch) >= settings.FRONTIER_BATCH_SIZE:
+                    await asyncio.to_thread(frontier.enqueue, batch, 'discovery')
+                    batch = []
+            if batch:
+                await asyncio.to_thread(frontier.enqueue, batch, 'discovery')
+        else:
+            await scraper.initialize()
+            await scraper.scrape_stream(urls)
+    finally:
+        await scraper.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,503 @@
+"""
+Registro de Extractores por ATS / Registro de Ekstraktiloj po ATS
+Senior Data Engineer Architecture - Per-platform extractor plugins
+
+Cada SourcePlatform puede registrar un extractor con sus propios selectores y
+lectura de JSON-LD (schema.org/JobPosting). El extractor genérico queda como
+fallback y todo se resuelve en una sola llamada page.evaluate().
+"""
+import html
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+
+import lxml.html
+from bs4 import BeautifulSoup
+
+from src.schemas import SourcePlatform
+from src.salary_parser import PERIOD_FACTORS, period_of_unit
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# SELECTORES GENÉRICOS / ĜENERALAJ ELEKTILOJ
+# ============================================================
+
+# Selectores candidatos por campo, en orden de prioridad / Kandidataj elektiloj po kampo, laŭ prioritato
+# Soporta: Work at a Startup, Greenhouse, Lever, Workday, genéricos
+GENERIC_FIELD_SELECTORS: Dict[str, Dict[str, Any]] = {
+    'title': {
+        'selectors': [
+            'h1',  # Genérico
+            '.job-title',
+            '[data-qa="job-title"]',
+            '.app-title',  # Greenhouse
+            '.posting-headline',  # Lever
+            '[data-automation-id="jobPostingHeader"]',  # Workday
+            '.job-post-title',  # Work at a Startup
+        ],
+        'min_length': 1,
+    },
+    'company': {
+        'selectors': [
+            '.company-name',
+            '[data-qa="company-name"]',
+            '.hiring-company',
+            '.company',  # Greenhouse
+            '.posting-categories-value',  # Lever
+            '[data-automation-id="jobPostingCompanyLocation"]',  # Workday
+            'a[href*="/companies/"]',  # Work at a Startup
+        ],
+        'min_length': 1,
+    },
+    'description': {
+        'selectors': [
+            '.description',
+            '.job-description',
+            'article',
+            '[data-qa="job-description"]',
+            '#content',  # Greenhouse
+            '.section-wrapper',  # Lever
+            '[data-automation-id="jobPostingDescription"]',  # Workday
+            '.job-post-content',  # Work at a Startup
+        ],
+        'min_length': 101,  # Al menos 100 caracteres
+    },
+    'location': {
+        'selectors': [
+            '.location',
+            '[data-qa="location"]',
+            '.job-location',
+            '.location-name',  # Greenhouse
+            '.posting-categories .location',  # Lever
+            '[data-automation-id="locations"]',  # Workday
+            '.job-post-location',  # Work at a Startup
+        ],
+        'min_length': 1,
+    },
+    'salary': {
+        'selectors': ['.salary', '[data-qa="salary"]', '.compensation'],
+        'min_length': 1,
+    },
+}
+
+# Evalúa JSON-LD, selectores del ATS y selectores genéricos en una sola llamada IPC.
+# Un selector sin coincidencia cuesta microsegundos en lugar de un timeout de 2-3 s.
+# Taksas JSON-LD, ATS-elektilojn kaj ĝeneralajn elektilojn per unu IPC-voko.
+EXTRACT_FIELDS_JS = """
+(spec) => {
+    const pickAll = (fields) => {
+        const result = {};
+        for (const [name, field] of Object.entries(fields || {})) {
+            result[name] = null;
+            for (const selector of field.selectors) {
+                let element = null;
+                try {
+                    element = document.querySelector(selector);
+                } catch (e) {
+                    continue;  // Selector inválido: probar el siguiente
+                }
+                if (!element) continue;
+                const text = (element.textContent || '').trim();
+                if (text.length >= field.min_length) {
+                    result[name] = text;
+                    break;
+                }
+            }
+        }
+        return result;
+    };
+
+    const postings = [];
+    const collect = (node) => {
+        if (!node || typeof node !== 'object') return;
+        if (Array.isArray(node)) { node.forEach(collect); return; }
+        const type = node['@type'];
+        if (type === 'JobPosting' || (Array.isArray(type) && type.includes('JobPosting'))) {
+            postings.push(node);
+        }
+        if (node['@graph']) collect(node['@graph']);
+    };
+    if (spec.json_ld) {
+        for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+            try {
+                collect(JSON.parse(script.textContent));
+            } catch (e) {
+                continue;  // JSON-LD malformado
+            }
+        }
+    }
+
+    return {
+        json_ld: postings,
+        fields: pickAll(spec.fields),
+        fallback: pickAll(spec.fallback),
+    };
+}
+"""
+
+
+def evaluate_html(html_text: str, spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Equivalente de EXTRACT_FIELDS_JS sobre HTML estático (lxml + selectores CSS)
+    Ekvivalento de EXTRACT_FIELDS_JS super statika HTML (lxml + CSS-elektiloj)
+
+    Devuelve la misma estructura que la evaluación en página, así que
+    JobExtractor.merge_fields() sirve para ambos casos.
+    """
+    soup = BeautifulSoup(html_text, 'lxml')
+
+    def pick_all(fields: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, Optional[str]]:
+        result: Dict[str, Optional[str]] = {}
+        for name, field in (fields or {}).items():
+            result[name] = None
+            for selector in field['selectors']:
+                try:
+                    element = soup.select_one(selector)
+                except Exception:
+                    continue  # Selector inválido: probar el siguiente
+                if element is None:
+                    continue
+                text = element.get_text().strip()
+                if len(text) >= field['min_length']:
+                    result[name] = text
+                    break
+        return result
+
+    postings: List[Dict[str, Any]] = []
+
+    def collect(node: Any):
+        if isinstance(node, list):
+            for item in node:
+                collect(item)
+            return
+        if not isinstance(node, dict):
+            return
+        node_type = node.get('@type')
+        if node_type == 'JobPosting' or (isinstance(node_type, list) and 'JobPosting' in node_type):
+            postings.append(node)
+        if '@graph' in node:
+            collect(node['@graph'])
+
+    if spec.get('json_ld'):
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                collect(json.loads(script.string or ''))
+            except ValueError:
+                continue  # JSON-LD malformado
+
+    return {
+        'json_ld': postings,
+        'fields': pick_all(spec.get('fields')),
+        'fallback': pick_all(spec.get('fallback')),
+    }
+
+
+# ============================================================
+# JSON-LD (schema.org/JobPosting)
+# ============================================================
+
+def html_to_text(value: Optional[str]) -> Optional[str]:
+    """
+    Convierte HTML (posiblemente escapado) a texto plano
+    Konvertas HTML (eble eskapitan) al plata teksto
+    """
+    if not value:
+        return None
+
+    # Greenhouse y otros escapan el HTML dentro del JSON-LD
+    if '&lt;' in value or '&gt;' in value:
+        value = html.unescape(value)
+
+    if '<' in value:
+        try:
+            value = lxml.html.fromstring(value).text_content()
+        except Exception:
+            pass
+
+    value = ' '.join(value.split())
+    return value or None
+
+
+def parse_iso_date(value: Optional[str]) -> Optional[datetime]:
+    """Parsea fechas ISO-8601 a UTC naive / Analizas ISO-8601-datojn al naiva UTC"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _format_location(job_location: Any) -> Optional[str]:
+    """Formatea jobLocation de schema.org / Formatas jobLocation de schema.org"""
+    locations = job_location if isinstance(job_location, list) else [job_location]
+    parts: List[str] = []
+    for location in locations:
+        if not isinstance(location, dict):
+            continue
+        address = location.get('address') or {}
+        if isinstance(address, str):
+            text = address
+        else:
+            country = address.get('addressCountry')
+            if isinstance(country, dict):
+                country = country.get('name')
+            text = ', '.join(
+                str(part) for part in (
+                    address.get('addressLocality'),
+                    address.get('addressRegion'),
+                    country,
+                ) if part
+            )
+        if text and text not in parts:
+            parts.append(text)
+    # Job.location admite 200 caracteres / Job.location akceptas 200 signojn
+    return '; '.join(parts)[:200] or None
+
+
+def parse_job_posting_ld(posting: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normaliza un objeto JSON-LD JobPosting a los campos del scraper
+    Normaligas JSON-LD JobPosting-objekton al la kampoj de la skrapilo
+
+    Returns:
+        Dict con title, company, description, location, salary,
+        salary_min, salary_max, salary_currency, posted_date, is_remote
+    """
+    fields: Dict[str, Any] = {}
+
+    title = posting.get('title')
+    fields['title'] = title.strip() if isinstance(title, str) and title.strip() else None
+
+    organization = posting.get('hiringOrganization')
+    if isinstance(organization, dict):
+        organization = organization.get('name')
+    fields['company'] = organization.strip() if isinstance(organization, str) and organization.strip() else None
+
+    fields['description'] = html_to_text(posting.get('description'))
+    fields['location'] = _format_location(posting.get('jobLocation'))
+    fields['posted_date'] = parse_iso_date(posting.get('datePosted'))
+
+    location_type = str(posting.get('jobLocationType') or '').upper()
+    fields['is_remote'] = True if location_type == 'TELECOMMUTE' else None
+    if fields['is_remote'] and not fields['location']:
+        fields['location'] = 'Remote'
+
+    # Salario estructurado / Strukturita salajro
+    fields['salary'] = None
+    fields['salary_min'] = None
+    fields['salary_max'] = None
+    fields['salary_currency'] = None
+    base_salary = posting.get('baseSalary')
+    if isinstance(base_salary, dict):
+        value = base_salary.get('value')
+        currency = base_salary.get('currency')
+        unit = None
+        low = high = None
+        if isinstance(value, dict):
+            low = value.get('minValue', value.get('value'))
+            high = value.get('maxValue', low)
+            unit = value.get('unitText')
+        elif isinstance(value, (int, float, str)):
+            low = high = value
+        try:
+            low = float(low) if low is not None else None
+            high = float(high) if high is not None else None
+        except (TypeError, ValueError):
+            low = high = None
+
+        if low is not None:
+            # unitText HOUR/MONTH/YEAR: anualizado como en src/salary_parser.py
+            factor = PERIOD_FACTORS[period_of_unit(unit) or 'year']
+            fields['salary_min'] = low * factor
+            fields['salary_max'] = (high if high is not None else low) * factor
+            fields['salary_currency'] = currency or None
+            amount = f"{low:,.0f}" if low == high else f"{low:,.0f} - {high:,.0f}"
+            fields['salary'] = ' '.join(
+                part for part in (currency, amount, f"/{unit.lower()}" if unit else None) if part
+            )
+
+    return fields
+
+
+# ============================================================
+# EXTRACTORES / EKSTRAKTILOJ
+# ============================================================
+
+class JobExtractor:
+    """
+    Extractor de ofertas para una plataforma ATS
+    Ekstraktilo de ofertoj por ATS-platformo
+
+    Resuelve cada campo en orden: JSON-LD → selectores del ATS → selectores genéricos.
+    Para lógica especial basta con heredar y sobrescribir merge_fields().
+    """
+
+    def __init__(
+        self,
+        platform: SourcePlatform,
+        field_selectors: Optional[Dict[str, Dict[str, Any]]] = None,
+        use_json_ld: bool = True,
+        ready_selector: Optional[str] = None
+    ):
+        """
+        Args:
+            platform: Plataforma ATS del extractor
+            field_selectors: Selectores propios por campo
+            use_json_ld: Leer schema.org/JobPosting embebido
+            ready_selector: Selector que indica que el contenido ya está en el DOM
+                (por defecto, los selectores de descripción del ATS)
+        """
+        self.platform = platform
+        self.field_selectors = field_selectors or {}
+        self.use_json_ld = use_json_ld
+        if ready_selector is None and 'description' in self.field_selectors:
+            ready_selector = ', '.join(self.field_selectors['description']['selectors'])
+        self.ready_selector = ready_selector
+
+    @property
+    def name(self) -> str:
+        """Nombre del extractor / Nomo de la ekstraktilo"""
+        return self.platform.value
+
+    def build_spec(self) -> Dict[str, Any]:
+        """Parámetros para EXTRACT_FIELDS_JS / Parametroj por EXTRACT_FIELDS_JS"""
+        return {
+            'json_ld': self.use_json_ld,
+            'fields': self.field_selectors,
+            'fallback': GENERIC_FIELD_SELECTORS,
+        }
+
+    def merge_fields(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Combina JSON-LD, selectores del ATS y genéricos
+        Kombinas JSON-LD, ATS-elektilojn kaj ĝeneralajn elektilojn
+
+        Returns:
+            Campos extraídos más 'extraction_path' con la ruta usada para el título
+        """
+        postings = raw.get('json_ld') or []
+        json_ld = parse_job_posting_ld(postings[0]) if postings else {}
+        selectors = raw.get('fields') or {}
+        fallback = raw.get('fallback') or {}
+
+        fields: Dict[str, Any] = {}
+        for name in GENERIC_FIELD_SELECTORS:
+            fields[name] = json_ld.get(name) or selectors.get(name) or fallback.get(name)
+        for name in ('salary_min', 'salary_max', 'salary_currency', 'posted_date', 'is_remote'):
+            fields[name] = json_ld.get(name)
+
+        # Contador de ruta: de dónde salió el título / De kie venis la titolo
+        if json_ld.get('title'):
+            fields['extraction_path'] = f"{self.name}:jsonld"
+        elif selectors.get('title'):
+            fields['extraction_path'] = f"{self.name}:selectors"
+        else:
+            fields['extraction_path'] = 'generic'
+
+        return fields
+
+    async def extract(self, page) -> Dict[str, Any]:
+        """
+        Extrae los campos de la página en un solo round trip
+        Ekstraktas la kampojn de la paĝo per unu rondiro
+        """
+        raw = await page.evaluate(EXTRACT_FIELDS_JS, self.build_spec())
+        return self.merge_fields(raw)
+
+    def extract_html(self, html_text: str) -> Dict[str, Any]:
+        """
+        Extrae los campos de HTML estático sin navegador
+        Ekstraktas la kampojn el statika HTML sen retumilo
+        """
+        return self.merge_fields(evaluate_html(html_text, self.build_spec()))
+
+
+# Registro global / Malloka registro / Global registry
+EXTRACTOR_REGISTRY: Dict[SourcePlatform, JobExtractor] = {}
+
+# Extractor genérico (fallback) / Ĝenerala ekstraktilo
+GENERIC_EXTRACTOR = JobExtractor(SourcePlatform.CUSTOM)
+
+
+def register_extractor(extractor: JobExtractor) -> JobExtractor:
+    """
+    Registra un extractor para su plataforma / Registras ekstraktilon por ĝia platformo
+    """
+    EXTRACTOR_REGISTRY[extractor.platform] = extractor
+    logger.debug(f"Extractor registrado: {extractor.name}")
+    return extractor
+
+
+def get_extractor(platform: SourcePlatform) -> JobExtractor:
+    """
+    Obtiene el extractor de una plataforma o el genérico
+    Akiras la ekstraktilon de platformo aŭ la ĝeneralan
+    """
+    return EXTRACTOR_REGISTRY.get(platform, GENERIC_EXTRACTOR)
+
+
+# ============================================================
+# EXTRACTORES REGISTRADOS / REGISTRITAJ EKSTRAKTILOJ
+# ============================================================
+
+register_extractor(JobExtractor(SourcePlatform.GREENHOUSE, {
+    'title': {'selectors': ['.app-title', '.job__title h1', 'h1.section-header'], 'min_length': 1},
+    'company': {'selectors': ['.company-name', '.job__header .company'], 'min_length': 1},
+    'description': {'selectors': ['#content', '.job__description'], 'min_length': 101},
+    'location': {'selectors': ['.location', '.job__location'], 'min_length': 1},
+}))
+
+register_extractor(JobExtractor(SourcePlatform.LEVER, {
+    'title': {'selectors': ['.posting-headline h2', '.posting-headline'], 'min_length': 1},
+    'description': {'selectors': ['[data-qa="job-description"]', '.posting-page .content', '.section-wrapper'], 'min_length': 101},
+    'location': {'selectors': ['.posting-categories .location', '.sort-by-location'], 'min_length': 1},
+    'salary': {'selectors': ['[data-qa="salary-range"]', '.posting-categories .compensation'], 'min_length': 1},
+}))
+
+register_extractor(JobExtractor(SourcePlatform.WORKDAY, {
+    'title': {'selectors': ['[data-automation-id="jobPostingHeader"]'], 'min_length': 1},
+    'company': {'selectors': ['[data-automation-id="jobPostingCompanyLocation"]'], 'min_length': 1},
+    'description': {'selectors': ['[data-automation-id="jobPostingDescription"]'], 'min_length': 101},
+    'location': {'selectors': ['[data-automation-id="locations"] dd', '[data-automation-id="locations"]'], 'min_length': 1},
+}))
+
+register_extractor(JobExtractor(SourcePlatform.SMARTRECRUITERS, {
+    'title': {'selectors': ['h1.job-title', '[itemprop="title"]'], 'min_length': 1},
+    'company': {'selectors': ['[itemprop="hiringOrganization"] [itemprop="name"]', '.company-name'], 'min_length': 1},
+    'description': {'selectors': ['[itemprop="description"]', '.job-sections'], 'min_length': 101},
+    'location': {'selectors': ['spl-job-location', '.job-location', '[itemprop="jobLocation"]'], 'min_length': 1},
+}))
+
+register_extractor(JobExtractor(SourcePlatform.WORKABLE, {
+    'title': {'selectors': ['[data-ui="job-title"]', 'h1'], 'min_length': 1},
+    'company': {'selectors': ['[data-ui="company-name"]'], 'min_length': 1},
+    'description': {'selectors': ['[data-ui="job-description"]', 'section[data-ui="job-description"]'], 'min_length': 101},
+    'location': {'selectors': ['[data-ui="job-location"]'], 'min_length': 1},
+    'salary': {'selectors': ['[data-ui="job-salary"]'], 'min_length': 1},
+}))
+
+register_extractor(JobExtractor(SourcePlatform.JOBVITE, {
+    'title': {'selectors': ['.jv-header'], 'min_length': 1},
+    'description': {'selectors': ['.jv-job-detail-description'], 'min_length': 101},
+    'location': {'selectors': ['.jv-job-detail-meta'], 'min_length': 1},
+}))
+
+register_extractor(JobExtractor(SourcePlatform.ICIMS, {
+    'title': {'selectors': ['.iCIMS_Header', 'h1.iCIMS_Header'], 'min_length': 1},
+    'description': {'selectors': ['.iCIMS_JobContent', '.iCIMS_InfoMsg_Job'], 'min_length': 101},
+    'location': {'selectors': ['.iCIMS_JobHeaderData .header.left span'], 'min_length': 1},
+}))
+
+# BambooHR es una SPA: el JSON-LD es la fuente más fiable
+register_extractor(JobExtractor(SourcePlatform.BAMBOOHR, {
+    'title': {'selectors': ['h2.ResAts__title', 'h2'], 'min_length': 1},
+    'description': {'selectors': ['.BambooRichText', '.ResAts__description'], 'min_length': 101},
+}))
@@ -0,0 +1,387 @@
+"""
+Frontera de Scraping Persistente / Persista Skrapada Limo
+Senior Data Engineer Architecture - Durable prioritized crawl frontier
+
+Las URLs pendientes viven en la tabla crawl_frontier con prioridad, lease y
+contador de intentos. El scraper toma lotes con lease; si el proceso muere
+(p.ej. el timeout de 1 h del scheduler) los leases caducan y la siguiente
+ejecución continúa donde quedó, sin repetir lo ya completado.
+"""
+import logging
+import math
+import os
+import socket
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+from sqlalchemy import select, update, func, and_, or_, bindparam
+
+from src.database import get_db
+from src.models import Job, FrontierUrl
+from src.rate_limiter import HostRateLimiter
+from src.url_canonicalizer import canonicalize
+from src.circuit_breaker import retry_delay
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Estados / Statoj / States
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+# Prioridad base y ajustes / Baza prioritato kaj alĝustigoj
+BASE_PRIORITY = 50.0
+FRESH_SOURCES = {'listing'}  # Recién publicadas en el índice del board / Ĵus publikigitaj
+FRESHNESS_BONUS = 20.0
+VELOCITY_WEIGHT = 10.0  # × log1p(ofertas de la empresa en la ventana)
+ERROR_PENALTY = 10.0  # Por intento fallido / Po malsukcesa provo
+MAX_BACKOFF_SECONDS = 24 * 3600
+
+
+def compute_priority(
+    source: Optional[str],
+    company_velocity: int = 0,
+    attempts: int = 0,
+    scraping_errors: int = 0
+) -> float:
+    """
+    Prioridad de una URL: frescura, velocidad de contratación de la empresa y
+    penalización por errores
+    Prioritato de URL: freŝeco, dunga rapido de la kompanio kaj eraro-puno
+    """
+    priority = BASE_PRIORITY
+    if source in FRESH_SOURCES:
+        priority += FRESHNESS_BONUS
+    priority += VELOCITY_WEIGHT * math.log1p(company_velocity)
+    priority -= ERROR_PENALTY * (attempts + scraping_errors)
+    return round(priority, 2)
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Espera exponencial con jitter tras un fallo / Eksponenta atendo kun hazardo post malsukceso"""
+    return min(retry_delay(attempts), MAX_BACKOFF_SECONDS)
+
+
+def host_hash(host: str) -> int:
+    """
+    Hash estable del host (igual en todos los procesos) para repartir shards
+    Stabila haketo de la gastiganto (sama en ĉiuj procezoj) por dividi partojn
+    """
+    return zlib.crc32(host.lower().encode('utf-8')) & 0x7FFFFFFF
+
+
+def default_worker_id() -> str:
+    """Identificador del proceso que toma leases / Identigilo de la procezo"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class CrawlFrontier:
+    """
+    Cola priorizada y persistente de URLs por scrapear
+    Prioritata kaj persista vico de skrapotaj URL-oj
+
+    Uso / Uzo / Usage:
+        frontier = CrawlFrontier()
+        frontier.enqueue(urls, source='listing', company_id=7)
+        batch = frontier.lease(50)            # Marca el lote como tomado
+        frontier.complete(batch, outcomes)    # done o backoff por URL
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[int] = None,
+        shard: Optional[Tuple[int, int]] = None
+    ):
+        """
+        Args:
+            worker_id: Identificador del worker (por defecto host:pid)
+            lease_seconds: Duración del lease (por defecto FRONTIER_LEASE_SECONDS)
+            shard: (índice, total) para tomar solo los hosts de este shard
+        """
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds or settings.FRONTIER_LEASE_SECONDS
+        self.shard = shard
+
+    # ------------------------------------------------------------
+    # Encolado / Envicigo
+    # ------------------------------------------------------------
+
+    def _company_velocity(self, db, company_id: Optional[int]) -> int:
+        if not company_id:
+            return 0
+        since = datetime.utcnow() - timedelta(days=settings.FRONTIER_VELOCITY_DAYS)
+        return db.scalar(
+            select(func.count(Job.id)).where(Job.company_id == company_id, Job.created_at >= since)
+        ) or 0
+
+    def enqueue(
+        self,
+        urls: Iterable[str],
+        source: str = 'manual',
+        company_id: Optional[int] = None
+    ) -> int:
+        """
+        Añade URLs canónicas a la frontera (las ya presentes se ignoran)
+        Aldonas kanonajn URL-ojn al la limo (jam ĉeestantaj estas ignorataj)
+
+        Returns:
+            Número de URLs nuevas en la frontera
+        """
+        canonical = list(dict.fromkeys(canonicalize(url).url for url in urls))
+        if not canonical:
+            return 0
+
+        now = datetime.utcnow()
+        with get_db() as db:
+            existing = set(db.scalars(select(FrontierUrl.url).where(FrontierUrl.url.in_(canonical))))
+            new_urls = [url for url in canonical if url not in existing]
+            if not new_urls:
+                return 0
+
+            # Errores previos de la misma URL ya guardada / Antaŭaj eraroj de la sama URL
+            errors = dict(db.execute(
+                select(Job.url, Job.scraping_errors).where(Job.url.in_(new_urls))
+            ).all())
+            velocity = self._company_velocity(db, company_id)
+
+            db.add_all([
+                FrontierUrl(
+                    url=url,
+                    host=HostRateLimiter.host_for(url),
+                    host_hash=host_hash(HostRateLimiter.host_for(url)),
+                    source=source,
+                    company_id=company_id,
+                    priority=compute_priority(source, velocity, scraping_errors=errors.get(url) or 0),
+                    status=PENDING,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for url in new_urls
+            ])
+            db.commit()
+
+        logger.info(f"🧭 {len(new_urls)} URLs añadidas a la frontera ({source})")
+        return len(new_urls)
+
+    # ------------------------------------------------------------
+    # Leases / Luoj
+    # ------------------------------------------------------------
+
+    def _ready_condition(self, now: datetime):
+        # Pendientes fuera de backoff, o leases caducados de un proceso caído
+        # Atendantaj ekster backoff, aŭ eksvalidiĝintaj luoj de falinta procezo
+        return or_(
+            and_(FrontierUrl.status == PENDING,
+                 or_(FrontierUrl.not_before.is_(None), FrontierUrl.not_before <= now)),
+            and_(FrontierUrl.status == LEASED, FrontierUrl.lease_until < now),
+        )
+
+    def lease(
+        self,
+        limit: int,
+        extra_condition=None,
+        exclude_hosts: Iterable[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Toma el siguiente lote por prioridad / Prenas la sekvan aron laŭ prioritato
+
+        Args:
+            limit: Tamaño del lote
+            extra_condition: Filtro SQL adicional sobre FrontierUrl
+            exclude_hosts: Hosts a saltar (p.ej. con el circuito abierto)
+
+        Returns:
+            Entradas tomadas: id, url, attempts, priority, lease_token
+        """
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+        ready = self._ready_condition(now)
+        if self.shard is not None:
+            # Un host siempre cae en el mismo shard / Gastiganto ĉiam falas en la saman parton
+            index, total = self.shard
+            ready = and_(ready, FrontierUrl.host_hash % total == index)
+        if extra_condition is not None:
+            ready = and_(ready, extra_condition)
+        exclude_hosts = list(exclude_hosts)
+        if exclude_hosts:
+            ready = and_(ready, FrontierUrl.host.notin_(exclude_hosts))
+
+        candidates = (
+            select(FrontierUrl.id)
+            .where(ready)
+            .order_by(FrontierUrl.priority.desc(), FrontierUrl.created_at.desc())
+            .limit(limit)
+        )
+
+        with get_db() as db:
+            # UPDATE condicional: dos workers nunca toman la misma URL
+            # Kondiĉa UPDATE: du laboristoj neniam prenas la saman URL-on
+            db.execute(
+                update(FrontierUrl)
+                .where(FrontierUrl.id.in_(candidates.scalar_subquery()), ready)
+                .values(
+                    status=LEASED,
+                    lease_token=token,
+                    leased_by=self.worker_id,
+                    lease_until=now + timedelta(seconds=self.lease_seconds),
+                    attempts=FrontierUrl.attempts + 1,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+            rows = db.execute(
+                select(FrontierUrl.id, FrontierUrl.url, FrontierUrl.attempts, FrontierUrl.priority,
+                       FrontierUrl.lease_token)
+                .where(FrontierUrl.lease_token == token)
+                .order_by(FrontierUrl.priority.desc())
+            ).all()
+
+        return [dict(row._mapping) for row in rows]
+
+    @staticmethod
+    def _held(entries: List[Dict[str, Any]]):
+        """
+        Condición: la entrada sigue con nuestro lease (no caducó ni lo retomó otro)
+        Kondiĉo: la ero ankoraŭ havas nian luon
+        """
+        return or_(*[
+            and_(FrontierUrl.id == entry['id'], FrontierUrl.lease_token == entry['lease_token'])
+            for entry in entries
+        ])
+
+    def renew(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Extiende el lease de un lote aún en curso / Plilongigas la luon de aro ankoraŭ prilaborata
+
+        Returns:
+            Entradas cuyo lease seguía siendo nuestro
+        """
+        if not entries:
+            return 0
+        now = datetime.utcnow()
+        with get_db() as db:
+            result = db.execute(
+                update(FrontierUrl)
+                .where(self._held(entries), FrontierUrl.status == LEASED)
+                .values(lease_until=now + timedelta(seconds=self.lease_seconds), updated_at=now)
+            )
+            db.commit()
+        return result.rowcount
+
+    def complete(self, entries: List[Dict[str, Any]], outcomes: List[Tuple[Any, ...]]):
+        """
+        Cierra el lease de un lote / Fermas la luon de aro
+
+        Args:
+            entries: Entradas devueltas por lease()
+            outcomes: (completada, error) o (completada, error, reintentable) por
+                      entrada, en el mismo orden; un fallo no reintentable
+                      (p.ej. 404) pasa directamente a failed
+
+        Solo se cierran las entradas que siguen con el lease_token de lease():
+        si el lease caducó y otro proceso las retomó, su estado no se pisa.
+        """
+        now = datetime.utcnow()
+        done: List[Dict[str, Any]] = []
+        retries: List[Dict[str, Any]] = []
+
+        for entry, (ok, error, *retryable) in zip(entries, outcomes):
+            if ok:
+                done.append(entry)
+                continue
+            exhausted = entry['attempts'] >= settings.FRONTIER_MAX_ATTEMPTS or retryable == [False]
+            retries.append({
+                'entry_id': entry['id'],
+                'held_token': entry['lease_token'],
+                'new_status': FAILED if exhausted else PENDING,
+                'new_not_before': None if exhausted else now + timedelta(seconds=backoff_seconds(entry['attempts'])),
+                'new_priority': entry['priority'] - ERROR_PENALTY,
+                'new_error': (error or '')[:1000],
+            })
+
+        with get_db() as db:
+            if done:
+                db.execute(
+                    update(FrontierUrl).where(self._held(done))
+                    .values(status=DONE, lease_until=None, lease_token=None, last_error=None, updated_at=now)
+                )
+            if retries:
+                # Tabla Core: executemany con el token en el WHERE
+                # Core-tabelo: executemany kun la ĵetono en la WHERE
+                frontier = FrontierUrl.__table__
+                db.execute(
+                    update(frontier)
+                    .where(frontier.c.id == bindparam('entry_id'),
+                           frontier.c.lease_token == bindparam('held_token'))
+                    .values(
+                        status=bindparam('new_status'),
+                        not_before=bindparam('new_not_before'),
+                        priority=bindparam('new_priority'),
+                        last_error=bindparam('new_error'),
+                        lease_until=None,
+                        lease_token=None,
+                        updated_at=now,
+                    ),
+                    retries
+                )
+            db.commit()
+
+    def park(self, entries: List[Dict[str, Any]], seconds: float):
+        """
+        Aparca un lote hasta que su host se recupere, sin contar el intento
+        Parkumas aron ĝis ĝia gastiganto resaniĝos, sen kalkuli la provon
+
+        Args:
+            entries: Entradas devueltas por lease()
+            seconds: Segundos hasta el siguiente intento
+        """
+        if not entries:
+            return
+        now = datetime.utcnow()
+        with get_db() as db:
+            db.execute(
+                update(FrontierUrl)
+                .where(self._held(entries), FrontierUrl.status == LEASED)
+                .values(
+                    status=PENDING,
+                    attempts=FrontierUrl.attempts - 1,
+                    not_before=now + timedelta(seconds=seconds),
+                    lease_until=None,
+                    lease_token=None,
+                    updated_at=now,
+                )
+            )
+            db.commit()
+    
+    def release(self, entries: List[Dict[str, Any]]):
+        """
+        Devuelve un lote sin procesar (parada ordenada) sin contar el intento
+        Redonas neprilaboritan aron (orda halto) sen kalkuli la provon
+        """
+        if not entries:
+            return
+        with get_db() as db:
+            db.execute(
+                update(FrontierUrl)
+                .where(self._held(entries), FrontierUrl.status == LEASED)
+                .values(
+                    status=PENDING,
+                    attempts=FrontierUrl.attempts - 1,
+                    lease_until=None,
+                    lease_token=None,
+                    updated_at=datetime.utcnow(),
+                )
+            )
+            db.commit()
+
+    def counts(self) -> Dict[str, int]:
+        """Entradas por estado / Eroj po stato"""
+        with get_db() as db:
+            return dict(db.execute(
+                select(FrontierUrl.status, func.count(FrontierUrl.id)).group_by(FrontierUrl.status)
+            ).all())
@@ -0,0 +1,455 @@
+"""
+Escritor por Lotes de Ofertas / Ara Skribilo de Ofertoj
+Senior Data Engineer Architecture - Buffered bulk writer for scraped jobs
+
+Acumula JobCreate validados y los persiste por lotes: empresas resueltas en
+bloque y un INSERT multi-fila con ON CONFLICT (url) DO NOTHING por lote. Con
+SQLite en WAL, cientos de commits (y fsyncs) pasan a ser unos pocos.
+
+JobWriterThread mueve esa escritura a un hilo dedicado alimentado por una cola
+acotada: el event loop del scraper nunca espera a SQLAlchemy y, si la BD se
+queda atrás, la cola llena frena a los workers (backpressure).
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Mapping
+
+from pydantic import ValidationError
+from sqlalchemy import select, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.database import get_db
+from src.models import Job, Company
+from src.schemas import JobCreate
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Límite de parámetros por sentencia en SQLite >= 3.32 / Limo de parametroj en SQLite >= 3.32
+_SQLITE_MAX_VARIABLES = 32766
+
+# Columnas que definen el contenido de una oferta / Kolumnoj kiuj difinas la enhavon de oferto
+CONTENT_HASH_FIELDS = (
+    'title', 'company_name', 'description', 'location', 'is_remote',
+    'salary_range', 'salary_min', 'salary_max', 'salary_currency',
+)
+
+
+def _dialect_insert(db, table):
+    """
+    INSERT con soporte ON CONFLICT según el dialecto / INSERT kun ON CONFLICT laŭ dialekto
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert(table)
+
+
+def content_hash(values: Mapping[str, Any]) -> str:
+    """
+    SHA256 del contenido de una oferta (fila de jobs o job_row)
+    SHA256 de la enhavo de oferto (vico de jobs aŭ job_row)
+    """
+    payload = json.dumps([values.get(field) for field in CONTENT_HASH_FIELDS], default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def job_row(validated: JobCreate, company_id: Optional[int], now: datetime) -> Dict[str, Any]:
+    """
+    Convierte un JobCreate en una fila de la tabla jobs
+    Konvertas JobCreate al vico de la tabelo jobs
+    """
+    row = {
+        'external_id': validated.external_id,
+        'title': validated.title,
+        'company_id': company_id,
+        'company_name': validated.company_name,
+        'description': validated.description,
+        'raw_description': validated.raw_description,
+        'stack': validated.stack,
+        'required_skills': validated.required_skills,
+        'nice_to_have_skills': validated.nice_to_have_skills,
+        'salary_range': validated.salary_range,
+        'salary_min': validated.salary_min,
+        'salary_max': validated.salary_max,
+        'salary_currency': validated.salary_currency,
+        'location': validated.location,
+        'is_remote': validated.is_remote,
+        'remote_policy': validated.remote_policy.value if validated.remote_policy else None,
+        'country': validated.country,
+        'city': validated.city,
+        'url': validated.url,
+        'source_platform': validated.source_platform.value if validated.source_platform else None,
+        'raw_page_key': validated.raw_page_key,
+        'raw_page_type': validated.raw_page_type,
+        'hiring_urgency_score': validated.hiring_urgency_score,
+        'is_it_niche': validated.is_it_niche,
+        'posted_date': validated.posted_date,
+        'is_active': validated.is_active,
+        'date_scraped': now,
+        'last_verified': now,
+        'created_at': now,
+        'updated_at': now,
+    }
+    row['content_hash'] = content_hash(row)
+    return row
+
+
+class BufferedJobWriter:
+    """
+    Buffer de escritura diferida para ofertas scrapeadas
+    Prokrastita skriba bufro por skrapitaj ofertoj
+
+    Uso / Uzo / Usage:
+        writer = BufferedJobWriter()
+        writer.add(job_data)   # Valida y encola; vacía al llegar a batch_size
+        writer.flush()         # Vacía lo pendiente (llamar al terminar)
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            batch_size: Ofertas por lote (por defecto DB_WRITE_BATCH_SIZE)
+            flush_interval: Segundos máximos entre vaciados (por defecto DB_WRITE_FLUSH_INTERVAL)
+        """
+        self.batch_size = batch_size or settings.DB_WRITE_BATCH_SIZE
+        self.flush_interval = settings.DB_WRITE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.buffer: List[JobCreate] = []
+        self.last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Contadores desde el último take_counts() / Nombriloj ekde la lasta take_counts()
+        self.saved = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+        # URLs de lotes confirmados o descartados / URL-oj de konfirmitaj aŭ forĵetitaj aroj
+        self.committed_urls: List[str] = []
+        self.failed_urls: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    @staticmethod
+    def validate(job_data: Dict[str, Any]) -> Optional[JobCreate]:
+        """
+        Valida una oferta con Pydantic / Validigas oferton per Pydantic
+
+        Returns:
+            El JobCreate validado, o None si no pasó la validación
+        """
+        try:
+            return JobCreate(**job_data)
+        except ValidationError as e:
+            logger.error(f"✗ Error de validación Pydantic: {e}")
+            logger.error(f"   Datos: {job_data}")
+            return None
+
+    def add(self, job_data: Dict[str, Any]) -> Optional[JobCreate]:
+        """
+        Valida y encola una oferta / Validigas kaj envicigas oferton
+
+        Returns:
+            El JobCreate validado, o None si no pasó la validación
+        """
+        validated = self.validate(job_data)
+        if validated:
+            self.append(validated)
+        return validated
+
+    def append(self, validated: JobCreate):
+        """Encola una oferta ya validada / Envicigas jam validigitan oferton"""
+        self.buffer.append(validated)
+        if self.should_flush():
+            self.flush()
+
+    def should_flush(self) -> bool:
+        """¿Toca vaciar por tamaño o por tiempo? / Ĉu malplenigi pro grandeco aŭ tempo?"""
+        if not self.buffer:
+            return False
+        return (
+            len(self.buffer) >= self.batch_size
+            or time.monotonic() - self.last_flush >= self.flush_interval
+        )
+
+    def flush(self) -> int:
+        """
+        Persiste el buffer en una transacción / Persistigas la bufron en unu transakcio
+
+        Returns:
+            Número de ofertas nuevas guardadas
+        """
+        self.last_flush = time.monotonic()
+        if not self.buffer:
+            return 0
+
+        batch, self.buffer = self.buffer, []
+
+        # Deduplicar dentro del lote / Senduobligi ene de la aro
+        unique: Dict[str, JobCreate] = {}
+        for validated in batch:
+            unique.setdefault(validated.url, validated)
+        with self._lock:
+            self.duplicates += len(batch) - len(unique)
+
+        start = time.monotonic()
+        try:
+            saved = self._write_batch(list(unique.values()))
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Error de base de datos guardando lote de {len(unique)} ofertas: {e}")
+            with self._lock:
+                self.failed += len(unique)
+                self.failed_urls.extend(unique)
+            return 0
+
+        with self._lock:
+            self.committed_urls.extend(unique)
+            self.flushes += 1
+            self.flush_seconds += time.monotonic() - start
+        logger.info(f"💾 Lote guardado: {saved} nuevas, {len(unique) - saved} duplicadas")
+        return saved
+
+    def _write_batch(self, jobs: List[JobCreate]) -> int:
+        now = datetime.utcnow()
+        urls = [job.url for job in jobs]
+        names = sorted({job.company_name for job in jobs})
+
+        with get_db() as db:
+            # URLs ya existentes (una consulta) / Jam ekzistantaj URL-oj (unu demando)
+            existing_urls = set(db.scalars(select(Job.url).where(Job.url.in_(urls))))
+            new_jobs = [job for job in jobs if job.url not in existing_urls]
+            with self._lock:
+                self.duplicates += len(jobs) - len(new_jobs)
+            if not new_jobs:
+                return 0
+
+            # Empresas en bloque / Kompanioj amase
+            company_ids = self._resolve_companies(db, names, now)
+
+            rows = [job_row(job, company_ids.get(job.company_name), now) for job in new_jobs]
+            chunk = max(1, _SQLITE_MAX_VARIABLES // len(rows[0]))
+            saved = 0
+            for start in range(0, len(rows), chunk):
+                statement = _dialect_insert(db, Job)
+                if statement is not None:
+                    statement = statement.on_conflict_do_nothing(index_elements=['url'])
+                else:
+                    statement = insert(Job)
+                # Un único INSERT ... VALUES (...), (...) por trozo / Unu plurvica INSERT po peco
+                result = db.connection().execute(statement.values(rows[start:start + chunk]))
+                saved += max(result.rowcount, 0)
+
+            db.commit()
+
+        # Filas que otro proceso insertó entre la consulta y el INSERT
+        # Vicoj enmetitaj de alia procezo inter la demando kaj la INSERT
+        with self._lock:
+            self.duplicates += len(rows) - saved
+            self.saved += saved
+        return saved
+
+    def _resolve_companies(self, db, names: List[str], now: datetime) -> Dict[str, int]:
+        """
+        Obtiene o crea las empresas del lote en bloque
+        Akiras aŭ kreas la kompaniojn de la aro amase
+        """
+        company_ids = dict(db.execute(
+            select(Company.name, Company.id).where(Company.name.in_(names))
+        ).all())
+
+        missing = [name for name in names if name not in company_ids]
+        if missing:
+            logger.info(f"📝 Creando {len(missing)} empresas nuevas")
+            rows = [
+                {'name': name, 'last_scraped_at': now, 'created_at': now, 'updated_at': now}
+                for name in missing
+            ]
+            statement = _dialect_insert(db, Company)
+            if statement is not None:
+                statement = statement.on_conflict_do_nothing(index_elements=['name'])
+            else:
+                statement = insert(Company)
+            db.connection().execute(statement.values(rows))
+
+            company_ids.update(db.execute(
+                select(Company.name, Company.id).where(Company.name.in_(missing))
+            ).all())
+
+        return company_ids
+
+    def take_counts(self) -> Dict[str, Any]:
+        """
+        Devuelve y reinicia los contadores / Redonas kaj nuligas la nombrilojn
+
+        Incluye las URLs cuyo lote se confirmó (committed_urls) o se perdió por
+        un error de BD (failed_urls) desde la última llamada.
+        """
+        with self._lock:
+            counts = {
+                'saved': self.saved,
+                'duplicates': self.duplicates,
+                'failed': self.failed,
+                'flushes': self.flushes,
+                'flush_seconds': self.flush_seconds,
+                'committed_urls': self.committed_urls,
+                'failed_urls': self.failed_urls,
+            }
+            self.saved = self.duplicates = self.failed = self.flushes = 0
+            self.flush_seconds = 0.0
+            self.committed_urls, self.failed_urls = [], []
+        return counts
+
+
+# Marcadores de control de la cola / Kontrolaj markiloj de la vico
+_FLUSH = object()
+_STOP = object()
+
+
+class JobWriterThread:
+    """
+    Hilo escritor de BD alimentado por una cola acotada
+    Datumbaza skriba fadeno nutrata de limigita vico
+
+    Uso / Uzo / Usage:
+        writer = JobWriterThread()
+        validated = await writer.put(job_data)  # Espera solo si la cola está llena
+        await writer.flush()                     # Espera a que todo esté en BD
+        await writer.close()
+    """
+
+    def __init__(self, writer: Optional[BufferedJobWriter] = None, maxsize: Optional[int] = None):
+        """
+        Args:
+            writer: Buffer por lotes que usa el hilo (por defecto uno nuevo)
+            maxsize: Capacidad de la cola (por defecto DB_WRITE_QUEUE_SIZE)
+        """
+        self.writer = writer if writer is not None else BufferedJobWriter()
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize or settings.DB_WRITE_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Métricas del pipeline / Metrikoj de la dukto
+        self.max_queue_depth = 0
+        self.backpressure_waits = 0
+        self.max_latency = 0.0  # Segundos desde put() hasta el commit / Sekundoj de put() ĝis commit
+        self._pending_since: List[float] = []
+
+    def start(self):
+        """Arranca el hilo si no está vivo / Startigas la fadenon se ĝi ne vivas"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='job-writer', daemon=True)
+            self._thread.start()
+
+    async def put(self, job_data: Dict[str, Any]) -> Optional[JobCreate]:
+        """
+        Valida y envía una oferta al hilo escritor
+        Validigas kaj sendas oferton al la skriba fadeno
+
+        Returns:
+            El JobCreate validado, o None si no pasó la validación
+        """
+        validated = self.writer.validate(job_data)
+        if validated is None:
+            return None
+
+        self.start()
+        item = (validated, time.monotonic())
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            # Backpressure: esperar fuera del event loop / Atendi ekster la eventa buklo
+            self.backpressure_waits += 1
+            await asyncio.to_thread(self.queue.put, item)
+
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+        return validated
+
+    async def flush(self):
+        """
+        Espera a que todo lo encolado esté confirmado en BD
+        Atendas ĝis ĉio envicigita estas konfirmita en la datumbazo
+        """
+        if self._thread is None:
+            return
+        await asyncio.to_thread(self.queue.put, _FLUSH)
+        await asyncio.to_thread(self.queue.join)
+
+    async def close(self):
+        """Vacía y detiene el hilo / Malplenigas kaj haltigas la fadenon"""
+        if self._thread is None:
+            return
+        await asyncio.to_thread(self.queue.put, _STOP)
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            timeout = max(0.0, self.writer.flush_interval - (time.monotonic() - self.writer.last_flush))
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                # Un error aquí no debe matar el hilo: put() quedaría bloqueado
+                # Eraro ĉi tie ne mortigu la fadenon: put() restus blokita
+                try:
+                    self._flush()
+                except Exception as e:
+                    logger.error(f"✗ Error en el hilo escritor de BD: {e}")
+                continue
+
+            try:
+                if item is _STOP or item is _FLUSH:
+                    self._flush()
+                else:
+                    validated, enqueued_at = item
+                    self.writer.buffer.append(validated)
+                    self._pending_since.append(enqueued_at)
+                    if self.writer.should_flush():
+                        self._flush()
+            except Exception as e:
+                logger.error(f"✗ Error en el hilo escritor de BD: {e}")
+            finally:
+                self.queue.task_done()
+
+            # Parar aunque falle el último flush / Halti eĉ se la lasta flush malsukcesas
+            if item is _STOP:
+                return
+
+    def _flush(self):
+        self.writer.flush()
+        if self._pending_since:
+            latency = time.monotonic() - min(self._pending_since)
+            self._pending_since = []
+            with self._lock:
+                self.max_latency = max(self.max_latency, latency)
+
+    def take_metrics(self) -> Dict[str, Any]:
+        """
+        Devuelve contadores del buffer y métricas del pipeline, y los reinicia
+        Redonas nombrilojn de la bufro kaj metrikojn de la dukto, kaj nuligas ilin
+        """
+        metrics = self.writer.take_counts()
+        with self._lock:
+            metrics.update({
+                'max_queue_depth': self.max_queue_depth,
+                'backpressure_waits': self.backpressure_waits,
+                'max_latency': self.max_latency,
+            })
+            self.max_queue_depth = self.backpressure_waits = 0
+            self.max_latency = 0.0
+        return metrics
@@ -0,0 +1,142 @@
+"""
+Buscador de Palabras Clave Compilado / Kompilita Ŝlosilvorta Serĉilo
+Senior Data Engineer Architecture - Compiled multi-pattern keyword matcher
+
+La urgencia, el nicho IT y los criterios de alertas pasaban la descripción a
+minúsculas en cada función y la recorrían una vez por palabra clave. Aquí
+todas las palabras de todas las clases se compilan en una sola expresión
+regular con forma de trie (prefijos compartidos), y una única pasada sobre el
+texto devuelve cada clase encontrada: el coste depende de la longitud del
+texto, no del número de palabras.
+
+La semántica es la de `palabra in texto` en minúsculas (subcadena), incluidas
+las coincidencias solapadas ('machine' y 'machine learning').
+"""
+import re
+from typing import Optional, Dict, Set, Iterable, Mapping, Hashable, List, Tuple
+
+# Palabras de urgencia (título o descripción) / Urĝaj vortoj
+URGENCY_KEYWORDS = ['urgent', 'immediate', 'asap', 'urgente', 'inmediato']
+
+# Nichos IT especializados / Specialigitaj IT-niĉoj
+IT_NICHE_KEYWORDS = [
+    'blockchain', 'web3', 'crypto', 'quantum',
+    'machine learning', 'deep learning', 'ai engineer',
+    'computer vision', 'nlp', 'bioinformatics',
+    'embedded systems', 'iot', 'edge computing',
+    'game engine', 'graphics programming', 'shader'
+]
+
+# Indicadores de seniority en el título / Indikiloj de senioreco en la titolo
+SENIORITY_KEYWORDS = ['senior', 'lead']
+
+# Trabajo remoto mencionado en la descripción / Fora laboro menciita en la priskribo
+REMOTE_KEYWORDS = ['remote']
+
+# Clases de señal del scraper / Signalaj klasoj de la skrapilo
+URGENCY, IT_NICHE, SENIORITY, REMOTE = 'urgency', 'it_niche', 'seniority', 'remote'
+
+_END = ''
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """
+    Expresión del subárbol; el opcional codicioso prefiere la palabra más larga
+    Esprimo de la subarbo; la avida nedeviga preferas la plej longan vorton
+    """
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return f'(?:{body})?' if _END in node else body
+
+
+class KeywordMatcher:
+    """
+    Encuentra en una pasada todas las clases de palabra clave de un texto
+    Trovas per unu trapaso ĉiujn ŝlosilvortajn klasojn de teksto
+
+    Uso / Uzo / Usage:
+        matcher = KeywordMatcher({'urgency': ['urgent', 'asap'], 'ml': ['machine learning']})
+        matcher.classes(title, description)  # {'urgency'}
+        matcher.scan(description)            # {'urgency': {'asap'}}
+    """
+
+    def __init__(self, classes: Mapping[Hashable, Iterable[str]]):
+        """
+        Args:
+            classes: {clase: palabras clave}; una palabra puede estar en varias clases
+        """
+        self._keyword_classes: Dict[str, Set[Hashable]] = {}
+        # Una palabra vacía está en todo texto, como '' in texto
+        # Malplena vorto estas en ĉiu teksto, kiel '' in teksto
+        self._always: Set[Hashable] = set()
+        for name, keywords in classes.items():
+            for keyword in keywords:
+                keyword = (keyword or '').lower()
+                if keyword:
+                    self._keyword_classes.setdefault(keyword, set()).add(name)
+                else:
+                    self._always.add(name)
+
+        trie: Dict[str, dict] = {}
+        for keyword in self._keyword_classes:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        # En cada posición se captura la palabra más larga; las más cortas que
+        # empiezan ahí son sus prefijos / Ĉe ĉiu pozicio kaptiĝas la plej longa vorto
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [keyword[:end] for end in range(1, len(keyword) + 1) if keyword[:end] in self._keyword_classes]
+            for keyword in self._keyword_classes
+        }
+        self._pattern: Optional[re.Pattern] = (
+            re.compile(f'(?=({_trie_pattern(trie)}))') if self._keyword_classes else None
+        )
+
+    def scan(self, *texts: Optional[str]) -> Dict[Hashable, Set[str]]:
+        """
+        Palabras encontradas por clase / Trovitaj vortoj po klaso
+
+        Cada texto se pasa a minúsculas y se recorre una sola vez; los textos
+        se buscan por separado (una palabra no cruza de uno a otro).
+        """
+        hits: Dict[Hashable, Set[str]] = {name: set() for name in self._always}
+        if self._pattern is None:
+            return hits
+        found: Set[str] = set()
+        for text in texts:
+            if text:
+                found.update(match.group(1) for match in self._pattern.finditer(text.lower()))
+        for longest in found:
+            for keyword in self._prefixes[longest]:
+                for name in self._keyword_classes[keyword]:
+                    hits.setdefault(name, set()).add(keyword)
+        return hits
+
+    def classes(self, *texts: Optional[str]) -> Set[Hashable]:
+        """Clases con al menos una palabra en los textos / Klasoj kun almenaŭ unu vorto"""
+        return set(self.scan(*texts))
+
+
+# Matcher compartido de las señales del scraper y de las alertas
+# Komuna serĉilo de la signaloj de la skrapilo kaj de la atentigoj
+SIGNAL_MATCHER = KeywordMatcher({
+    URGENCY: URGENCY_KEYWORDS,
+    IT_NICHE: IT_NICHE_KEYWORDS,
+    SENIORITY: SENIORITY_KEYWORDS,
+    REMOTE: REMOTE_KEYWORDS,
+})
+
+
+def job_signals(title: Optional[str], description: Optional[str]) -> Tuple[Set[Hashable], Set[Hashable]]:
+    """
+    Clases de señal del título y de la descripción, una pasada por texto
+    Signalaj klasoj de la titolo kaj de la priskribo, unu trapaso po teksto
+
+    Returns:
+        (clases en el título, clases en la descripción)
+    """
+    return SIGNAL_MATCHER.classes(title), SIGNAL_MATCHER.classes(description)
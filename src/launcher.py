@@ -0,0 +1,154 @@
+"""
+Lanzador Multi-proceso / Plurproceza Lanĉilo
+Senior Data Engineer Architecture - Sharded multi-process scraping
+
+Un solo proceso Python satura un núcleo con el parseo y el bucle asyncio.
+El lanzador arranca N procesos scraper, cada uno con su propio navegador, y
+reparte la frontera (crawl_frontier) por hash del host: un host siempre cae en
+el mismo proceso, así que el HostRateLimiter de ese proceso sigue siendo el
+único que lo consulta y los límites de cortesía se respetan. Las
+ScrapingStats de cada proceso se combinan en un único informe.
+
+Uso / Uzo / Usage:
+    python -m src.launcher [--processes N] [--max-urls M] [URL ...]
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable
+
+from src.frontier import CrawlFrontier, default_worker_id, host_hash
+from src.rate_limiter import HostRateLimiter
+from src.schemas import ScrapingStats
+from src.scraper_engine import LabortroviloScraper  # También configura el logging en cada proceso
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+
+def shard_for_url(url: str, total: int) -> int:
+    """
+    Shard que atiende una URL (mismo criterio que CrawlFrontier.lease)
+    Parto kiu servas URL-on (sama kriterio kiel CrawlFrontier.lease)
+    """
+    return host_hash(HostRateLimiter.host_for(url)) % total
+
+
+async def _scrape_shard(index: int, total: int, max_urls: Optional[int]) -> Dict[str, Any]:
+    frontier = CrawlFrontier(worker_id=f"{default_worker_id()}:shard{index}", shard=(index, total))
+    scraper = LabortroviloScraper(headless=True)
+    try:
+        await scraper.initialize()
+        await scraper.scrape_frontier(frontier, max_urls=max_urls)
+    finally:
+        await scraper.close()
+    return scraper.stats.model_dump()
+
+
+def run_shard(index: int, total: int, max_urls: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Punto de entrada de un proceso worker: consume su shard de la frontera
+    Enirpunkto de laborista procezo: konsumas sian parton de la limo
+
+    Returns:
+        ScrapingStats del proceso como dict (serializable entre procesos)
+    """
+    logger.info(f"🚀 Shard {index + 1}/{total} iniciado")
+    return asyncio.run(_scrape_shard(index, total, max_urls))
+
+
+def run_sharded(
+    processes: Optional[int] = None,
+    urls: Optional[Iterable[str]] = None,
+    max_urls: Optional[int] = None
+) -> ScrapingStats:
+    """
+    Encola las URLs y lanza un proceso scraper por shard
+    Envicigas la URL-ojn kaj lanĉas po unu skrapila procezo por parto
+
+    Args:
+        processes: Número de procesos (por defecto SCRAPER_PROCESSES)
+        urls: URLs a añadir a la frontera antes de empezar
+        max_urls: Límite de URLs por proceso (por defecto sin límite)
+
+    Returns:
+        Estadísticas combinadas de todos los procesos
+    """
+    processes = max(1, processes or settings.SCRAPER_PROCESSES)
+    report = ScrapingStats(start_time=datetime.utcnow())
+
+    frontier = CrawlFrontier()
+    if urls:
+        frontier.enqueue(urls, source='manual')
+    logger.info(f"🧭 Frontera: {frontier.counts()} → {processes} procesos")
+
+    # spawn: cada proceso arranca limpio (sin motor SQLAlchemy ni bucle heredados)
+    # spawn: ĉiu procezo startas pure (sen hereditaj SQLAlchemy-motoro aŭ buklo)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = {
+            executor.submit(run_shard, index, processes, max_urls): index
+            for index in range(processes)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                shard_stats = ScrapingStats(**future.result())
+            except Exception as e:
+                # Los leases del shard caído caducan y se retoman en la próxima ejecución
+                # La luoj de la falinta parto eksvalidiĝas kaj estos reprenataj
+                logger.error(f"✗ Shard {index + 1}/{processes} falló: {e}")
+                continue
+            logger.info(
+                f"   Shard {index + 1}/{processes}: {shard_stats.total_urls} URLs, "
+                f"{shard_stats.saved_to_db} guardadas, {shard_stats.contexts_recycled} contextos reciclados, "
+                f"RSS pico {shard_stats.max_rss_mb} MB"
+            )
+            report.merge(shard_stats)
+
+    report.end_time = datetime.utcnow()
+    report.duration_seconds = (report.end_time - report.start_time).total_seconds()
+    log_report(report, processes)
+    return report
+
+
+def log_report(stats: ScrapingStats, processes: int):
+    """Informe combinado de la ejecución / Kombinita raporto de la rulo"""
+    logger.info(f"\n{'='*80}")
+    logger.info(f"📊 INFORME MULTI-PROCESO ({processes} procesos):")
+    logger.info(f"   Total URLs: {stats.total_urls}")
+    logger.info(f"   Exitosos: {stats.successful_scrapes}")
+    logger.info(f"   Fallidos: {stats.failed_scrapes}")
+    logger.info(f"   Duplicados: {stats.duplicates_found} ({stats.skipped_known} sin navegar)")
+    logger.info(f"   Guardados en BD: {stats.saved_to_db}")
+    logger.info(f"   Tasa de éxito: {stats.calculate_success_rate()}%")
+    logger.info(f"   Duración: {stats.duration_seconds:.1f}s")
+    for path, count in sorted(stats.extraction_paths.items()):
+        logger.info(f"   Extracción {path}: {count}")
+    for host, seconds in sorted(stats.host_wait_seconds.items()):
+        logger.info(f"   Espera por cortesía en {host}: {seconds:.1f}s")
+    logger.info(f"{'='*80}\n")
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Inicializa la BD y ejecuta los shards
+    Ekigas la datumbazon kaj rulas la partojn
+    """
+    parser = argparse.ArgumentParser(description="Labortrovilo - scraping multi-proceso")
+    parser.add_argument('--processes', type=int, default=None, help="Procesos scraper (SCRAPER_PROCESSES)")
+    parser.add_argument('--max-urls', type=int, default=None, help="Límite de URLs por proceso")
+    parser.add_argument('urls', nargs='*', help="URLs a encolar antes de empezar")
+    args = parser.parse_args(argv)
+
+    from src.database import init_db
+    init_db()
+    run_sharded(args.processes, args.urls, args.max_urls)
+
+
+if __name__ == "__main__":
+    main()
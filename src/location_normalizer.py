@@ -0,0 +1,328 @@
+"""
+Normalización de Ubicaciones / Normaligo de Lokoj
+Senior Data Engineer Architecture - Offline gazetteer location normalizer
+
+Solo se guardaba el texto libre de location: Job.country (indexado en
+idx_job_location_remote) y Job.city quedaban vacíos, y los filtros por país
+no devolvían nada o recurrían a location ILIKE '%...%'. Aquí un gazetteer
+offline (src/data/gazetteer.tsv y, opcionalmente, un dump de ciudades de
+GeoNames) se carga una sola vez en un trie de tokens en memoria; cada
+ubicación se recorre una vez buscando el alias más largo en cada posición y
+se resuelve a país, ciudad y remote_policy.
+
+Uso / Uzo / Usage (relleno de filas existentes):
+    python -m src.location_normalizer
+"""
+import argparse
+import logging
+import os
+import re
+import unicodedata
+from typing import Optional, Dict, Any, List, NamedTuple
+
+from sqlalchemy import select, update, bindparam
+
+from src.database import get_db
+from src.models import Job
+from src.schemas import RemotePolicy
+from src.keyword_matcher import KeywordMatcher
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.tsv')
+
+# Columnas de un dump de ciudades GeoNames / Kolumnoj de GeoNames-urba dosiero
+_GEONAMES_NAME, _GEONAMES_ASCII, _GEONAMES_COUNTRY, _GEONAMES_POPULATION = 1, 2, 8, 14
+
+# Política remota por palabras del texto de ubicación / Fora politiko laŭ vortoj
+_POLICY_MATCHER = KeywordMatcher({
+    RemotePolicy.HYBRID: ['hybrid', 'hibrido', 'híbrido', 'híbrida', 'hibrida'],
+    RemotePolicy.FULL_REMOTE: [
+        'remote', 'remoto', 'remota', 'anywhere', 'work from home', 'wfh',
+        'teletrabajo', 'home office', 'distributed', 'fora laboro',
+    ],
+    RemotePolicy.ONSITE: ['on-site', 'onsite', 'on site', 'presencial', 'in office', 'in-office', 'surloke'],
+    RemotePolicy.FLEXIBLE: ['flexible', 'flexível', 'flexivel'],
+})
+# Si aparecen varias, gana la primera / Se pluraj aperas, la unua venkas
+_POLICY_PRECEDENCE = [RemotePolicy.HYBRID, RemotePolicy.FLEXIBLE, RemotePolicy.ONSITE, RemotePolicy.FULL_REMOTE]
+
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+_END = ''
+
+
+class Place(NamedTuple):
+    """Entrada del gazetteer / Enigo de la geografia indekso"""
+    country: str
+    city: Optional[str]
+    region: bool = False  # Estado/provincia ('California', 'TX'): indica el país, no lo nombra
+
+
+class NormalizedLocation(NamedTuple):
+    """Ubicación normalizada / Normaligita loko"""
+    country: Optional[str]
+    city: Optional[str]
+    remote_policy: Optional[str]
+
+
+def _tokens(text: str) -> List[str]:
+    """Minúsculas, sin acentos y separado en palabras / Minuskle, sen supersignoj, en vortoj"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return [token for token in _NON_WORD.split(text) if token]
+
+
+class Gazetteer:
+    """
+    Trie de tokens con los alias de países y ciudades
+    Vorta trie kun la kromnomoj de landoj kaj urboj
+
+    Uso / Uzo / Usage:
+        gazetteer = Gazetteer.default()       # se carga una vez por proceso
+        gazetteer.normalize("Remote - Buenos Aires, AR")
+    """
+
+    _default: Optional["Gazetteer"] = None
+
+    def __init__(self):
+        self._trie: Dict[str, Any] = {}
+        self._countries: Dict[str, str] = {}  # Código ISO → nombre / ISO-kodo → nomo
+        self._places: Dict[Place, Place] = {}  # Interning de entradas repetidas
+        self.aliases = 0
+
+    @classmethod
+    def default(cls) -> "Gazetteer":
+        """Gazetteer compartido por el proceso / Komuna geografia indekso de la procezo"""
+        if cls._default is None:
+            gazetteer = cls()
+            gazetteer.load_tsv(GAZETTEER_PATH)
+            if settings.LOCATION_GAZETTEER_PATH:
+                gazetteer.load_geonames(settings.LOCATION_GAZETTEER_PATH)
+            cls._default = gazetteer
+        return cls._default
+
+    def add(self, alias: str, country: str, city: Optional[str] = None, region: bool = False):
+        """
+        Añade un alias; los nombres ambiguos guardan todas sus entradas en orden
+        Aldonas kromnomon; ambiguaj nomoj konservas ĉiujn siajn enigojn laŭorde
+        """
+        tokens = _tokens(alias)
+        if not tokens:
+            return
+        place = Place(country, city, region)
+        place = self._places.setdefault(place, place)
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        entries = node.setdefault(_END, [])
+        if place not in entries:
+            entries.append(place)
+            self.aliases += 1
+
+    def load_tsv(self, path: str):
+        """Carga el gazetteer incluido (código, país, ciudad, alias, tipo) / Ŝargas la inkluzivitan indekson"""
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip() or line.startswith('#'):
+                    continue
+                code, country, city, aliases, kind = (line.rstrip('\n').split('\t') + [''] * 5)[:5]
+                self._countries.setdefault(code, country)
+                region = kind == 'region'
+                names = ([] if region else [city or country]) + [alias for alias in aliases.split('|') if alias]
+                for name in names:
+                    self.add(name, country, city or None, region)
+
+    def load_geonames(self, path: str):
+        """
+        Añade las ciudades de un dump de GeoNames (cities15000.txt, ...)
+        Aldonas la urbojn de GeoNames-dosiero
+
+        Solo nombre y nombre ASCII (no los alternativos) para mantener el
+        trie compacto; más población primero ante nombres ambiguos.
+        """
+        rows = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                columns = line.rstrip('\n').split('\t')
+                if len(columns) <= _GEONAMES_POPULATION:
+                    continue
+                country = self._countries.get(columns[_GEONAMES_COUNTRY])
+                if country is None:
+                    continue
+                try:
+                    population = int(columns[_GEONAMES_POPULATION] or 0)
+                except ValueError:
+                    population = 0
+                rows.append((population, columns[_GEONAMES_NAME], columns[_GEONAMES_ASCII], country))
+        for _, name, ascii_name, country in sorted(rows, key=lambda row: -row[0]):
+            self.add(name, country, name)
+            self.add(ascii_name, country, name)
+        logger.info(f"🗺️ Gazetteer GeoNames: {len(rows)} ciudades ({self.aliases} alias en total)")
+
+    def find(self, text: str) -> List[List[Place]]:
+        """
+        Entradas del alias más largo en cada posición, sin solapes
+        Enigoj de la plej longa kromnomo ĉe ĉiu pozicio, sen interkovroj
+        """
+        tokens = _tokens(text)
+        matches: List[List[Place]] = []
+        index = 0
+        while index < len(tokens):
+            node, longest, length = self._trie, None, 0
+            for offset in range(index, len(tokens)):
+                node = node.get(tokens[offset])
+                if node is None:
+                    break
+                if _END in node:
+                    longest, length = node[_END], offset - index + 1
+            if longest:
+                matches.append(longest)
+                index += length
+            else:
+                index += 1
+        return matches
+
+    def normalize(self, location: Optional[str], is_remote: Optional[bool] = None) -> NormalizedLocation:
+        """
+        País, ciudad y política remota de un texto de ubicación
+        Lando, urbo kaj fora politiko de loka teksto
+
+        Un nombre de ciudad ambiguo se resuelve por el país mencionado en el
+        mismo texto; si el país mencionado no es ninguno de los suyos, se
+        descarta la ciudad ("Remoto en la Argentina" no es Los Ángeles).
+        """
+        if not location:
+            policy = RemotePolicy.FULL_REMOTE.value if is_remote else None
+            return NormalizedLocation(None, None, policy)
+
+        matches = self.find(location)
+        # Un código ambiguo ('CA': California o Canadá) menciona todos sus países
+        mentioned = [place.country for entries in matches for place in entries if place.city is None]
+
+        country, city = (mentioned[0] if mentioned else None), None
+        for entries in matches:
+            cities = [place for place in entries if place.city]
+            if not cities:
+                continue
+            if mentioned:
+                cities = [place for place in cities if place.country in mentioned]
+            if cities:
+                country, city = cities[0].country, cities[0].city
+                break
+
+        hits = _POLICY_MATCHER.classes(location)
+        policy = next((policy for policy in _POLICY_PRECEDENCE if policy in hits), None)
+        if policy is None and is_remote:
+            policy = RemotePolicy.FULL_REMOTE
+        return NormalizedLocation(country, city, policy.value if policy else None)
+
+    def named_place(self, text: Optional[str]) -> Optional[Place]:
+        """
+        País o ciudad que el texto nombra por completo ('España', 'nyc'), para filtros
+        Lando aŭ urbo kiun la teksto tute nomas, por filtriloj
+
+        Los alias de región no cuentan: 'California' no es 'United States'.
+        """
+        node: Optional[Dict[str, Any]] = self._trie
+        for token in _tokens(text or ''):
+            node = node.get(token)
+            if node is None:
+                return None
+        entries = [place for place in node.get(_END, []) if not place.region] if node is not self._trie else []
+        return entries[0] if entries else None
+
+
+def normalize_location(location: Optional[str], is_remote: Optional[bool] = None) -> NormalizedLocation:
+    """Atajo sobre Gazetteer.default() / Ŝparvojo super Gazetteer.default()"""
+    return Gazetteer.default().normalize(location, is_remote)
+
+
+def named_place(text: Optional[str]) -> Optional[Place]:
+    """Atajo sobre Gazetteer.default() / Ŝparvojo super Gazetteer.default()"""
+    return Gazetteer.default().named_place(text)
+
+
+# ============================================================
+# RELLENO DE FILAS EXISTENTES / PLENIGO DE EKZISTANTAJ VICOJ
+# ============================================================
+
+def backfill_locations(batch_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Rellena country/city/remote_policy de las filas que no tienen ninguno
+    Plenigas country/city/remote_policy de vicoj kiuj havas neniun
+
+    Cada par distinto (location, is_remote) se normaliza una sola vez y se
+    escribe con un UPDATE ... WHERE location = :texto ejecutado por lotes
+    (executemany).
+
+    Args:
+        batch_size: Parámetros por executemany (por defecto RECRAWL_BATCH_SIZE)
+
+    Returns:
+        Resumen: texts, resolved, rows
+    """
+    batch_size = batch_size or settings.RECRAWL_BATCH_SIZE
+    gazetteer = Gazetteer.default()
+    summary = {'texts': 0, 'resolved': 0, 'rows': 0}
+    empty = (Job.country.is_(None), Job.city.is_(None), Job.remote_policy.is_(None))
+
+    with get_db() as db:
+        pairs = db.execute(
+            select(Job.location, Job.is_remote).where(Job.location.is_not(None), *empty).distinct()
+        ).all()
+        summary['texts'] = len(pairs)
+
+        values: List[Dict[str, Any]] = []
+        for location, is_remote in pairs:
+            normalized = gazetteer.normalize(location, is_remote)
+            if any(normalized):
+                values.append({
+                    'location_text': location, 'remote_flag': is_remote,
+                    'new_country': normalized.country, 'new_city': normalized.city,
+                    'new_policy': normalized.remote_policy,
+                })
+        summary['resolved'] = len(values)
+
+        # Tabla Core: executemany por texto, no UPDATE por clave primaria del ORM
+        # Core-tabelo: executemany po teksto, ne ORM-UPDATE po ĉefŝlosilo
+        jobs = Job.__table__
+        statement = (
+            update(jobs)
+            .where(jobs.c.location == bindparam('location_text'),
+                   # is_remote puede ser NULL: '=' nunca coincidiría / is_remote povas esti NULL
+                   jobs.c.is_remote.is_not_distinct_from(bindparam('remote_flag')),
+                   jobs.c.country.is_(None), jobs.c.city.is_(None), jobs.c.remote_policy.is_(None))
+            .values(country=bindparam('new_country'), city=bindparam('new_city'),
+                    remote_policy=bindparam('new_policy'))
+        )
+        for start in range(0, len(values), batch_size):
+            result = db.execute(statement, values[start:start + batch_size])
+            summary['rows'] += max(result.rowcount, 0)
+        db.commit()
+
+    logger.info(
+        f"🗺️ Ubicaciones: {summary['resolved']}/{summary['texts']} textos resueltos, "
+        f"{summary['rows']} filas rellenadas"
+    )
+    return summary
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Rellena país, ciudad y política remota de las ofertas guardadas
+    Plenigas landon, urbon kaj foran politikon de la konservitaj ofertoj
+    """
+    parser = argparse.ArgumentParser(description="Labortrovilo - normalización de ubicaciones")
+    parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    backfill_locations()
+
+
+if __name__ == "__main__":
+    main()
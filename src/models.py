@@ -143,6 +143,15 @@ class Job(Base):
     posted_date = Column(DateTime, nullable=True, comment="Fecha de publicación original")
     date_scraped = Column(DateTime, default=datetime.utcnow, nullable=False, comment="Fecha de scraping")
     last_verified = Column(DateTime, nullable=True, comment="Última verificación de vigencia")
+    
+    # Validadores para re-fetch condicional / Validiloj por kondiĉa reakiro / Conditional re-fetch
+    http_etag = Column(String(255), nullable=True, comment="ETag de la última descarga")
+    http_last_modified = Column(String(64), nullable=True, comment="Last-Modified de la última descarga")
+    content_hash = Column(String(64), nullable=True, comment="SHA256 del contenido extraído")
+    
+    # Página cruda archivada (src/page_archive.py) / Arkivita kruda paĝo
+    raw_page_key = Column(String(64), nullable=True, index=True, comment="SHA256 de la página en el archivo")
+    raw_page_type = Column(String(10), nullable=True, comment="html o api (JSON del ATS)")
     is_active = Column(Boolean, default=True, index=True, comment="¿Oferta aún activa?")
     
     # Campos de auditoría / Kontrolkampoj / Audit fields
@@ -179,3 +188,39 @@ class Job(Base):
             'is_remote': self.is_remote,
             'date_scraped': self.date_scraped.isoformat() if self.date_scraped else None
         }
+
+
+class FrontierUrl(Base):
+    """
+    Frontera de Scraping / Skrapada Limo / Crawl Frontier
+    URLs pendientes con prioridad, lease y reintentos; sobrevive a la caída del proceso
+    """
+    __tablename__ = "crawl_frontier"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url = Column(String(500), nullable=False, unique=True, comment="URL canónica de la oferta")
+    host = Column(String(255), nullable=False, index=True, comment="Host (límites de cortesía y sharding)")
+    host_hash = Column(Integer, nullable=False, default=0, index=True, comment="CRC32 del host para sharding")
+    source = Column(String(50), nullable=True, comment="Origen: listing, discovery, manual")
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=True)
+    
+    # Planificación / Planado / Scheduling
+    priority = Column(Float, default=0.0, nullable=False, comment="Mayor = antes")
+    status = Column(String(20), default="pending", nullable=False, comment="pending, leased, done, failed")
+    attempts = Column(Integer, default=0, nullable=False, comment="Intentos de scraping")
+    not_before = Column(DateTime, nullable=True, comment="Backoff: no reintentar antes de")
+    lease_until = Column(DateTime, nullable=True, comment="Fin del lease del worker actual")
+    lease_token = Column(String(64), nullable=True, index=True, comment="Lote que tiene el lease")
+    leased_by = Column(String(100), nullable=True, comment="Worker que tiene el lease")
+    last_error = Column(Text, nullable=True)
+    
+    # Campos de auditoría / Kontrolkampoj / Audit fields
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    __table_args__ = (
+        Index('idx_frontier_ready', 'status', 'priority'),
+    )
+    
+    def __repr__(self):
+        return f"<FrontierUrl(id={self.id}, status='{self.status}', priority={self.priority}, url='{self.url}')>"
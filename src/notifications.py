@@ -5,12 +5,13 @@ Incluye el concepto de "The Golden Lead" para oportunidades excepcionales
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Set, Hashable
 from sqlalchemy import and_, or_, func
 from sqlalchemy.orm import Session
 
 from models import Job, Company, User, AlertConfig, Notification, UserRole, NotificationChannel
 from database import get_db
+from src.keyword_matcher import KeywordMatcher, SIGNAL_MATCHER, URGENCY
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -87,9 +88,13 @@ class AlertManager:
         
         logger.info(f"Procesando {len(candidate_configs)} configuraciones de candidatos")
         
+        # Una pasada por texto de cada oferta para todas las configuraciones
+        matcher = self._criteria_matcher(candidate_configs)
+        job_hits = {job.id: self._job_keyword_hits(job, matcher) for job in jobs}
+        
         for config in candidate_configs:
             for job in jobs:
-                if self._job_matches_candidate_criteria(job, config):
+                if self._job_matches_candidate_criteria(job, config, job_hits[job.id]):
                     # Verificar si ya existe notificación para este job/usuario
                     existing = self.db.query(Notification).filter(
                         and_(
@@ -130,9 +135,12 @@ class AlertManager:
         
         logger.info(f"Procesando {len(hr_configs)} configuraciones de HR")
         
+        matcher = self._criteria_matcher(hr_configs)
+        job_hits = {job.id: self._job_keyword_hits(job, matcher) for job in jobs}
+        
         for config in hr_configs:
             for job in jobs:
-                if self._job_matches_hr_criteria(job, config):
+                if self._job_matches_hr_criteria(job, config, job_hits[job.id]):
                     existing = self.db.query(Notification).filter(
                         and_(
                             Notification.user_id == config.user_id,
@@ -256,30 +264,56 @@ class AlertManager:
         
         return golden_leads
     
-    def _job_matches_candidate_criteria(self, job: Job, config: AlertConfig) -> bool:
+    @staticmethod
+    def _criteria_matcher(configs: List[AlertConfig]) -> KeywordMatcher:
+        """
+        Compila en un solo matcher las palabras de todas las configuraciones
+        
+        Clases: ('tech', config.id), ('keyword', config.id), ('modality', config.id)
+        """
+        classes: Dict[Hashable, List[str]] = {}
+        for config in configs:
+            classes[('tech', config.id)] = list(config.tech_stack or [])
+            classes[('keyword', config.id)] = list(config.keywords or [])
+            classes[('modality', config.id)] = [config.modality] if config.modality else []
+        return KeywordMatcher(classes)
+    
+    @staticmethod
+    def _job_keyword_hits(job: Job, matcher: KeywordMatcher) -> Dict[str, Set[Hashable]]:
+        """
+        Clases encontradas en el stack, el título y la descripción de una oferta
+        (una pasada por texto)
+        """
+        return {
+            'stack': matcher.classes(job.cleaned_stack),
+            'title': matcher.classes(job.title),
+            'description': matcher.classes(job.raw_description),
+        }
+    
+    def _job_matches_candidate_criteria(
+        self,
+        job: Job,
+        config: AlertConfig,
+        hits: Optional[Dict[str, Set[Hashable]]] = None
+    ) -> bool:
         """
         Verifica si un trabajo cumple los criterios de un candidato
         
         Args:
             job: Oferta de trabajo
             config: Configuración de alerta del candidato
+            hits: Resultado de _job_keyword_hits con un matcher que incluya
+                  esta configuración (si no, se calcula solo para ella)
             
         Returns:
             True si el trabajo coincide con los criterios
         """
-        # Tech Stack
-        if config.tech_stack:
-            job_stack = job.cleaned_stack or ""
-            job_stack_lower = job_stack.lower()
-            
-            # Verificar si alguna tecnología del filtro está en el stack del job
-            tech_match = any(
-                tech.lower() in job_stack_lower 
-                for tech in config.tech_stack
-            )
-            
-            if not tech_match:
-                return False
+        if hits is None:
+            hits = self._job_keyword_hits(job, self._criteria_matcher([config]))
+        
+        # Tech Stack: alguna tecnología del filtro está en el stack del job
+        if config.tech_stack and ('tech', config.id) not in hits['stack']:
+            return False
         
         # Rango salarial
         if config.salary_min and job.salary_max:
@@ -291,52 +325,39 @@ class AlertManager:
                 return False
         
         # Keywords en título o descripción
-        if config.keywords:
-            text_to_search = f"{job.title} {job.raw_description or ''}".lower()
-            keyword_match = any(
-                keyword.lower() in text_to_search
-                for keyword in config.keywords
-            )
-            
-            if not keyword_match:
-                return False
+        if config.keywords and not (
+            ('keyword', config.id) in hits['title'] or ('keyword', config.id) in hits['description']
+        ):
+            return False
         
         # Modalidad
-        if config.modality:
-            job_description = (job.raw_description or "").lower()
-            if config.modality.lower() not in job_description:
-                return False
+        if config.modality and ('modality', config.id) not in hits['description']:
+            return False
         
         return True
     
-    def _job_matches_hr_criteria(self, job: Job, config: AlertConfig) -> bool:
+    def _job_matches_hr_criteria(
+        self,
+        job: Job,
+        config: AlertConfig,
+        hits: Optional[Dict[str, Set[Hashable]]] = None
+    ) -> bool:
         """
         Verifica si un trabajo es relevante para un HR professional
         Similar a candidatos pero con enfoque diferente
         """
+        if hits is None:
+            hits = self._job_keyword_hits(job, self._criteria_matcher([config]))
+        
         # HR puede estar interesado en tecnologías específicas para reclutamiento
-        if config.tech_stack:
-            job_stack = job.cleaned_stack or ""
-            job_stack_lower = job_stack.lower()
-            
-            tech_match = any(
-                tech.lower() in job_stack_lower 
-                for tech in config.tech_stack
-            )
-            
-            if not tech_match:
-                return False
+        if config.tech_stack and ('tech', config.id) not in hits['stack']:
+            return False
         
         # Keywords relevantes
-        if config.keywords:
-            text_to_search = f"{job.title} {job.raw_description or ''}".lower()
-            keyword_match = any(
-                keyword.lower() in text_to_search
-                for keyword in config.keywords
-            )
-            
-            if not keyword_match:
-                return False
+        if config.keywords and not (
+            ('keyword', config.id) in hits['title'] or ('keyword', config.id) in hits['description']
+        ):
+            return False
         
         return True
     
@@ -358,10 +379,8 @@ class AlertManager:
             elif days_old < 3:
                 score += 0.1
         
-        # Factor 2: Palabras clave de urgencia en descripción
-        urgency_keywords = ['urgente', 'inmediato', 'asap', 'immediate', 'urgent']
-        description = (job.raw_description or "").lower()
-        if any(keyword in description for keyword in urgency_keywords):
+        # Factor 2: Palabras clave de urgencia en descripción (mismas que el scraper)
+        if URGENCY in SIGNAL_MATCHER.classes(job.raw_description):
             score += 0.2
         
         # Factor 3: Salario alto (indica posición importante)
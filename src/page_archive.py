@@ -0,0 +1,184 @@
+"""
+Archivo de Páginas Crudas / Arkivo de Krudaj Paĝoj
+Senior Data Engineer Architecture - Content-addressed raw page store
+
+Solo se guardaba la descripción extraída, así que corregir un extractor
+obligaba a volver a crawlear la web. Cada página descargada (HTML o JSON de la
+API del ATS) se guarda comprimida en disco bajo su SHA256
+(data/pages/ab/cd/<hash>.zst o .gz) y la fila de jobs guarda la clave. Páginas
+idénticas comparten blob. Al superar PAGE_ARCHIVE_MAX_MB se borran los blobs
+menos usados recientemente y se limpian sus referencias.
+
+zstd se usa si el paquete opcional zstandard está instalado; si no, gzip.
+"""
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Optional, List, Tuple
+
+from sqlalchemy import update
+
+from src.database import get_db
+from src.models import Job
+from config import settings
+
+try:
+    import zstandard
+except ImportError:  # Dependencia opcional / Nedeviga dependeco
+    zstandard = None
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Tipos de página / Paĝaj tipoj
+PAGE_HTML = 'html'
+PAGE_API = 'api'
+
+_MB = 1024 * 1024
+# Tras la limpieza el archivo queda en esta fracción del máximo / Post purigo
+_RETENTION_TARGET = 0.9
+# Claves por UPDATE al limpiar referencias / Ŝlosiloj po UPDATE
+_UPDATE_CHUNK = 10_000
+
+
+def page_key(content: str) -> str:
+    """Clave de contenido: SHA256 del texto / Enhava ŝlosilo: SHA256 de la teksto"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class PageArchive:
+    """
+    Almacén de páginas direccionado por contenido
+    Enhav-adresita paĝa tenejo
+
+    Uso / Uzo / Usage:
+        archive = PageArchive()
+        key = archive.put(html)     # Comprime y guarda (idempotente)
+        html = archive.get(key)     # None si la retención lo borró
+        archive.enforce_retention()
+    """
+
+    def __init__(self, root: Optional[str] = None, max_mb: Optional[float] = None):
+        """
+        Args:
+            root: Directorio del archivo (por defecto PAGE_ARCHIVE_DIR)
+            max_mb: Tamaño máximo en MB (por defecto PAGE_ARCHIVE_MAX_MB)
+        """
+        self.root = root or settings.PAGE_ARCHIVE_DIR
+        self.max_bytes = int((settings.PAGE_ARCHIVE_MAX_MB if max_mb is None else max_mb) * _MB)
+        self.extension = '.zst' if zstandard is not None else '.gz'
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:4], key + extension)
+
+    def _compress(self, data: bytes) -> bytes:
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=settings.PAGE_ARCHIVE_COMPRESSION_LEVEL).compress(data)
+        return gzip.compress(data, compresslevel=min(9, settings.PAGE_ARCHIVE_COMPRESSION_LEVEL))
+
+    def put(self, content: str) -> str:
+        """
+        Guarda una página y devuelve su clave / Konservas paĝon kaj redonas ĝian ŝlosilon
+
+        Si el blob ya existe solo se actualiza su fecha de uso (retención LRU).
+        """
+        key = page_key(content)
+        for extension in ('.zst', '.gz'):
+            try:
+                os.utime(self._path(key, extension))
+                return key
+            except FileNotFoundError:
+                continue  # No existe o la retención lo acaba de borrar
+
+        path = self._path(key, self.extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Temporal único por llamada: dos hilos pueden guardar la misma página
+        # Unika provizora dosiero po voko: du fadenoj povas konservi la saman paĝon
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._compress(content.encode('utf-8')))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return key
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Lee una página archivada / Legas arkivitan paĝon
+
+        Returns:
+            El texto original, o None si no está en el archivo
+        """
+        for extension in ('.zst', '.gz'):
+            path = self._path(key, extension)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if extension == '.gz':
+                return gzip.decompress(data).decode('utf-8')
+            if zstandard is None:
+                logger.warning(f"⚠️ {path} requiere el paquete zstandard")
+                return None
+            return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+        return None
+
+    def _blobs(self) -> List[Tuple[float, int, str]]:
+        blobs = []
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith(('.zst', '.gz')):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, path))
+        return blobs
+
+    def enforce_retention(self) -> int:
+        """
+        Borra los blobs menos usados si el archivo supera su tamaño máximo
+        Forigas la malplej uzatajn blobojn se la arkivo superas sian maksimumon
+
+        Las filas de jobs que apuntaban a ellos quedan sin página archivada.
+
+        Returns:
+            Número de blobs borrados
+        """
+        if not self.max_bytes:
+            return 0
+        blobs = self._blobs()
+        total = sum(size for _, size, _ in blobs)
+        if total <= self.max_bytes:
+            return 0
+
+        target = self.max_bytes * _RETENTION_TARGET
+        removed: List[str] = []
+        for _, size, path in sorted(blobs):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed.append(os.path.basename(path).split('.')[0])
+
+        with get_db() as db:
+            for start in range(0, len(removed), _UPDATE_CHUNK):
+                db.execute(
+                    update(Job).where(Job.raw_page_key.in_(removed[start:start + _UPDATE_CHUNK]))
+                    .values(raw_page_key=None, raw_page_type=None)
+                )
+            db.commit()
+
+        logger.info(f"🗄️ Retención del archivo de páginas: {len(removed)} blobs borrados ({total / _MB:.0f} MB)")
+        return len(removed)
@@ -5,11 +5,12 @@ Permite acceso sin autenticación con funcionalidad limitada
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, or_
+from sqlalchemy import func, desc, or_, and_
 from pydantic import BaseModel
 
 from src.dependencies import get_db_session, pagination_params, PaginationParams
-from models import Job, Company
+from src.location_normalizer import named_place
+from src.models import Job
 
 router = APIRouter(prefix="/public", tags=["Public Board"])
 
@@ -118,7 +119,15 @@ def get_public_jobs(
         query = query.filter(Job.tech_stack.contains(tech))
     
     if location:
-        query = query.filter(Job.location.ilike(f"%{location}%"))
+        # País/ciudad normalizados (columnas indexadas) si el filtro nombra uno;
+        # si no, ILIKE sobre el texto libre
+        place = named_place(location)
+        if place and place.city:
+            query = query.filter(and_(Job.country == place.country, Job.city == place.city))
+        elif place:
+            query = query.filter(Job.country == place.country)
+        else:
+            query = query.filter(Job.location.ilike(f"%{location}%"))
     
     if modality:
         query = query.filter(Job.modality.ilike(f"%{modality}%"))
@@ -0,0 +1,139 @@
+"""
+Limitador de Cortesía por Host / Ĝentileca Limigilo po Gastiganto
+Senior Data Engineer Architecture - Per-host token-bucket politeness limiter
+
+Cada host (boards.greenhouse.io, jobs.lever.co, acme.wd5.myworkdayjobs.com, ...)
+tiene su propio bucket, así que un lote que mezcla ATS avanza a la suma de las
+tasas por host en lugar de a la tasa global más lenta.
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _HostBucket:
+    """
+    Estado del token bucket de un host / Stato de la ĵetona sitelo de gastiganto
+    """
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.wait_seconds = 0.0
+        self.requests = 0
+
+
+class HostRateLimiter:
+    """
+    Token bucket por host con retardo aleatorio entre REQUEST_DELAY_MIN y REQUEST_DELAY_MAX
+    Ĵetona sitelo po gastiganto kun hazarda prokrasto inter REQUEST_DELAY_MIN kaj REQUEST_DELAY_MAX
+
+    Uso / Uzo / Usage:
+        limiter = HostRateLimiter()
+        await limiter.acquire(url)  # Espera hasta que el host tenga presupuesto
+    """
+
+    def __init__(
+        self,
+        delay_min: Optional[float] = None,
+        delay_max: Optional[float] = None,
+        crawl_delays: Optional[Dict[str, float]] = None,
+        burst: float = 1.0
+    ):
+        """
+        Args:
+            delay_min: Segundos mínimos entre requests al mismo host
+            delay_max: Segundos máximos entre requests al mismo host
+            crawl_delays: Overrides de crawl-delay por host (ej: desde robots.txt)
+            burst: Requests que un host ocioso puede hacer sin esperar
+        """
+        self.delay_min = settings.REQUEST_DELAY_MIN if delay_min is None else delay_min
+        self.delay_max = settings.REQUEST_DELAY_MAX if delay_max is None else delay_max
+        if self.delay_max < self.delay_min:
+            self.delay_max = self.delay_min
+
+        self.crawl_delays: Dict[str, float] = {
+            host.lower(): delay
+            for host, delay in (settings.CRAWL_DELAY_OVERRIDES if crawl_delays is None else crawl_delays).items()
+        }
+        self.burst = max(1.0, burst)
+        self._buckets: Dict[str, _HostBucket] = {}
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        """Obtiene la clave de host de una URL / Akiras la gastigantan ŝlosilon de URL"""
+        return urlparse(url).netloc.lower()
+
+    def set_crawl_delay(self, host: str, delay: float):
+        """
+        Fija un crawl-delay explícito para un host / Fiksas eksplicitan crawl-delay por gastiganto
+        """
+        self.crawl_delays[host.lower()] = delay
+        logger.info(f"⏱️ Crawl-delay para {host}: {delay}s")
+
+    def _delay_for(self, host: str) -> float:
+        """Segundos entre requests para el host / Sekundoj inter petoj por la gastiganto"""
+        if host in self.crawl_delays:
+            return self.crawl_delays[host]
+        return random.uniform(self.delay_min, self.delay_max)
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _HostBucket(self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> float:
+        """
+        Espera hasta que el host de la URL tenga un token disponible
+        Atendas ĝis la gastiganto de la URL havas disponeblan ĵetonon
+
+        Returns:
+            Segundos esperados por esta petición
+        """
+        host = self.host_for(url)
+        bucket = self._bucket(host)
+
+        async with bucket.lock:
+            delay = self._delay_for(host)
+            waited = 0.0
+
+            if delay > 0:
+                rate = 1.0 / delay
+                now = time.monotonic()
+                bucket.tokens = min(bucket.capacity, bucket.tokens + (now - bucket.updated_at) * rate)
+                bucket.updated_at = now
+
+                if bucket.tokens < 1.0:
+                    waited = (1.0 - bucket.tokens) / rate
+                    logger.debug(f"⏳ Esperando {waited:.2f}s por {host}")
+                    await asyncio.sleep(waited)
+                    bucket.tokens = 1.0
+                    bucket.updated_at = time.monotonic()
+
+                bucket.tokens -= 1.0
+
+            bucket.wait_seconds += waited
+            bucket.requests += 1
+            return waited
+
+    def wait_stats(self) -> Dict[str, float]:
+        """
+        Segundos totales esperados por host / Totalaj sekundoj atenditaj po gastiganto
+        """
+        return {host: round(bucket.wait_seconds, 3) for host, bucket in self._buckets.items()}
+
+    def request_counts(self) -> Dict[str, int]:
+        """Requests autorizados por host / Permesitaj petoj po gastiganto"""
+        return {host: bucket.requests for host, bucket in self._buckets.items()}
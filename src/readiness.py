@@ -0,0 +1,87 @@
+"""
+Estrategia de Disponibilidad de Página / Strategio de Paĝa Preteco
+Senior Data Engineer Architecture - Adaptive page-readiness strategy
+
+En lugar de esperar siempre a 'networkidle' (hasta 10 s en sitios con mucha
+analítica), se espera al selector de contenido clave del ATS y solo se usa
+'networkidle' para plataformas desconocidas o si el selector no aparece.
+"""
+import logging
+import time
+from typing import Optional, Dict, Tuple
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
+
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Límites superiores de los buckets del histograma (segundos)
+# Supraj limoj de la histogramaj siteloj (sekundoj)
+READY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def bucket_label(seconds: float) -> str:
+    """
+    Etiqueta del bucket del histograma para una duración
+    Etikedo de la histograma sitelo por daŭro
+    """
+    for limit in READY_BUCKETS:
+        if seconds <= limit:
+            return f"<={limit}s"
+    return f">{READY_BUCKETS[-1]}s"
+
+
+async def wait_until_ready(page: Page, ready_selector: Optional[str]) -> Tuple[str, float]:
+    """
+    Espera hasta que la página tenga el contenido necesario
+    Atendas ĝis la paĝo havas la necesan enhavon
+
+    Args:
+        page: Página ya navegada (domcontentloaded)
+        ready_selector: Selector de contenido clave del ATS, o None si es desconocido
+
+    Returns:
+        (estrategia usada, segundos hasta estar lista)
+        Estrategias: selector, networkidle, selector_fallback, networkidle_timeout
+    """
+    start = time.monotonic()
+    strategy = 'networkidle'
+
+    if ready_selector:
+        try:
+            await page.wait_for_selector(
+                ready_selector,
+                state='attached',
+                timeout=settings.READY_SELECTOR_TIMEOUT
+            )
+            return 'selector', time.monotonic() - start
+        except PlaywrightTimeout:
+            logger.debug(f"Selector de disponibilidad no encontrado: {ready_selector}")
+            strategy = 'selector_fallback'
+
+    try:
+        await page.wait_for_load_state('networkidle', timeout=settings.NETWORKIDLE_TIMEOUT)
+    except PlaywrightTimeout:
+        # Extraer igualmente lo que haya en el DOM / Ekstrakti tamen kion ajn la DOM havas
+        strategy = 'networkidle_timeout'
+
+    return strategy, time.monotonic() - start
+
+
+def record_readiness(
+    histograms: Dict[str, Dict[str, int]],
+    strategies: Dict[str, int],
+    platform: str,
+    strategy: str,
+    seconds: float
+):
+    """
+    Acumula el tiempo hasta disponibilidad en el histograma de la plataforma
+    Akumulas la tempon ĝis preteco en la histogramo de la platformo
+    """
+    histogram = histograms.setdefault(platform, {})
+    label = bucket_label(seconds)
+    histogram[label] = histogram.get(label, 0) + 1
+    strategies[strategy] = strategies.get(strategy, 0) + 1
@@ -0,0 +1,288 @@
+"""
+Re-verificación de Ofertas Conocidas / Rekontrolo de Konataj Ofertoj
+Senior Data Engineer Architecture - Conditional re-fetch and change detection
+
+Las URLs ya guardadas se descartan como duplicadas, así que last_verified,
+is_active y las descripciones editadas nunca se refrescaban. Este modo envía
+peticiones condicionales (If-None-Match / If-Modified-Since) y compara el hash
+del contenido extraído: solo se reescriben las filas que cambiaron, y solo las
+que cambiaron de descripción vuelven a la cola de enriquecimiento con IA.
+"""
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+
+import httpx
+from sqlalchemy import select, update, or_
+
+from src.database import get_db
+from src.models import Job
+from src.schemas import ScrapingStats
+from src.extractors import get_extractor
+from src.job_writer import BufferedJobWriter, job_row, content_hash, CONTENT_HASH_FIELDS
+from src.page_archive import PageArchive, PAGE_API, PAGE_HTML
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Columnas que se reescriben cuando el contenido cambia / Kolumnoj reskribataj kiam la enhavo ŝanĝiĝas
+CHANGED_COLUMNS = (
+    'title', 'description', 'raw_description', 'location', 'is_remote',
+    'remote_policy', 'country', 'city',
+    'salary_range', 'salary_min', 'salary_max', 'salary_currency',
+    'hiring_urgency_score', 'is_it_niche', 'content_hash',
+)
+
+
+def description_hash(text: Optional[str]) -> str:
+    """Mismo hash que AIJobProcessor._compute_hash / Sama haketo kiel AIJobProcessor._compute_hash"""
+    return hashlib.sha256((text or "").encode('utf-8')).hexdigest()
+
+
+class JobRecrawler:
+    """
+    Re-verifica ofertas guardadas reutilizando los niveles del scraper
+    Rekontrolas konservitajn ofertojn reuzante la nivelojn de la skrapilo
+
+    Uso / Uzo / Usage:
+        scraper = LabortroviloScraper()
+        summary = await JobRecrawler(scraper).run(limit=500)
+    """
+
+    def __init__(self, scraper):
+        """
+        Args:
+            scraper: LabortroviloScraper (cliente httpx, fetchers, limitador y
+                     _build_job_data). Si tiene navegador inicializado se usa
+                     para las páginas que requieren JavaScript.
+        """
+        self.scraper = scraper
+        self.stats = ScrapingStats(start_time=datetime.utcnow())
+        self.page_archive: Optional[PageArchive] = scraper.page_archive
+        # Una sola página compartida: la ruta con navegador va de una en una
+        # Unu komuna paĝo: la retumila vojo iras po unu / One shared page, one check at a time
+        self._browser_lock = asyncio.Lock()
+        self.summary: Dict[str, int] = {
+            'checked': 0, 'not_modified': 0, 'unchanged': 0, 'changed': 0,
+            'expired': 0, 'needs_js': 0, 'errors': 0, 'requeued_ai': 0,
+        }
+
+    def _load_batch(self, limit: int, after_id: int) -> List[Dict[str, Any]]:
+        cutoff = datetime.utcnow() - timedelta(hours=settings.RECRAWL_STALE_HOURS)
+        columns = [
+            Job.id, Job.url, Job.http_etag, Job.http_last_modified, Job.content_hash,
+            Job.description_hash, Job.ai_processed,
+        ] + [getattr(Job, field) for field in CONTENT_HASH_FIELDS]
+
+        with get_db() as db:
+            rows = db.execute(
+                select(*columns)
+                .where(
+                    Job.is_active == True,
+                    Job.id > after_id,
+                    or_(Job.last_verified.is_(None), Job.last_verified < cutoff)
+                )
+                .order_by(Job.id)
+                .limit(limit)
+            ).all()
+        return [dict(row._mapping) for row in rows]
+
+    async def _fetch(self, job: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Re-descarga una oferta con petición condicional
+        Re-elŝutas oferton per kondiĉa peto
+
+        Returns:
+            (resultado, valores a escribir); resultado en
+            not_modified, unchanged, changed, expired, needs_js, error
+        """
+        scraper = self.scraper
+        url = job['url']
+        platform = scraper._detect_source_platform(url)
+        await scraper.rate_limiter.acquire(url)
+
+        resolved = scraper.api_fetcher.api_url_for(url) if scraper.api_fetcher else None
+        headers = {'Accept': 'application/json' if resolved else 'text/html,application/xhtml+xml'}
+        if job['http_etag']:
+            headers['If-None-Match'] = job['http_etag']
+        if job['http_last_modified']:
+            headers['If-Modified-Since'] = job['http_last_modified']
+
+        try:
+            response = await scraper.http_client.get(resolved[1] if resolved else url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.debug(f"Error re-descargando {url}: {e}")
+            return 'error', {}
+
+        validators = {
+            'http_etag': response.headers.get('etag') or job['http_etag'],
+            'http_last_modified': response.headers.get('last-modified') or job['http_last_modified'],
+        }
+        if response.status_code == 304:
+            return 'not_modified', validators
+        if response.status_code in (404, 410):
+            return 'expired', {}
+        if response.status_code != 200:
+            return 'error', {}
+
+        fields = None
+        if resolved:
+            try:
+                fields = scraper.api_fetcher.parse_payload(resolved[0], response.json(), resolved[2])
+            except ValueError:
+                fields = None
+        elif scraper.static_fetcher:
+            fields, _ = scraper.static_fetcher.extract(response.text, get_extractor(platform))
+
+        if fields:
+            fields['raw_page'] = (PAGE_API if resolved else PAGE_HTML, response.text)
+            job_data = scraper._build_job_data(url, platform, fields, self.stats)
+        elif scraper.page is not None:
+            # Página renderizada con JavaScript / Paĝo bildigita per JavaScript
+            async with self._browser_lock:
+                page = scraper.page
+                if await scraper.navigate_to_url(url, page=page):
+                    job_data = await scraper.extract_job_data(url, page=page, stats=self.stats)
+                else:
+                    job_data = None
+        else:
+            # Requiere JavaScript y no hay navegador: no es un error de la oferta
+            # Bezonas JavaScript kaj mankas retumilo: ne estas eraro de la oferto
+            return 'needs_js', {}
+
+        validated = BufferedJobWriter.validate(job_data) if job_data else None
+        if validated is None:
+            return 'error', {}
+
+        row = job_row(validated, None, datetime.utcnow())
+        previous_hash = job['content_hash'] or content_hash(job)
+        if row['content_hash'] == previous_hash:
+            return 'unchanged', validators
+
+        values = {column: row[column] for column in CHANGED_COLUMNS}
+        values.update(validators)
+        raw_page = job_data.get('raw_page')
+        if raw_page and self.page_archive:
+            values['raw_page_type'] = raw_page[0]
+            values['raw_page_key'] = await asyncio.to_thread(self.page_archive.put, raw_page[1])
+        values['ai_processed'] = bool(job['ai_processed']) and (
+            job['description_hash'] is None or job['description_hash'] == description_hash(row['description'])
+        )
+        return 'changed', values
+
+    def _apply(self, results: List[Tuple[Dict[str, Any], str, Dict[str, Any]]]):
+        """
+        Escribe los resultados del lote en una transacción
+        Skribas la rezultojn de la aro en unu transakcio
+        """
+        now = datetime.utcnow()
+        unchanged, changed, expired, needs_js, errors = [], [], [], [], []
+
+        for job, outcome, values in results:
+            self.summary[outcome if outcome != 'error' else 'errors'] += 1
+            if outcome in ('not_modified', 'unchanged'):
+                unchanged.append({
+                    'id': job['id'],
+                    'last_verified': now,
+                    'content_hash': job['content_hash'] or content_hash(job),
+                    **values,
+                })
+            elif outcome == 'changed':
+                if job['ai_processed'] and not values['ai_processed']:
+                    self.summary['requeued_ai'] += 1
+                changed.append({'id': job['id'], 'last_verified': now, 'updated_at': now, **values})
+            elif outcome == 'expired':
+                expired.append(job['id'])
+            elif outcome == 'needs_js':
+                needs_js.append(job['id'])
+            else:
+                errors.append(job['id'])
+
+        with get_db() as db:
+            if unchanged:
+                db.execute(update(Job), unchanged)
+            if changed:
+                db.execute(update(Job), changed)
+            if expired:
+                db.execute(
+                    update(Job).where(Job.id.in_(expired))
+                    .values(is_active=False, last_verified=now, updated_at=now)
+                )
+            if needs_js:
+                db.execute(update(Job).where(Job.id.in_(needs_js)).values(last_verified=now))
+            if errors:
+                db.execute(
+                    update(Job).where(Job.id.in_(errors))
+                    .values(scraping_errors=Job.scraping_errors + 1)
+                )
+            db.commit()
+
+    async def run(self, limit: Optional[int] = None, concurrency: Optional[int] = None) -> Dict[str, int]:
+        """
+        Re-verifica las ofertas activas no verificadas en RECRAWL_STALE_HOURS
+        Rekontrolas la aktivajn ofertojn ne kontrolitajn en RECRAWL_STALE_HOURS
+
+        Args:
+            limit: Máximo de ofertas a revisar (por defecto todas las pendientes)
+            concurrency: Peticiones en paralelo (por defecto SCRAPER_CONCURRENCY)
+
+        Returns:
+            Resumen: checked, not_modified, unchanged, changed, expired, needs_js, errors, requeued_ai
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.SCRAPER_CONCURRENCY)
+        remaining = limit
+        after_id = 0
+
+        async def check(job):
+            async with semaphore:
+                try:
+                    outcome, values = await self._fetch(job)
+                except Exception as e:
+                    logger.error(f"✗ Error re-verificando {job['url']}: {e}")
+                    outcome, values = 'error', {}
+                return job, outcome, values
+
+        logger.info("🔁 Iniciando re-verificación de ofertas conocidas...")
+        while remaining is None or remaining > 0:
+            size = settings.RECRAWL_BATCH_SIZE if remaining is None else min(remaining, settings.RECRAWL_BATCH_SIZE)
+            batch = await asyncio.to_thread(self._load_batch, size, after_id)
+            if not batch:
+                break
+
+            after_id = batch[-1]['id']
+            self.summary['checked'] += len(batch)
+            if remaining is not None:
+                remaining -= len(batch)
+
+            results = await asyncio.gather(*(check(job) for job in batch))
+            await asyncio.to_thread(self._apply, results)
+            logger.info(f"   Lote re-verificado: {len(batch)} ofertas (hasta id {after_id})")
+
+        logger.info(f"📊 Re-verificación: {self.summary}")
+        return self.summary
+
+
+async def main():
+    """
+    Ejecuta una re-verificación; con RECRAWL_BROWSER_FALLBACK abre Playwright
+    para las ofertas que requieren JavaScript (si no, quedan como needs_js)
+    Plenumas rekontrolon; kun RECRAWL_BROWSER_FALLBACK malfermas Playwright
+    """
+    from src.scraper_engine import LabortroviloScraper
+    from src.database import init_db
+
+    init_db()  # Añade columnas nuevas a una BD existente / Aldonas novajn kolumnojn
+    scraper = LabortroviloScraper()
+    try:
+        if settings.RECRAWL_BROWSER_FALLBACK:
+            await scraper.initialize()
+        await JobRecrawler(scraper).run()
+    finally:
+        await scraper.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,232 @@
+"""
+Re-extracción Offline sobre Páginas Archivadas / Eksterreta Re-ekstraktado
+Senior Data Engineer Architecture - Offline re-extraction with a process pool
+
+Con las páginas crudas en el archivo (src/page_archive.py) una corrección de
+extractor o un campo nuevo no exige volver a crawlear: este comando vuelve a
+pasar cada página archivada por la misma lógica del scraper (extractor del ATS
+o parser de la API, _build_job_data con urgencia y nicho) en un
+ProcessPoolExecutor, sin Playwright ni red, y reescribe en bloque solo las
+filas que cambiaron.
+
+Uso / Uzo / Usage:
+    python -m src.reextractor [--processes N] [--limit M]
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+from sqlalchemy import select, update
+
+from src.database import get_db, init_db
+from src.models import Job
+from src.schemas import ScrapingStats
+from src.extractors import get_extractor
+from src.job_writer import BufferedJobWriter, job_row
+from src.page_archive import PageArchive, PAGE_API
+from src.recrawler import description_hash, CHANGED_COLUMNS
+from src.url_canonicalizer import detect_source_platform
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Páginas por tarea enviada a cada proceso / Paĝoj po tasko sendita al ĉiu procezo
+_CHUNKSIZE = 64
+
+# Estado por proceso worker (initializer) / Stato po laborista procezo
+_archive: Optional[PageArchive] = None
+_api_fetcher = None
+_scraper_cls = None
+
+
+def _init_worker(archive_root: str):
+    global _archive, _api_fetcher, _scraper_cls
+    from src.ats_api import ATSApiFetcher
+    from src.scraper_engine import LabortroviloScraper
+
+    # Sin un log por oferta en los workers / Sen protokolo po oferto en la laboristoj
+    logging.getLogger('src.scraper_engine').setLevel(logging.WARNING)
+    logging.getLogger('src.extractors').setLevel(logging.WARNING)
+    _archive = PageArchive(root=archive_root)
+    _api_fetcher = ATSApiFetcher()
+    _scraper_cls = LabortroviloScraper
+
+
+def reextract_page(task: Tuple[Dict[str, Any], str]) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Re-extrae una página archivada en un proceso worker
+    Re-ekstraktas arkivitan paĝon en laborista procezo
+
+    Args:
+        task: (fila con id, url, raw_page_key, raw_page_type, posted_date,
+               date_scraped; raíz del archivo)
+
+    Returns:
+        (resultado, valores de CHANGED_COLUMNS, ruta de extracción);
+        resultado en ok, missing, error
+    """
+    row, archive_root = task
+    if _archive is None:
+        _init_worker(archive_root)
+
+    content = _archive.get(row['raw_page_key'])
+    if content is None:
+        return 'missing', None, None
+
+    url = row['url']
+    platform = detect_source_platform(url)
+    try:
+        if row['raw_page_type'] == PAGE_API:
+            resolved = _api_fetcher.api_url_for(url)
+            fields = _api_fetcher.parse_payload(resolved[0], json.loads(content), resolved[2]) if resolved else None
+        else:
+            fields = get_extractor(platform).extract_html(content)
+    except Exception as e:
+        logger.debug(f"Error re-extrayendo {url}: {e}")
+        return 'error', None, None
+    if not fields or not fields.get('title'):
+        return 'error', None, None
+
+    # Fechas originales: la urgencia se calcula respecto al scraping real
+    # Originalaj datoj: la urĝeco kalkuliĝas rilate al la reala skrapado
+    fields['posted_date'] = fields.get('posted_date') or row['posted_date']
+    stats = ScrapingStats(start_time=datetime.utcnow())
+    job_data = _scraper_cls._build_job_data(url, platform, fields, stats, scraped_at=row['date_scraped'])
+
+    validated = BufferedJobWriter.validate(job_data)
+    if validated is None:
+        return 'error', None, None
+    new_row = job_row(validated, None, row['date_scraped'])
+    return 'ok', {column: new_row[column] for column in CHANGED_COLUMNS}, fields['extraction_path']
+
+
+class PageReextractor:
+    """
+    Re-extrae en paralelo todas las ofertas con página archivada
+    Paralele re-ekstraktas ĉiujn ofertojn kun arkivita paĝo
+
+    Uso / Uzo / Usage:
+        summary = PageReextractor(processes=8).run()
+    """
+
+    def __init__(self, processes: Optional[int] = None, batch_size: Optional[int] = None):
+        """
+        Args:
+            processes: Procesos del pool (por defecto uno por CPU)
+            batch_size: Filas leídas y escritas por lote (por defecto REEXTRACT_BATCH_SIZE)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.batch_size = batch_size or settings.REEXTRACT_BATCH_SIZE
+        self.archive = PageArchive()
+        self.extraction_paths: Dict[str, int] = {}
+        self.summary: Dict[str, int] = {
+            'checked': 0, 'changed': 0, 'unchanged': 0, 'missing': 0, 'errors': 0, 'requeued_ai': 0,
+        }
+
+    def _load_batch(self, after_id: int, limit: int) -> List[Dict[str, Any]]:
+        columns = [
+            Job.id, Job.url, Job.raw_page_key, Job.raw_page_type, Job.posted_date, Job.date_scraped,
+            Job.description_hash, Job.ai_processed,
+        ] + [getattr(Job, column) for column in CHANGED_COLUMNS]
+        with get_db() as db:
+            rows = db.execute(
+                select(*columns)
+                .where(Job.raw_page_key.is_not(None), Job.id > after_id)
+                .order_by(Job.id)
+                .limit(limit)
+            ).all()
+        return [dict(row._mapping) for row in rows]
+
+    def _apply(self, changed: List[Dict[str, Any]]):
+        """Reescribe las filas cambiadas en bloque / Reskribas la ŝanĝitajn vicojn amase"""
+        if not changed:
+            return
+        with get_db() as db:
+            db.execute(update(Job), changed)
+            db.commit()
+
+    def run(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Recorre el archivo por lotes de id / Trairas la arkivon po id-aroj
+
+        Args:
+            limit: Máximo de ofertas a revisar (por defecto todas)
+
+        Returns:
+            Resumen: checked, changed, unchanged, missing, errors, requeued_ai
+        """
+        after_id = 0
+        started = datetime.utcnow()
+        logger.info(f"🔁 Re-extracción offline con {self.processes} procesos...")
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.archive.root,)
+        ) as pool:
+            while limit is None or self.summary['checked'] < limit:
+                size = self.batch_size if limit is None else min(self.batch_size, limit - self.summary['checked'])
+                batch = self._load_batch(after_id, size)
+                if not batch:
+                    break
+                after_id = batch[-1]['id']
+                self.summary['checked'] += len(batch)
+
+                tasks = [(row, self.archive.root) for row in batch]
+                changed: List[Dict[str, Any]] = []
+                for row, (outcome, values, path) in zip(batch, pool.map(reextract_page, tasks, chunksize=_CHUNKSIZE)):
+                    if outcome != 'ok':
+                        self.summary['missing' if outcome == 'missing' else 'errors'] += 1
+                        continue
+                    self.extraction_paths[path] = self.extraction_paths.get(path, 0) + 1
+                    if all(values[column] == row[column] for column in CHANGED_COLUMNS):
+                        self.summary['unchanged'] += 1
+                        continue
+
+                    # Solo una descripción nueva vuelve a la cola de IA / Nur nova priskribo revenas al la AI-vico
+                    values['ai_processed'] = bool(row['ai_processed']) and (
+                        row['description_hash'] is None
+                        or row['description_hash'] == description_hash(values['description'])
+                    )
+                    if row['ai_processed'] and not values['ai_processed']:
+                        self.summary['requeued_ai'] += 1
+                    changed.append({'id': row['id'], 'updated_at': datetime.utcnow(), **values})
+
+                self._apply(changed)
+                self.summary['changed'] += len(changed)
+                logger.info(f"   Lote re-extraído: {len(batch)} ofertas, {len(changed)} cambiadas (hasta id {after_id})")
+
+        elapsed = (datetime.utcnow() - started).total_seconds()
+        logger.info(f"📊 Re-extracción: {self.summary} en {elapsed:.1f}s")
+        for path, count in sorted(self.extraction_paths.items()):
+            logger.info(f"   Extracción {path}: {count}")
+        return self.summary
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Ejecuta la re-extracción offline / Rulas la eksterretan re-ekstraktadon
+    """
+    parser = argparse.ArgumentParser(description="Labortrovilo - re-extracción offline de páginas archivadas")
+    parser.add_argument('--processes', type=int, default=None, help="Procesos del pool (por defecto CPUs)")
+    parser.add_argument('--limit', type=int, default=None, help="Máximo de ofertas a revisar")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    init_db()
+    PageReextractor(processes=args.processes).run(limit=args.limit)
+
+
+if __name__ == "__main__":
+    main()
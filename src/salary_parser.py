@@ -0,0 +1,420 @@
+"""
+Parser de Salarios / Salajra Analizilo
+Senior Data Engineer Architecture - Structured salary parsing
+
+Solo se guardaba el texto de salary_range, así que salary_min/salary_max
+quedaban en NULL y los filtros por salario (get_jobs, alertas, Golden Leads)
+casi nunca coincidían. Aquí un conjunto de patrones compilados reconoce
+rangos y valores sueltos como:
+
+    $120k–$180k · USD 90,000 - 110,000/yr · €45.000 - €55.000
+    ARS 1.500.000 - 2.000.000 por mes · R$ 8.000 a 12.000 · $45-60/hr
+
+parse_salary devuelve el importe anualizado (por hora ×2080, por mes ×12...)
+en la moneda original; antes de llenar salary_min/salary_max se convierte a
+USD con una tabla estática (to_usd), porque todos los consumidores (Golden
+Leads, urgencia, min_salary de get_jobs, tendencias) comparan en USD. Sin
+tasa para la moneda, las columnas numéricas quedan en NULL. El texto original
+queda en salary_range.
+
+Un '$' suelto es ambiguo (USD, ARS, MXN...): se usa dollar_currency (el
+scraper la deduce del país de la oferta) y un código explícito, como en
+'$80,000 - $100,000 CAD', siempre manda.
+
+Uso / Uzo / Usage (relleno de filas existentes):
+    python -m src.salary_parser [--descriptions]
+"""
+import argparse
+import logging
+import re
+from typing import Optional, Dict, Any, List, NamedTuple
+
+from sqlalchemy import select, update, bindparam, or_
+
+from src.database import get_db
+from src.models import Job
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Moneda por símbolo o código / Valuto po simbolo aŭ kodo
+CURRENCY_ALIASES: Dict[str, str] = {
+    'us$': 'USD', 'u$s': 'USD', 'usd': 'USD', '$': 'USD',
+    'ar$': 'ARS', 'ars': 'ARS',
+    'r$': 'BRL', 'brl': 'BRL',
+    'mx$': 'MXN', 'mxn': 'MXN',
+    'ca$': 'CAD', 'c$': 'CAD', 'cad': 'CAD',
+    '€': 'EUR', 'eur': 'EUR',
+    '£': 'GBP', 'gbp': 'GBP',
+}
+
+# Salarios que en la región se publican por mes sin decirlo / Kutime monataj salajroj
+_MONTHLY_BY_DEFAULT = {'ARS', 'BRL', 'MXN'}
+
+# USD por unidad (aproximado, estático; ver settings.SALARY_USD_RATES)
+# USD po unuo (proksimuma, statika)
+USD_RATES: Dict[str, float] = {
+    'USD': 1.0, 'EUR': 1.08, 'GBP': 1.27, 'CAD': 0.73,
+    'BRL': 0.18, 'MXN': 0.055, 'ARS': 0.001,
+}
+
+# Moneda de un '$' suelto según el país de la oferta / Valuto de nuda '$' laŭ la lando
+DOLLAR_BY_COUNTRY: Dict[str, str] = {'Argentina': 'ARS', 'Mexico': 'MXN', 'Canada': 'CAD'}
+
+# Periodos en anualización / Periodoj en jarigo
+PERIOD_FACTORS = {'hour': 2080, 'day': 260, 'week': 52, 'month': 12, 'year': 1}
+
+# Máximo anual plausible por moneda (descarta "$50M de inversión")
+# Maksimuma kredinda jara salajro po valuto
+_MAX_ANNUAL = {'ARS': 2e10, 'BRL': 1e8, 'MXN': 1e8}
+_MAX_ANNUAL_DEFAULT = 5e6
+# Un '$' suelto leído como USD: más que esto suele ser otra moneda ('$ 300.000 mensuales')
+_MAX_ANNUAL_BARE_DOLLAR = 1e6
+_MIN_ANNUAL = 1000
+
+_CURRENCY = r'(?:US\$|U\$S|AR\$|MX\$|CA\$|R\$|C\$|€|£|\$|\b(?:USD|ARS|BRL|MXN|CAD|EUR|GBP)\b)'
+_NUMBER = r'\d{1,3}(?:[., \u00a0\u202f]\d{3})+(?:[.,]\d{1,2})?|\d+(?:[.,]\d+)?'
+_MULTIPLIER = r'(?:[kK]\b|mil\b|MM\b|M\b|millones\b|mi\b)'
+
+# Un importe: moneda opcional antes o después, multiplicador opcional
+# Unu sumo: nedeviga valuto antaŭe aŭ poste, nedeviga multiplikilo
+_AMOUNT_PATTERN = re.compile(
+    rf'(?P<before>{_CURRENCY})?\s*(?P<number>{_NUMBER})\s*(?P<multiplier>{_MULTIPLIER})?\s*(?P<after>{_CURRENCY})?',
+    re.IGNORECASE
+)
+# Lo que separa los dos extremos de un rango / Kio apartigas la du ekstremojn de intervalo
+_RANGE_SEPARATOR = re.compile(r'^\s*(?:-|–|—|~|to|a|al|hasta|até|y|e)\s*$', re.IGNORECASE)
+_UP_TO = re.compile(r'(?:up to|hasta|até|max(?:imum)?\.?)\s*$', re.IGNORECASE)
+
+_PERIOD_PATTERNS = [
+    ('hour', re.compile(r'/\s*(?:h|hr|hour|hora)\b|\bper hour\b|\bhourly\b|\bpor hora\b|\bpor hs\b|\b/hs\b|\ban hour\b', re.IGNORECASE)),
+    ('day', re.compile(r'/\s*(?:day|d[ií]a)\b|\bper day\b|\bdaily\b|\bpor d[ií]a\b', re.IGNORECASE)),
+    ('week', re.compile(r'/\s*(?:wk|week|semana)\b|\bper week\b|\bweekly\b|\bsemanal\b', re.IGNORECASE)),
+    ('month', re.compile(r'/\s*(?:mo|month|mes|m[eê]s)\b|\bper month\b|\bmonthly\b|\bmensual(?:es)?\b|\bpor mes\b|\bmensais?\b|\bao m[eê]s\b', re.IGNORECASE)),
+    ('year', re.compile(r'/\s*(?:yr|year|a[nñ]o|ano)\b|\bper (?:year|annum)\b|\bp\.?a\.?(?=\s|$)|\bannual(?:ly)?\b|\byearly\b|\banual(?:es)?\b|\bpor a[nñ]o\b', re.IGNORECASE)),
+]
+
+# Ventana tras el importe donde buscar el periodo / Fenestro post la sumo por la periodo
+_PERIOD_WINDOW = 40
+
+
+class ParsedSalary(NamedTuple):
+    """Salario estructurado (anualizado) / Strukturita salajro (jarigita)"""
+    salary_min: Optional[float]
+    salary_max: float
+    currency: str
+    period: str
+
+
+def _to_number(raw: str) -> float:
+    """
+    '120,000' · '90.000' · '50 000' · '1.234,56' · '4.5' → float
+    El último separador es decimal solo si le siguen 1-2 dígitos
+    """
+    raw = raw.replace('\u00a0', '').replace('\u202f', '').replace(' ', '')
+    if ',' in raw and '.' in raw:
+        decimal = ',' if raw.rfind(',') > raw.rfind('.') else '.'
+        raw = raw.replace('.' if decimal == ',' else ',', '').replace(decimal, '.')
+    elif ',' in raw or '.' in raw:
+        separator = ',' if ',' in raw else '.'
+        parts = raw.split(separator)
+        raw = raw.replace(separator, '') if len(parts) > 2 or len(parts[-1]) == 3 else raw.replace(separator, '.')
+    return float(raw)
+
+
+def _multiplier(token: Optional[str]) -> float:
+    if not token:
+        return 1.0
+    token = token.lower()
+    if token in ('k', 'mil'):
+        return 1e3
+    return 1e6
+
+
+def _currency(match: re.Match) -> Optional[str]:
+    """
+    Moneda explícita del importe; un '$' suelto no cuenta / Eksplicita valuto; nuda '$' ne kalkuliĝas
+    """
+    for token in (match.group('before'), match.group('after')):
+        if token and token != '$':
+            return CURRENCY_ALIASES[token.lower()]
+    return None
+
+
+def _bare_dollar(match: re.Match) -> bool:
+    return '$' in (match.group('before'), match.group('after'))
+
+
+def _period(text: str) -> Optional[str]:
+    for period, pattern in _PERIOD_PATTERNS:
+        if pattern.search(text):
+            return period
+    return None
+
+
+def parse_salary(
+    text: Optional[str],
+    require_currency: bool = False,
+    dollar_currency: str = 'USD'
+) -> Optional[ParsedSalary]:
+    """
+    Extrae el primer salario de un texto / Eltiras la unuan salajron el teksto
+
+    Args:
+        text: Texto de salario (salary_range) o descripción
+        require_currency: Solo aceptar importes con moneda explícita (para
+                          descripciones, donde un número suelto no es un salario)
+        dollar_currency: Moneda de un '$' suelto (p.ej. 'ARS' en ofertas de Argentina)
+
+    Returns:
+        ParsedSalary anualizado, o None si no hay salario reconocible
+    """
+    if not text:
+        return None
+
+    amounts = list(_AMOUNT_PATTERN.finditer(text))
+    for index, match in enumerate(amounts):
+        low_multiplier = _multiplier(match.group('multiplier'))
+        currency = _currency(match)
+        high = None
+
+        # Rango: dos importes separados por '-', 'to', 'a', 'hasta'...
+        following = amounts[index + 1] if index + 1 < len(amounts) else None
+        if following and _RANGE_SEPARATOR.match(text[match.end():following.start()]):
+            high = following
+            currency = currency or _currency(following)
+
+        # '$' sin código explícito en ninguno de los extremos / '$' sen eksplicita kodo
+        bare_dollar = currency is None and (_bare_dollar(match) or (high is not None and _bare_dollar(high)))
+        if bare_dollar:
+            currency = dollar_currency
+        if require_currency and currency is None:
+            continue
+        # Un número suelto sin moneda ni 'k' solo vale en un texto corto (salary_range)
+        # Nuda nombro sen valuto nek 'k' validas nur en mallonga teksto
+        bare = currency is None and match.group('multiplier') is None and (
+            high is None or high.group('multiplier') is None
+        )
+        if bare and len(text) > 60:
+            continue
+        currency = currency or 'USD'
+
+        try:
+            low_value = _to_number(match.group('number'))
+            if high is not None:
+                high_multiplier = _multiplier(high.group('multiplier'))
+                high_value = _to_number(high.group('number')) * high_multiplier
+                # '$120-180k': el multiplicador se aplica a ambos extremos
+                if match.group('multiplier') is None and high.group('multiplier') is not None:
+                    low_multiplier = high_multiplier
+            low_value *= low_multiplier
+        except ValueError:
+            continue
+        if high is None:
+            high_value = low_value
+        if high_value < low_value:
+            low_value, high_value = high_value, low_value
+
+        end = (high or match).end()
+        period = _period(text[match.start():end + _PERIOD_WINDOW])
+        if period is None and bare and high_value < 1000:
+            continue  # '2 years', '3-5' ...
+        if period is None:
+            if currency in _MONTHLY_BY_DEFAULT:
+                period = 'month'
+            elif high_value < 500:
+                period = 'hour'
+            else:
+                period = 'year'
+
+        factor = PERIOD_FACTORS[period]
+        annual_min, annual_max = low_value * factor, high_value * factor
+        if not _MIN_ANNUAL <= annual_max <= _MAX_ANNUAL.get(currency, _MAX_ANNUAL_DEFAULT):
+            continue
+        if bare_dollar and currency == 'USD' and annual_max > _MAX_ANNUAL_BARE_DOLLAR:
+            continue
+
+        up_to = high is None and _UP_TO.search(text[:match.start()])
+        return ParsedSalary(None if up_to else annual_min, annual_max, currency, period)
+    return None
+
+
+def period_of_unit(unit: Optional[str]) -> Optional[str]:
+    """
+    Periodo de una unidad estructurada: 'per-month-salary' (Lever), 'MONTH' (JSON-LD)
+    Periodo de strukturita unuo
+    """
+    if not unit:
+        return None
+    unit = unit.strip().lower().replace('-', ' ')
+    return unit if unit in PERIOD_FACTORS else _period(unit)
+
+
+def to_usd(salary: Optional[ParsedSalary]) -> Optional[ParsedSalary]:
+    """
+    Convierte un salario anualizado a USD / Konvertas jarigitan salajron al USD
+
+    Returns:
+        El salario en USD, o None si no hay tasa para su moneda
+    """
+    if salary is None:
+        return None
+    rate = {**USD_RATES, **settings.SALARY_USD_RATES}.get(salary.currency)
+    if rate is None:
+        return None
+    return ParsedSalary(
+        None if salary.salary_min is None else round(salary.salary_min * rate, 2),
+        round(salary.salary_max * rate, 2),
+        'USD',
+        salary.period,
+    )
+
+
+# ============================================================
+# RELLENO DE FILAS EXISTENTES / PLENIGO DE EKZISTANTAJ VICOJ
+# ============================================================
+
+def backfill_salaries(descriptions: bool = False, batch_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Rellena salary_min/salary_max/salary_currency de las filas sin salario numérico
+    Plenigas la numerajn salajrajn kolumnojn de vicoj sen ili
+
+    Cada texto distinto de salary_range se analiza una sola vez y se escribe
+    con un UPDATE ... WHERE salary_range = :texto ejecutado por lotes
+    (executemany): una sentencia cubre todas las filas con ese texto.
+
+    Args:
+        descriptions: Probar además la descripción de las filas sin salary_range
+        batch_size: Parámetros por executemany (por defecto RECRAWL_BATCH_SIZE)
+
+    Returns:
+        Resumen: texts, parsed, rows, from_descriptions, converted
+    """
+    batch_size = batch_size or settings.RECRAWL_BATCH_SIZE
+    summary = {'texts': 0, 'parsed': 0, 'rows': 0, 'from_descriptions': 0}
+    summary['converted'] = _convert_stored_to_usd()
+
+    with get_db() as db:
+        texts = db.execute(
+            select(Job.salary_range)
+            .where(Job.salary_min.is_(None), Job.salary_max.is_(None), Job.salary_range.is_not(None))
+            .distinct()
+        ).scalars().all()
+        summary['texts'] = len(texts)
+
+        values: List[Dict[str, Any]] = []
+        for text in texts:
+            parsed = to_usd(parse_salary(text))
+            if parsed:
+                values.append({
+                    'range_text': text, 'new_min': parsed.salary_min,
+                    'new_max': parsed.salary_max, 'new_currency': parsed.currency,
+                })
+        summary['parsed'] = len(values)
+
+        # Tabla Core: executemany por texto, no UPDATE por clave primaria del ORM
+        # Core-tabelo: executemany po teksto, ne ORM-UPDATE po ĉefŝlosilo
+        jobs = Job.__table__
+        statement = (
+            update(jobs)
+            .where(jobs.c.salary_range == bindparam('range_text'),
+                   jobs.c.salary_min.is_(None), jobs.c.salary_max.is_(None))
+            .values(salary_min=bindparam('new_min'), salary_max=bindparam('new_max'),
+                    salary_currency=bindparam('new_currency'))
+        )
+        for start in range(0, len(values), batch_size):
+            result = db.execute(statement, values[start:start + batch_size])
+            summary['rows'] += max(result.rowcount, 0)
+        db.commit()
+
+    if descriptions:
+        summary['from_descriptions'] = _backfill_from_descriptions(batch_size)
+
+    logger.info(
+        f"💰 Salarios: {summary['parsed']}/{summary['texts']} textos reconocidos, "
+        f"{summary['rows']} filas rellenadas, {summary['from_descriptions']} desde la descripción, "
+        f"{summary['converted']} pasadas a USD (o vaciadas sin tasa)"
+    )
+    return summary
+
+
+def _convert_stored_to_usd() -> int:
+    """
+    Filas guardadas con importes en otra moneda: pasa sus columnas numéricas a USD
+    Vicoj konservitaj kun sumoj en alia valuto: konvertas ilin al USD
+
+    Sin tasa para la moneda, las columnas numéricas se vacían (el texto sigue
+    en salary_range) para que no pasen los filtros en USD.
+    """
+    converted = 0
+    with get_db() as db:
+        currencies = db.execute(
+            select(Job.salary_currency)
+            .where(Job.salary_currency != 'USD', or_(Job.salary_min.is_not(None), Job.salary_max.is_not(None)))
+            .distinct()
+        ).scalars().all()
+        rates = {**USD_RATES, **settings.SALARY_USD_RATES}
+        for currency in currencies:
+            rate = rates.get(currency)
+            values = (
+                {'salary_min': Job.salary_min * rate, 'salary_max': Job.salary_max * rate, 'salary_currency': 'USD'}
+                if rate is not None else {'salary_min': None, 'salary_max': None}
+            )
+            result = db.execute(update(Job).where(Job.salary_currency == currency).values(**values))
+            converted += max(result.rowcount, 0)
+        db.commit()
+    return converted
+
+
+def _backfill_from_descriptions(batch_size: int) -> int:
+    """
+    Filas sin salary_range: busca un importe con moneda en la descripción
+    Vicoj sen salary_range: serĉas sumon kun valuto en la priskribo
+    """
+    filled, after_id = 0, 0
+    while True:
+        with get_db() as db:
+            rows = db.execute(
+                select(Job.id, Job.description)
+                .where(Job.salary_min.is_(None), Job.salary_max.is_(None), Job.salary_range.is_(None), Job.id > after_id)
+                .order_by(Job.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return filled
+            after_id = rows[-1].id
+
+            changed = []
+            for row in rows:
+                parsed = to_usd(parse_salary(row.description, require_currency=True))
+                if parsed:
+                    changed.append({
+                        'id': row.id, 'salary_min': parsed.salary_min,
+                        'salary_max': parsed.salary_max, 'salary_currency': parsed.currency,
+                    })
+            if changed:
+                db.execute(update(Job), changed)
+                db.commit()
+            filled += len(changed)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Rellena los salarios numéricos de las ofertas guardadas
+    Plenigas la numerajn salajrojn de la konservitaj ofertoj
+    """
+    parser = argparse.ArgumentParser(description="Labortrovilo - relleno de salarios estructurados")
+    parser.add_argument('--descriptions', action='store_true',
+                        help="Buscar también en la descripción de las ofertas sin salary_range")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    backfill_salaries(descriptions=args.descriptions)
+
+
+if __name__ == "__main__":
+    main()
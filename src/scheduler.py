@@ -3,6 +3,9 @@ Sistema de Tareas Programadas de Labortrovilo
 Orquesta el flujo completo: Scraping → Procesamiento AI → Alertas → Notificaciones
 """
 import logging
+import signal
+import subprocess
+import sys
 from datetime import datetime
 from typing import Dict, Optional
 import os
@@ -19,6 +22,7 @@ from database import SessionLocal
 from notifications import AlertManager
 from notification_channels import NotificationDispatcher
 from models import Notification, User, AlertConfig, Job
+from config import settings
 
 # Configurar logging
 logging.basicConfig(
@@ -29,7 +33,8 @@ logger = logging.getLogger(__name__)
 
 # Rutas de scripts
 SCRIPTS_DIR = Path(__file__).parent.parent
-SCRAPER_SCRIPT = SCRIPTS_DIR / "engine.py"
+SCRAPER_MODULE = "src.launcher"  # Procesos por shard sobre la frontera persistente (reanudable)
+BROWSER_SERVER_MODULE = "src.browser_server"  # Chromium compartido entre ejecuciones
 AI_PROCESSOR_SCRIPT = SCRIPTS_DIR / "test_ai_processor.py"
 
 
@@ -41,6 +46,7 @@ class TaskOrchestrator:
     
     def __init__(self):
         self.scheduler = None
+        self.browser_server = None  # Proceso del navegador compartido / Procezo de la komuna retumilo
         self.alert_manager = AlertManager()
         self.notification_dispatcher = NotificationDispatcher()
         
@@ -70,6 +76,10 @@ class TaskOrchestrator:
             timezone='America/Mexico_City'  # Ajustar según zona horaria
         )
         
+        # Navegador compartido para los scrapers (opcional)
+        if settings.BROWSER_SERVER_ENABLED:
+            self._start_browser_server()
+        
         # Registrar tareas
         self._register_jobs()
         
@@ -80,6 +90,30 @@ class TaskOrchestrator:
         # Imprimir trabajos programados
         self._print_scheduled_jobs()
     
+    def _start_browser_server(self):
+        """
+        Lanza el navegador compartido al que se conectan las ejecuciones del scraper
+        """
+        self.browser_server = subprocess.Popen(
+            [sys.executable, '-m', BROWSER_SERVER_MODULE],
+            cwd=str(SCRIPTS_DIR)
+        )
+        logger.info(f"🌐 Navegador compartido iniciado (pid {self.browser_server.pid})")
+    
+    def _stop_browser_server(self):
+        """
+        Detiene el navegador compartido
+        """
+        if self.browser_server is None:
+            return
+        self.browser_server.terminate()
+        try:
+            self.browser_server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.browser_server.kill()
+        self.browser_server = None
+        logger.info("Navegador compartido detenido")
+    
     def _register_jobs(self):
         """
         Registra todos los trabajos programados
@@ -144,36 +178,71 @@ class TaskOrchestrator:
         )
         logger.info("✓ Daily Stats job registrado (diario 9:00 AM)")
     
+    @staticmethod
+    def _kill_process_group(process, grace_seconds: float = 30):
+        """
+        Termina el launcher y todos sus workers, no solo el proceso padre
+        Finas la lanĉilon kaj ĉiujn ĝiajn laboristojn, ne nur la gepatran procezon
+        """
+        if not hasattr(os, 'killpg'):
+            # Sin grupos de procesos POSIX / Sen POSIX-procezgrupoj
+            process.kill()
+            process.communicate()
+            return
+        
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(process.pid, sig)
+            except ProcessLookupError:
+                break
+            try:
+                process.communicate(timeout=grace_seconds)
+                break
+            except subprocess.TimeoutExpired:
+                continue
+        # Los workers pueden sobrevivir al launcher / Laboristoj povas postvivi la lanĉilon
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
     def run_scraper_job(self):
         """
         Ejecuta el scraper de ofertas de empleo
+        
+        El scraper consume la frontera persistente (crawl_frontier): si el
+        timeout lo corta, la siguiente ejecución retoma los lotes pendientes.
         """
         logger.info("=" * 60)
         logger.info("INICIANDO: Web Scraping Job")
         logger.info("=" * 60)
         
         try:
-            import subprocess
-            
-            # Ejecutar scraper usando Python
-            result = subprocess.run(
-                ['python', str(SCRAPER_SCRIPT)],
-                capture_output=True,
+            # Ejecutar scraper usando Python, en su propio grupo de procesos:
+            # el launcher arranca workers (ProcessPoolExecutor) con su Chromium
+            process = subprocess.Popen(
+                [sys.executable, '-m', SCRAPER_MODULE],
+                cwd=str(SCRIPTS_DIR),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=3600  # 1 hora máximo
+                start_new_session=True
             )
+            try:
+                stdout, stderr = process.communicate(timeout=3600)  # 1 hora máximo
+            except subprocess.TimeoutExpired:
+                self._kill_process_group(process)
+                logger.error("✗ Scraper timeout (excedió 1 hora); la frontera se retoma en la próxima ejecución")
+                return False
             
-            if result.returncode == 0:
+            if process.returncode == 0:
                 logger.info(f"✓ Scraper ejecutado exitosamente")
-                logger.info(f"Output: {result.stdout[:500]}")
+                logger.info(f"Output: {stdout[:500]}")
                 return True
             else:
-                logger.error(f"✗ Error en scraper: {result.stderr}")
+                logger.error(f"✗ Error en scraper: {stderr}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logger.error("✗ Scraper timeout (excedió 1 hora)")
-            return False
         except Exception as e:
             logger.error(f"✗ Error ejecutando scraper: {str(e)}", exc_info=True)
             return False
@@ -187,8 +256,6 @@ class TaskOrchestrator:
         logger.info("=" * 60)
         
         try:
-            import subprocess
-            
             # Ejecutar AI processor
             result = subprocess.run(
                 ['python', str(AI_PROCESSOR_SCRIPT)],
@@ -440,6 +507,7 @@ class TaskOrchestrator:
         if self.scheduler:
             self.scheduler.shutdown()
             logger.info("TaskOrchestrator detenido")
+        self._stop_browser_server()
     
     def pause_job(self, job_id: str):
         """
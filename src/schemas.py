@@ -3,7 +3,7 @@ Esquemas de Validación Pydantic / Pydantic Validigaj Skemoj
 Senior Data Engineer Architecture - Data Validation Layer
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field, HttpUrl, field_validator, ConfigDict
 from enum import Enum
 
@@ -118,6 +118,10 @@ class JobBase(BaseModel):
     url: str = Field(..., min_length=1, max_length=500, description="URL de la oferta")
     source_platform: Optional[SourcePlatform] = Field(default=SourcePlatform.UNKNOWN)
     
+    # Página cruda archivada / Arkivita kruda paĝo
+    raw_page_key: Optional[str] = Field(None, max_length=64)
+    raw_page_type: Optional[str] = Field(None, max_length=10)
+    
     # 🎯 CAMPOS DIFERENCIADORES / DISTINGAJ KAMPOJ
     hiring_urgency_score: float = Field(
         default=0.0, 
@@ -261,11 +265,66 @@ class ScrapingStats(BaseModel):
     successful_scrapes: int = 0
     failed_scrapes: int = 0
     duplicates_found: int = 0
+    skipped_known: int = 0  # Descartadas antes de navegar / Forĵetitaj antaŭ navigi
     saved_to_db: int = 0
+    host_wait_seconds: Dict[str, float] = Field(default_factory=dict)
+    extraction_paths: Dict[str, int] = Field(default_factory=dict)
+    static_escalations: Dict[str, int] = Field(default_factory=dict)
+    requests_blocked: int = 0
+    estimated_bytes_saved: int = 0  # Por tipo de recurso, no medido / Taksita
+    ready_histograms: Dict[str, Dict[str, int]] = Field(default_factory=dict)
+    ready_strategies: Dict[str, int] = Field(default_factory=dict)
+    db_flushes: int = 0
+    db_flush_seconds: float = 0.0
+    db_queue_max_depth: int = 0
+    db_backpressure_waits: int = 0
+    db_max_latency_seconds: float = 0.0  # Desde encolar hasta commit / De envicigo ĝis commit
+    contexts_recycled: int = 0  # Contextos de navegador reciclados / Reciklitaj retumilaj kuntekstoj
+    max_rss_mb: float = 0.0  # Pico de RSS muestreado (Python + Chromium) / Pinta RSS
+    retries: int = 0  # Reintentos por errores transitorios / Reprovoj pro pasemaj eraroj
+    circuits_opened: int = 0  # Circuitos de host abiertos / Malfermitaj gastigantaj cirkvitoj
+    parked_urls: int = 0  # URLs aparcadas por circuito abierto / Parkumitaj URL-oj
     start_time: datetime
     end_time: Optional[datetime] = None
     duration_seconds: Optional[float] = None
     
+    def merge(self, other: "ScrapingStats") -> "ScrapingStats":
+        """
+        Suma los contadores de otro worker / Sumas la nombrilojn de alia laboristo
+        Aggregates counters from another worker into this instance
+        """
+        self.total_urls += other.total_urls
+        self.successful_scrapes += other.successful_scrapes
+        self.failed_scrapes += other.failed_scrapes
+        self.duplicates_found += other.duplicates_found
+        self.skipped_known += other.skipped_known
+        self.saved_to_db += other.saved_to_db
+        self.requests_blocked += other.requests_blocked
+        self.estimated_bytes_saved += other.estimated_bytes_saved
+        self.db_flushes += other.db_flushes
+        self.db_flush_seconds += other.db_flush_seconds
+        self.db_queue_max_depth = max(self.db_queue_max_depth, other.db_queue_max_depth)
+        self.db_backpressure_waits += other.db_backpressure_waits
+        self.db_max_latency_seconds = max(self.db_max_latency_seconds, other.db_max_latency_seconds)
+        self.contexts_recycled += other.contexts_recycled
+        self.max_rss_mb = max(self.max_rss_mb, other.max_rss_mb)
+        self.retries += other.retries
+        self.circuits_opened += other.circuits_opened
+        self.parked_urls += other.parked_urls
+        for host, seconds in other.host_wait_seconds.items():
+            self.host_wait_seconds[host] = self.host_wait_seconds.get(host, 0.0) + seconds
+        for path, count in other.extraction_paths.items():
+            self.extraction_paths[path] = self.extraction_paths.get(path, 0) + count
+        for reason, count in other.static_escalations.items():
+            self.static_escalations[reason] = self.static_escalations.get(reason, 0) + count
+        for platform, histogram in other.ready_histograms.items():
+            merged = self.ready_histograms.setdefault(platform, {})
+            for label, count in histogram.items():
+                merged[label] = merged.get(label, 0) + count
+        for strategy, count in other.ready_strategies.items():
+            self.ready_strategies[strategy] = self.ready_strategies.get(strategy, 0) + count
+        return self
+    
     def calculate_success_rate(self) -> float:
         """Calcula tasa de éxito / Kalkulas sukcesprocenton"""
         if self.total_urls == 0:
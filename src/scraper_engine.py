@@ -6,16 +6,30 @@ import asyncio
 import logging
 import traceback
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from urllib.parse import urlparse
+from typing import Optional, Dict, Any, List, Tuple, Set, AsyncIterable
 
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
-from pydantic import ValidationError
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
+from sqlalchemy.exc import SQLAlchemyError
 
-from src.database import get_db, db_manager
-from src.models import Job, Company
-from src.schemas import JobCreate, ScrapingResult, ScrapingStats, SourcePlatform
+from src.database import db_manager
+from src.schemas import ScrapingResult, ScrapingStats, SourcePlatform
+from src.rate_limiter import HostRateLimiter
+from src.extractors import get_extractor
+from src.ats_api import ATSApiFetcher, create_http_client
+from src.static_fetcher import StaticHtmlFetcher
+from src.resource_blocker import ResourceBlocker
+from src.readiness import wait_until_ready, record_readiness
+from src.job_writer import JobWriterThread
+from src.seen_urls import SeenUrlIndex
+from src.url_canonicalizer import canonicalize, detect_source_platform
+from src.frontier import CrawlFrontier
+from src.browser_pool import ContextRecycler, CHROMIUM_ARGS
+from src.browser_server import resolve_browser_endpoint
+from src.circuit_breaker import HostCircuitBreaker, retry_delay, is_transient_status
+from src.page_archive import PageArchive, PAGE_HTML
+from src.keyword_matcher import job_signals, URGENCY, IT_NICHE, SENIORITY, REMOTE
+from src.salary_parser import ParsedSalary, parse_salary, to_usd, DOLLAR_BY_COUNTRY
+from src.location_normalizer import normalize_location
 from config import settings
 
 # Configurar logging robusto / Agordi robustan registradon / Configure robust logging
@@ -29,6 +43,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Mensaje de las ofertas descartadas por ya guardadas / Mesaĝo por jam konservitaj ofertoj
+ALREADY_STORED = "Job already stored"
+# Host con el circuito abierto: la URL vuelve a la frontera sin gastar intento
+# Gastiganto kun malfermita cirkvito: la URL revenas al la limo sen elspezi provon
+HOST_PARKED = "Host circuit open"
+# La oferta ya no existe (404/410): final, sin escalar ni reintentar
+# La oferto ne plu ekzistas (404/410): fina, sen eskalado nek reprovo
+POSTING_GONE = "Posting not found"
+# El lote de BD de la oferta falló: la URL se reintenta / La BD-aro malsukcesis: reprovi la URL-on
+WRITE_FAILED = "Failed to save job"
+
 
 class LabortroviloScraper:
     """
@@ -42,6 +67,15 @@ class LabortroviloScraper:
     - Validación con Pydantic / Validigo kun Pydantic / Pydantic validation
     - Prevención de duplicados / Malebligo de duobloj / Duplicate prevention
     - Detección inteligente de ATS / Inteligenta ATS-detekto / Smart ATS detection
+    - Pool concurrente de páginas / Samtempa paĝaro / Concurrent page pool
+    - Límite de cortesía por host / Ĝentileca limigo po gastiganto / Per-host politeness
+    - Extractores por ATS con fallback genérico / ATS-ekstraktiloj kun ĝenerala rezervo
+    - Ruta rápida HTTP para APIs JSON de ATS / Rapida HTTP-vojo por JSON-API-oj de ATS
+    - Nivel de HTML estático antes de Playwright / Statika HTML-nivelo antaŭ Playwright
+    - Bloqueo de imágenes, fuentes, media y trackers / Blokado de bildoj, tiparoj kaj spuriloj
+    - Escritura por lotes en un hilo aparte / Ara skribado en aparta fadeno / Off-loop bulk DB writes
+    - Descarte de URLs conocidas antes de navegar / Forĵeto de konataj URL-oj antaŭ navigi
+    - Frontera persistente con reanudación / Persista limo kun daŭrigo / Resumable frontier
     """
     
     def __init__(self, headless: bool = True):
@@ -51,10 +85,39 @@ class LabortroviloScraper:
         Args:
             headless: Ejecutar navegador sin interfaz gráfica
         """
+        self.playwright = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.resource_blockers: Dict[Page, ResourceBlocker] = {}
         self.headless = headless
         self.stats = ScrapingStats(start_time=datetime.utcnow())
+        self.rate_limiter = HostRateLimiter()
+        self.circuit_breaker = HostCircuitBreaker()
+        
+        # Niveles sin navegador con un pool httpx compartido / Senretumilaj niveloj kun komuna httpx-aro
+        self.http_client = create_http_client()
+        self.api_fetcher: Optional[ATSApiFetcher] = (
+            ATSApiFetcher(client=self.http_client) if settings.HTTP_FAST_PATH_ENABLED else None
+        )
+        self.static_fetcher: Optional[StaticHtmlFetcher] = (
+            StaticHtmlFetcher(client=self.http_client) if settings.STATIC_HTML_TIER_ENABLED else None
+        )
+        
+        # Escritura por lotes fuera del event loop / Ara skribado ekster la eventa buklo
+        self.job_writer = JobWriterThread()
+        
+        # Índice de URLs ya guardadas (se abre en initialize) / Indekso de konservitaj URL-oj
+        self.seen_urls: Optional[SeenUrlIndex] = None
+        # URLs cuyo lote falló al escribir, pendientes de reintento en la frontera
+        # URL-oj kies aro malsukcesis, atendantaj reprovon en la limo
+        self.unsaved_urls: Set[str] = set()
+        
+        # Páginas crudas comprimidas para re-extraer sin red / Kunpremitaj krudaj paĝoj
+        self.page_archive: Optional[PageArchive] = PageArchive() if settings.PAGE_ARCHIVE_ENABLED else None
+        
+        # Reciclaje de contextos con reserva caliente / Reciklado de kuntekstoj kun varma rezervo
+        self.context_recycler = ContextRecycler(self._new_context)
         
         logger.info(f"🚀 Inicializando LabortroviloScraper (headless={headless})")
     
@@ -65,32 +128,39 @@ class LabortroviloScraper:
         """
         try:
             logger.info("Iniciando Playwright...")
-            playwright = await async_playwright().start()
+            self.playwright = await async_playwright().start()
+            
+            # Conectar al navegador compartido si está disponible / Konekti al la komuna retumilo
+            endpoint = resolve_browser_endpoint()
+            if endpoint:
+                try:
+                    self.browser = await self.playwright.chromium.connect(
+                        endpoint, timeout=settings.BROWSER_SERVER_CONNECT_TIMEOUT
+                    )
+                    logger.info(f"🌐 Conectado al navegador compartido: {endpoint}")
+                    # Su RSS no es medible desde aquí / Ĝia RSS ne mezureblas de ĉi tie
+                    self.context_recycler.remote_browser = True
+                except Exception as e:
+                    logger.warning(f"⚠️ Navegador compartido no disponible ({e}), lanzando uno propio")
             
             # Lanzar navegador con configuración / Lanĉi retumilon kun agordado
-            self.browser = await playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox'
-                ]
-            )
+            if self.browser is None:
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=CHROMIUM_ARGS
+                )
             
-            # Crear contexto con User-Agent real / Krei kuntekston kun reala User-Agent
-            context = await self.browser.new_context(
-                user_agent=settings.USER_AGENT,
-                viewport={'width': 1920, 'height': 1080},
-                locale='es-ES',
-                timezone_id='America/New_York'
-            )
+            # Crear contexto y página principal / Krei kuntekston kaj ĉefan paĝon
+            self.context, self.page = await self._new_context()
             
-            # Crear página / Krei paĝon
-            self.page = await context.new_page()
+            # Pool caliente para el resto de workers y reserva para reciclar
+            # Varma aro por la aliaj laboristoj kaj rezervo por recikli
+            await self.context_recycler.fill(settings.SCRAPER_CONCURRENCY - 1)
+            self.context_recycler.prewarm()
             
-            # Configurar timeout por defecto / Agordi defaŭltan tempo-limigon
-            self.page.set_default_timeout(settings.PLAYWRIGHT_TIMEOUT)
+            # Cargar el índice de URLs conocidas / Ŝargi la indekson de konataj URL-oj
+            if settings.SEEN_URLS_ENABLED:
+                self.seen_urls = await asyncio.to_thread(SeenUrlIndex.open)
             
             logger.info("✓ Navegador Playwright inicializado correctamente")
             
@@ -99,15 +169,88 @@ class LabortroviloScraper:
             logger.error(traceback.format_exc())
             raise
     
+    async def _new_context(self) -> Tuple[BrowserContext, Page]:
+        """
+        Crea un contexto aislado con su propia página
+        Kreas izolitan kuntekston kun propra paĝo
+        
+        Cada worker del pool usa su propio contexto para no compartir
+        cookies ni estado de navegación con los demás.
+        """
+        # Crear contexto con User-Agent real / Krei kuntekston kun reala User-Agent
+        context = await self.browser.new_context(
+            user_agent=settings.USER_AGENT,
+            viewport={'width': 1920, 'height': 1080},
+            locale='es-ES',
+            timezone_id='America/New_York'
+        )
+        
+        # Crear página / Krei paĝon
+        page = await context.new_page()
+        
+        # Configurar timeout por defecto / Agordi defaŭltan tempo-limigon
+        page.set_default_timeout(settings.PLAYWRIGHT_TIMEOUT)
+        
+        # Interceptar recursos innecesarios / Interkapti nenecesajn rimedojn
+        if settings.SCRAPER_BLOCK_RESOURCES:
+            blocker = ResourceBlocker()
+            await blocker.attach(context)
+            self.resource_blockers[page] = blocker
+        
+        return context, page
+    
+    def _collect_blocking_report(self, page: Optional[Page], stats: ScrapingStats):
+        """
+        Registra las peticiones y bytes ahorrados (estimados) en la última página
+        Registras la petojn kaj bajtojn ŝparitajn en la lasta paĝo
+        """
+        blocker = self.resource_blockers.get(page or self.page)
+        if not blocker:
+            return
+        
+        report = blocker.take_report()
+        stats.requests_blocked += report['requests_blocked']
+        stats.estimated_bytes_saved += report['estimated_bytes_saved']
+        if report['requests_blocked']:
+            logger.info(
+                f"   🚫 Recursos bloqueados: {report['requests_blocked']} "
+                f"(~{report['estimated_bytes_saved'] / 1024:.0f} KB ahorrados, estimado) {report['by_reason']}"
+            )
+    
     async def close(self):
         """
         Cierra el navegador y limpia recursos
         Fermas la retumilon kaj purigas rimedojn
         """
+        # Primero vaciar ofertas pendientes y parar el hilo: un navegador ya
+        # caído (servidor compartido) no debe hacer perder el buffer
+        # Unue malplenigi ofertojn kaj haltigi la fadenon / Flush the writer first
         try:
+            await self.job_writer.close()
+            self._collect_writer_metrics()
+        except Exception as e:
+            logger.error(f"Error vaciando ofertas pendientes: {e}")
+        
+        try:
+            await self.context_recycler.close()
+            
             if self.browser:
                 await self.browser.close()
                 logger.info("✓ Navegador cerrado correctamente")
+            
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            logger.error(f"Error cerrando navegador: {e}")
+        
+        try:
+            await self.http_client.aclose()
+            
+            if self.seen_urls:
+                await asyncio.to_thread(self.seen_urls.save)
+            
+            if self.page_archive:
+                await asyncio.to_thread(self.page_archive.enforce_retention)
                 
             # Calcular duración de la sesión / Kalkuli daŭron de la seanco
             self.stats.end_time = datetime.utcnow()
@@ -119,97 +262,87 @@ class LabortroviloScraper:
             logger.info(f"📊 Estadísticas de scraping: {self.stats.model_dump()}")
             
         except Exception as e:
-            logger.error(f"Error cerrando navegador: {e}")
+            logger.error(f"Error liberando recursos: {e}")
     
     def _detect_source_platform(self, url: str) -> SourcePlatform:
         """
         Detecta la plataforma ATS basándose en la URL
         Detektas la ATS-platformon bazite sur la URL
         """
-        domain = urlparse(url).netloc.lower()
-        
-        platform_mapping = {
-            'greenhouse.io': SourcePlatform.GREENHOUSE,
-            'lever.co': SourcePlatform.LEVER,
-            'myworkdayjobs.com': SourcePlatform.WORKDAY,
-            'smartrecruiters.com': SourcePlatform.SMARTRECRUITERS,
-            'workable.com': SourcePlatform.WORKABLE,
-            'bamboohr.com': SourcePlatform.BAMBOOHR,
-            'jobvite.com': SourcePlatform.JOBVITE,
-            'icims.com': SourcePlatform.ICIMS,
-            'linkedin.com': SourcePlatform.LINKEDIN,
-            'indeed.com': SourcePlatform.INDEED,
-        }
-        
-        for key, platform in platform_mapping.items():
-            if key in domain:
-                return platform
-        
-        return SourcePlatform.CUSTOM
+        return detect_source_platform(url)
     
-    def _calculate_hiring_urgency(self, job_data: dict) -> float:
+    @staticmethod
+    def _calculate_hiring_urgency(job_data: dict, signals: Optional[Tuple[Set[str], Set[str]]] = None) -> float:
         """
         Calcula score de urgencia de contratación basado en señales
         Kalkulas urĝeco-poentaron bazite sur signaloj
         
         Señales consideradas:
         - Palabras clave como "urgent", "immediate", "ASAP"
-        - Fecha de publicación reciente
+        - Fecha de publicación reciente (respecto a date_scraped)
         - Múltiples posiciones abiertas
+        
+        Args:
+            signals: (clases del título, clases de la descripción) de
+                     job_signals, si ya se calcularon
         """
         score = 50.0  # Score base / Baza poentaro
         
-        description = (job_data.get('description', '') or '').lower()
-        title = (job_data.get('title', '') or '').lower()
+        title_hits, description_hits = signals or job_signals(job_data.get('title'), job_data.get('description'))
         
         # Palabras de urgencia / Urĝaj vortoj
-        urgency_keywords = ['urgent', 'immediate', 'asap', 'urgente', 'inmediato']
-        for keyword in urgency_keywords:
-            if keyword in description or keyword in title:
-                score += 15.0
-                break
+        if URGENCY in title_hits or URGENCY in description_hits:
+            score += 15.0
         
         # Fecha de publicación reciente / Freŝa publikigdata
         posted_date = job_data.get('posted_date')
         if posted_date:
-            days_old = (datetime.utcnow() - posted_date).days
+            days_old = ((job_data.get('date_scraped') or datetime.utcnow()) - posted_date).days
             if days_old < 3:
                 score += 20.0
             elif days_old < 7:
                 score += 10.0
         
         # Indicadores en el título / Indikatoroj en la titolo
-        if 'senior' in title or 'lead' in title:
+        if SENIORITY in title_hits:
             score += 5.0
         
         return min(score, 100.0)  # Máximo 100 / Maksimume 100
     
-    def _detect_it_niche(self, job_data: dict) -> bool:
+    @staticmethod
+    def _detect_it_niche(job_data: dict, signals: Optional[Tuple[Set[str], Set[str]]] = None) -> bool:
         """
         Detecta si es un nicho especializado de IT
         Detektas ĉu ĝi estas specialigita IT-niĉo
         """
-        text = f"{job_data.get('title', '')} {job_data.get('description', '')}".lower()
-        
-        niche_keywords = [
-            'blockchain', 'web3', 'crypto', 'quantum',
-            'machine learning', 'deep learning', 'ai engineer',
-            'computer vision', 'nlp', 'bioinformatics',
-            'embedded systems', 'iot', 'edge computing',
-            'game engine', 'graphics programming', 'shader'
-        ]
-        
-        return any(keyword in text for keyword in niche_keywords)
+        title_hits, description_hits = signals or job_signals(job_data.get('title'), job_data.get('description'))
+        return IT_NICHE in title_hits or IT_NICHE in description_hits
     
-    async def navigate_to_url(self, url: str) -> bool:
+    async def navigate_to_url(self, url: str, page: Optional[Page] = None) -> bool:
         """
         Navega a una URL con manejo de errores robusto
         Navigas al URL kun robusta erartraktado
+        
+        Args:
+            url: URL de destino
+            page: Página del worker (por defecto self.page)
+        """
+        ok, _ = await self._goto(url, page or self.page)
+        return ok
+    
+    async def _goto(self, url: str, page: Page) -> Tuple[bool, bool]:
+        """
+        Navega una vez y clasifica el fallo / Navigas unufoje kaj klasifikas la eraron
+        
+        Returns:
+            (navegación correcta, fallo transitorio que merece reintento)
         """
+        self.context_recycler.record_navigation(page)
+        
         try:
             logger.info(f"🌐 Navegando a: {url}")
             
-            response = await self.page.goto(
+            response = await page.goto(
                 url,
                 wait_until='domcontentloaded',
                 timeout=settings.PLAYWRIGHT_TIMEOUT
@@ -217,309 +350,341 @@ class LabortroviloScraper:
             
             if response and response.ok:
                 logger.info(f"✓ Navegación exitosa: {response.status}")
-                return True
+                return True, False
             else:
                 status = response.status if response else 'Unknown'
                 logger.warning(f"⚠️ Respuesta no OK: Status {status}")
-                return False
+                return False, bool(response) and is_transient_status(response.status)
                 
         except PlaywrightTimeout:
             logger.error(f"✗ Timeout navegando a {url}")
-            return False
+            return False, True
         except Exception as e:
             logger.error(f"✗ Error navegando a {url}: {e}")
             logger.error(traceback.format_exc())
-            return False
+            # Errores de red de Chromium (conexión rechazada, DNS, reset...)
+            return False, 'net::ERR_' in str(e)
     
-    async def extract_job_data(self, url: str) -> Optional[Dict[str, Any]]:
+    async def _acquire_host(self, url: str, stats: ScrapingStats):
         """
-        Extrae datos de trabajo de la página actual con selectores genéricos
-        Ekstraktas labordatumojn de la nuna paĝo kun ĝeneralaj elektiloj
+        Espera un token del presupuesto del host y acumula la espera en stats
+        Atendas ĵetonon de la buĝeto de la gastiganto kaj sumas la atendon
+        """
+        host = self.rate_limiter.host_for(url)
+        waited = await self.rate_limiter.acquire(url)
+        stats.host_wait_seconds[host] = stats.host_wait_seconds.get(host, 0.0) + waited
+    
+    async def _navigate_with_retry(self, url: str, page: Page, stats: ScrapingStats) -> bool:
+        """
+        Navega reintentando los fallos transitorios y alimenta el circuit breaker
+        Navigas reprovante pasemajn erarojn kaj informas la cirkvit-rompilon
         
-        NOTA: Los selectores son genéricos y deben personalizarse por ATS
+        Hasta MAX_RETRIES reintentos con espera exponencial y jitter; se deja
+        de reintentar en cuanto el circuito del host se abre.
         """
-        try:
-            logger.info("📊 Extrayendo datos de la página...")
+        for attempt in range(settings.MAX_RETRIES + 1):
+            ok, transient = await self._goto(url, page)
+            if ok or not transient:
+                # El host respondió (aunque sea 404) / La gastiganto respondis
+                self.circuit_breaker.record_success(url)
+                return ok
             
-            # Esperar a que cargue el contenido / Atendi ke la enhavo ŝarĝiĝu
-            await self.page.wait_for_load_state('networkidle', timeout=10000)
-            
-            # Selectores mejorados para múltiples ATS / Plibonigitaj elektiloj por multaj ATS
-            job_data = {}
-            
-            # Extraer título / Ekstraki titolon
-            # Soporta: Work at a Startup, Greenhouse, Lever, Workday, genéricos
-            try:
-                title_selectors = [
-                    'h1',  # Genérico
-                    '.job-title',
-                    '[data-qa="job-title"]',
-                    '.app-title',  # Greenhouse
-                    '.posting-headline',  # Lever
-                    '[data-automation-id="jobPostingHeader"]',  # Workday
-                    '.job-post-title',  # Work at a Startup
-                ]
-                title = None
-                for selector in title_selectors:
-                    try:
-                        elem = await self.page.locator(selector).first.text_content(timeout=2000)
-                        if elem and elem.strip():
-                            title = elem.strip()
-                            break
-                    except:
-                        continue
-                
-                job_data['title'] = title if title else "Unknown Position"
-                if not title:
-                    logger.warning("⚠️ No se pudo extraer el título")
-            except:
-                job_data['title'] = "Unknown Position"
-                logger.warning("⚠️ Error extrayendo título")
-            
-            # Extraer empresa / Ekstraki kompanion
-            try:
-                company_selectors = [
-                    '.company-name',
-                    '[data-qa="company-name"]',
-                    '.hiring-company',
-                    '.company',  # Greenhouse
-                    '.posting-categories-value',  # Lever
-                    '[data-automation-id="jobPostingCompanyLocation"]',  # Workday
-                    'a[href*="/companies/"]',  # Work at a Startup
-                ]
-                company = None
-                for selector in company_selectors:
-                    try:
-                        elem = await self.page.locator(selector).first.text_content(timeout=2000)
-                        if elem and elem.strip():
-                            company = elem.strip()
-                            break
-                    except:
-                        continue
-                
-                job_data['company_name'] = company if company else "Unknown Company"
-                if not company:
-                    logger.warning("⚠️ No se pudo extraer la empresa")
-            except:
-                job_data['company_name'] = "Unknown Company"
-                logger.warning("⚠️ Error extrayendo empresa")
-            
-            # Extraer descripción / Ekstraki priskribon
-            try:
-                desc_selectors = [
-                    '.description',
-                    '.job-description',
-                    'article',
-                    '[data-qa="job-description"]',
-                    '#content',  # Greenhouse
-                    '.section-wrapper',  # Lever
-                    '[data-automation-id="jobPostingDescription"]',  # Workday
-                    '.job-post-content',  # Work at a Startup
-                ]
-                description = None
-                for selector in desc_selectors:
-                    try:
-                        elem = await self.page.locator(selector).first.text_content(timeout=3000)
-                        if elem and len(elem.strip()) > 100:  # Al menos 100 caracteres
-                            description = elem.strip()
-                            break
-                    except:
-                        continue
-                
-                job_data['description'] = description
-                job_data['raw_description'] = description
-                if not description:
-                    logger.warning("⚠️ No se pudo extraer descripción completa")
-            except:
-                job_data['description'] = None
-                job_data['raw_description'] = None
-                logger.warning("⚠️ Error extrayendo descripción")
-            
-            # Extraer ubicación / Ekstraki lokon
-            try:
-                location_selectors = [
-                    '.location',
-                    '[data-qa="location"]',
-                    '.job-location',
-                    '.location-name',  # Greenhouse
-                    '.posting-categories:has-text("Location")',  # Lever
-                    '[data-automation-id="locations"]',  # Workday
-                    '.job-post-location',  # Work at a Startup
-                ]
-                location = None
-                for selector in location_selectors:
-                    try:
-                        elem = await self.page.locator(selector).first.text_content(timeout=2000)
-                        if elem and elem.strip():
-                            location = elem.strip()
-                            break
-                    except:
-                        continue
-                
-                job_data['location'] = location
-                if not location:
-                    logger.warning("⚠️ No se pudo extraer ubicación")
-            except:
-                job_data['location'] = None
-            
-            # Detectar trabajo remoto / Detekti foran laboron
-            location_text = (job_data.get('location') or '').lower()
-            description_text = (job_data.get('description') or '').lower()
-            job_data['is_remote'] = 'remote' in location_text or 'remoto' in location_text or 'remote' in description_text
-            
-            # Extraer salario si disponible / Ekstraki salajron se disponeblas
-            try:
-                salary = await self.page.locator('.salary, [data-qa="salary"], .compensation').first.text_content(timeout=5000)
-                job_data['salary_range'] = salary.strip() if salary else None
-            except:
-                job_data['salary_range'] = None
-            
-            # Datos fijos y calculados / Fiksaj kaj kalkulitaj datumoj
-            job_data['url'] = url
-            job_data['source_platform'] = self._detect_source_platform(url).value
-            job_data['posted_date'] = datetime.utcnow()  # Por defecto, fecha actual
-            job_data['date_scraped'] = datetime.utcnow()
+            if self.circuit_breaker.record_failure(url):
+                stats.circuits_opened += 1
+            if attempt == settings.MAX_RETRIES or self.circuit_breaker.is_open(url):
+                return False
             
-            # 🎯 CAMPOS DIFERENCIADORES / DISTINGAJ KAMPOJ
-            job_data['hiring_urgency_score'] = self._calculate_hiring_urgency(job_data)
-            job_data['is_it_niche'] = self._detect_it_niche(job_data)
+            delay = retry_delay(attempt)
+            stats.retries += 1
+            logger.info(f"🔁 Reintento {attempt + 1}/{settings.MAX_RETRIES} en {delay:.1f}s: {url}")
+            await asyncio.sleep(delay)
+            await self.rate_limiter.acquire(url)
+        return False
+    
+    async def extract_job_data(
+        self,
+        url: str,
+        page: Optional[Page] = None,
+        stats: Optional[ScrapingStats] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extrae datos de trabajo de la página actual con el extractor del ATS
+        Ekstraktas labordatumojn de la nuna paĝo kun la ATS-ekstraktilo
+        
+        El extractor se elige según _detect_source_platform; los selectores
+        genéricos quedan como fallback (ver src/extractors.py).
+        """
+        page = page or self.page
+        stats = stats or self.stats
+        platform = self._detect_source_platform(url)
+        
+        try:
+            logger.info("📊 Extrayendo datos de la página...")
             
-            logger.info(f"✓ Datos extraídos: {job_data['title']} @ {job_data['company_name']}")
-            logger.info(f"   📈 Urgency Score: {job_data['hiring_urgency_score']:.1f}")
-            logger.info(f"   🎯 IT Niche: {job_data['is_it_niche']}")
+            # Esperar al contenido clave del ATS / Atendi la ŝlosilan enhavon de la ATS
+            extractor = get_extractor(platform)
+            strategy, ready_seconds = await wait_until_ready(page, extractor.ready_selector)
+            record_readiness(stats.ready_histograms, stats.ready_strategies, platform.value, strategy, ready_seconds)
+            logger.info(f"   ⏱️ Página lista en {ready_seconds:.2f}s ({strategy})")
             
-            return job_data
+            # Extraer todos los campos en un solo round trip / Ekstrakti ĉiujn kampojn per unu rondiro
+            fields = await extractor.extract(page)
+            if self.page_archive:
+                fields['raw_page'] = (PAGE_HTML, await page.content())
+            return self._build_job_data(url, platform, fields, stats)
             
         except Exception as e:
             logger.error(f"✗ Error extrayendo datos: {e}")
             logger.error(traceback.format_exc())
             return None
     
-    def save_to_db(self, job_data: Dict[str, Any]) -> bool:
+    @classmethod
+    def _build_job_data(
+        cls,
+        url: str,
+        platform: SourcePlatform,
+        fields: Dict[str, Any],
+        stats: ScrapingStats,
+        scraped_at: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
-        Guarda datos validados en la base de datos con manejo robusto de errores
-        Stokas validigitajn datumojn en la datumbazo kun robusta erartraktado
+        Construye el job_data que valida y encola JobWriterThread a partir de campos extraídos
+        Konstruas la job_data por JobWriterThread el ekstraktitaj kampoj
+        
+        Compartido por todas las rutas de extracción (Playwright, API JSON, ...)
+        y por la re-extracción offline (src/reextractor.py), que pasa scraped_at
+        con la fecha de scraping original.
         """
-        try:
-            # Validar con Pydantic / Validigi kun Pydantic
-            logger.info("✓ Validando datos con Pydantic...")
-            validated_job = JobCreate(**job_data)
-            
-            with get_db() as db:
-                # Verificar duplicados / Kontroli duoblojn
-                existing = db.query(Job).filter(Job.url == validated_job.url).first()
-                
-                if existing:
-                    logger.warning(f"⚠️ Trabajo duplicado encontrado: {validated_job.url}")
-                    self.stats.duplicates_found += 1
-                    return False
-                
-                # Obtener o crear empresa / Akiri aŭ krei kompanion
-                company = db.query(Company).filter(
-                    Company.name == validated_job.company_name
-                ).first()
-                
-                if not company:
-                    logger.info(f"📝 Creando nueva empresa: {validated_job.company_name}")
-                    company = Company(
-                        name=validated_job.company_name,
-                        last_scraped_at=datetime.utcnow()
-                    )
-                    db.add(company)
-                    db.flush()
-                
-                # Crear registro de trabajo / Krei laborregistron
-                job = Job(
-                    external_id=validated_job.external_id,
-                    title=validated_job.title,
-                    company_id=company.id,
-                    company_name=validated_job.company_name,
-                    description=validated_job.description,
-                    raw_description=validated_job.raw_description,
-                    stack=validated_job.stack,
-                    required_skills=validated_job.required_skills,
-                    nice_to_have_skills=validated_job.nice_to_have_skills,
-                    salary_range=validated_job.salary_range,
-                    salary_min=validated_job.salary_min,
-                    salary_max=validated_job.salary_max,
-                    salary_currency=validated_job.salary_currency,
-                    location=validated_job.location,
-                    is_remote=validated_job.is_remote,
-                    remote_policy=validated_job.remote_policy,
-                    country=validated_job.country,
-                    city=validated_job.city,
-                    url=validated_job.url,
-                    source_platform=validated_job.source_platform,
-                    hiring_urgency_score=validated_job.hiring_urgency_score,
-                    is_it_niche=validated_job.is_it_niche,
-                    posted_date=validated_job.posted_date,
-                    is_active=validated_job.is_active,
-                )
-                
-                db.add(job)
-                db.commit()
-                
-                logger.info(f"✅ Trabajo guardado en BD: {job.title} (ID: {job.id})")
-                self.stats.saved_to_db += 1
-                return True
-                
-        except ValidationError as e:
-            logger.error(f"✗ Error de validación Pydantic: {e}")
-            logger.error(f"   Datos: {job_data}")
-            return False
-            
-        except IntegrityError as e:
-            logger.error(f"✗ Error de integridad (duplicado?): {e}")
-            return False
-            
-        except SQLAlchemyError as e:
-            logger.error(f"✗ Error de base de datos: {e}")
-            logger.error(traceback.format_exc())
-            return False
-            
-        except Exception as e:
-            logger.error(f"✗ Error inesperado guardando en BD: {e}")
-            logger.error(traceback.format_exc())
-            return False
+        job_data = {}
+        
+        path = fields['extraction_path']
+        stats.extraction_paths[path] = stats.extraction_paths.get(path, 0) + 1
+        logger.info(f"   🧩 Ruta de extracción: {path}")
+        
+        job_data['title'] = fields.get('title') or "Unknown Position"
+        if not fields.get('title'):
+            logger.warning("⚠️ No se pudo extraer el título")
+        
+        job_data['company_name'] = fields.get('company') or "Unknown Company"
+        if not fields.get('company'):
+            logger.warning("⚠️ No se pudo extraer la empresa")
+        
+        job_data['description'] = fields.get('description')
+        job_data['raw_description'] = fields.get('description')
+        if not fields.get('description'):
+            logger.warning("⚠️ No se pudo extraer descripción completa")
+        
+        job_data['location'] = fields.get('location')
+        if not fields.get('location'):
+            logger.warning("⚠️ No se pudo extraer ubicación")
+        
+        # Señales del título y la descripción en una pasada / Signaloj en unu trapaso
+        signals = job_signals(job_data['title'], job_data['description'])
+        
+        # Detectar trabajo remoto / Detekti foran laboron
+        location_text = (job_data.get('location') or '').lower()
+        job_data['is_remote'] = bool(fields.get('is_remote')) or 'remote' in location_text or 'remoto' in location_text or REMOTE in signals[1]
+        
+        # País, ciudad y política remota desde el gazetteer / Lando, urbo kaj fora politiko
+        location = normalize_location(job_data['location'], job_data['is_remote'])
+        job_data['country'] = location.country
+        job_data['city'] = location.city
+        job_data['remote_policy'] = location.remote_policy
+        if location.remote_policy == 'full_remote':
+            job_data['is_remote'] = True
+        
+        # Salario si disponible / Salajro se disponeblas
+        job_data['salary_range'] = fields.get('salary')
+        if fields.get('salary_max') is not None:
+            # Ya anualizado por el ATS o JSON-LD / Jam jarigita de la ATS aŭ JSON-LD
+            salary = ParsedSalary(
+                fields.get('salary_min'), fields['salary_max'], fields.get('salary_currency') or 'USD', 'year'
+            )
+        else:
+            # Texto de salario o, si falta, importe con moneda en la descripción;
+            # un '$' suelto toma la moneda del país de la oferta
+            # Salajra teksto aŭ, se mankas, sumo kun valuto en la priskribo
+            dollar = DOLLAR_BY_COUNTRY.get(job_data['country'], 'USD')
+            salary = (
+                parse_salary(fields.get('salary'), dollar_currency=dollar)
+                or parse_salary(job_data['description'], require_currency=True, dollar_currency=dollar)
+            )
+        if salary:
+            # Columnas numéricas siempre en USD / Numeraj kolumnoj ĉiam en USD
+            usd = to_usd(salary)
+            if usd:
+                job_data['salary_min'] = usd.salary_min
+                job_data['salary_max'] = usd.salary_max
+            job_data['salary_currency'] = usd.currency if usd else salary.currency
+        
+        # Datos fijos y calculados / Fiksaj kaj kalkulitaj datumoj
+        external_id = fields.get('external_id') or canonicalize(url).external_id
+        if external_id:
+            job_data['external_id'] = external_id
+        job_data['url'] = url
+        job_data['source_platform'] = platform.value
+        if fields.get('raw_page'):
+            job_data['raw_page'] = fields['raw_page']  # Lo archiva scrape_job / Arkivas ĝin scrape_job
+        job_data['posted_date'] = fields.get('posted_date') or datetime.utcnow()  # Por defecto, fecha actual
+        job_data['date_scraped'] = scraped_at or datetime.utcnow()
+        
+        # 🎯 CAMPOS DIFERENCIADORES / DISTINGAJ KAMPOJ
+        job_data['hiring_urgency_score'] = cls._calculate_hiring_urgency(job_data, signals)
+        job_data['is_it_niche'] = cls._detect_it_niche(job_data, signals)
+        
+        logger.info(f"✓ Datos extraídos: {job_data['title']} @ {job_data['company_name']}")
+        logger.info(f"   📈 Urgency Score: {job_data['hiring_urgency_score']:.1f}")
+        logger.info(f"   🎯 IT Niche: {job_data['is_it_niche']}")
+        
+        return job_data
     
-    async def scrape_job(self, url: str) -> ScrapingResult:
+    async def flush_jobs(self):
+        """
+        Espera a que el hilo escritor confirme lo encolado y suma sus métricas
+        Atendas ke la skriba fadeno konfirmu la envicigitaĵon kaj sumas ĝiajn metrikojn
+        """
+        await self.job_writer.flush()
+        self._collect_writer_metrics()
+    
+    def _collect_writer_metrics(self):
+        metrics = self.job_writer.take_metrics()
+        self.stats.saved_to_db += metrics['saved']
+        self.stats.duplicates_found += metrics['duplicates']
+        self.stats.db_flushes += metrics['flushes']
+        self.stats.db_flush_seconds += metrics['flush_seconds']
+        self.stats.db_queue_max_depth = max(self.stats.db_queue_max_depth, metrics['max_queue_depth'])
+        self.stats.db_backpressure_waits += metrics['backpressure_waits']
+        self.stats.db_max_latency_seconds = max(self.stats.db_max_latency_seconds, metrics['max_latency'])
+        # Solo lo confirmado en BD cuenta como visto / Nur la konfirmita kalkuliĝas kiel vidita
+        if self.seen_urls:
+            for url in metrics['committed_urls']:
+                self.seen_urls.add(url)
+        self.unsaved_urls.difference_update(metrics['committed_urls'])
+        self.unsaved_urls.update(metrics['failed_urls'])
+        if metrics['failed']:
+            logger.warning(f"⚠️ {metrics['failed']} ofertas no se pudieron guardar en BD")
+    
+    async def scrape_job(
+        self,
+        url: str,
+        page: Optional[Page] = None,
+        stats: Optional[ScrapingStats] = None
+    ) -> ScrapingResult:
         """
         Método principal para scrapear una oferta de trabajo
         Ĉefa metodo por skrapi laboroferton
         
+        Args:
+            url: URL de la oferta
+            page: Página del worker (por defecto self.page)
+            stats: Estadísticas del worker (por defecto self.stats)
+        
         Returns:
             ScrapingResult con el resultado de la operación
         """
+        stats = stats or self.stats
         result = ScrapingResult(success=False, url=url)
-        self.stats.total_urls += 1
+        stats.total_urls += 1
         
         try:
             logger.info(f"\n{'='*80}")
             logger.info(f"🎯 Iniciando scraping: {url}")
             logger.info(f"{'='*80}")
             
-            # Paso 1: Navegar / Paŝo 1: Navigi
-            if not await self.navigate_to_url(url):
-                result.error_message = "Failed to navigate to URL"
-                self.stats.failed_scrapes += 1
+            # Paso 0a: Descartar ofertas ya guardadas / Paŝo 0a: Forĵeti jam konservitajn ofertojn
+            if self.seen_urls and self.seen_urls.might_contain(url):
+                if await asyncio.to_thread(self.seen_urls.is_known, url):
+                    logger.info(f"⏭️ Oferta ya conocida, se omite: {url}")
+                    result.error_message = ALREADY_STORED
+                    stats.duplicates_found += 1
+                    stats.skipped_known += 1
+                    return result
+            
+            # Trabajar siempre sobre la URL canónica / Ĉiam labori sur la kanona URL
+            url = canonicalize(url).url
+            
+            # Host con el circuito abierto: aparcar sin esperar timeouts
+            # Gastiganto kun malfermita cirkvito: parkumi sen atendi tempolimojn
+            if not self.circuit_breaker.allow(url):
+                result.error_message = HOST_PARKED
+                stats.parked_urls += 1
                 return result
             
-            # Paso 2: Extraer datos / Paŝo 2: Ekstraki datumojn
-            job_data = await self.extract_job_data(url)
+            platform = self._detect_source_platform(url)
+            
+            # Paso 0b: Cada petición paga su token del presupuesto de su host
+            # Paŝo 0b: Ĉiu peto pagas sian ĵetonon de la buĝeto de sia gastiganto
+            
+            # Paso 1a: Ruta rápida por API JSON del ATS / Paŝo 1a: Rapida vojo per JSON-API
+            job_data = None
+            resolved = self.api_fetcher.api_url_for(url) if self.api_fetcher else None
+            if resolved:
+                await self._acquire_host(resolved[1], stats)
+                fields = await self.api_fetcher.fetch_fields(url)
+                if fields:
+                    self.circuit_breaker.record_success(url)
+                    job_data = self._build_job_data(url, platform, fields, stats)
+            
+            # Paso 1b: HTML estático con lxml / Paŝo 1b: Statika HTML kun lxml
+            if job_data is None and self.static_fetcher:
+                await self._acquire_host(url, stats)
+                fields, reason = await self.static_fetcher.fetch_fields(url, get_extractor(platform))
+                if fields:
+                    self.circuit_breaker.record_success(url)
+                    job_data = self._build_job_data(url, platform, fields, stats)
+                elif reason in ('status_404', 'status_410'):
+                    # Oferta retirada: no vale una navegación completa / Forigita oferto
+                    self.circuit_breaker.record_success(url)
+                    logger.info(f"🪦 Oferta no encontrada ({reason[7:]}), sin escalar: {url}")
+                    result.error_message = POSTING_GONE
+                    stats.failed_scrapes += 1
+                    return result
+                else:
+                    stats.static_escalations[reason] = stats.static_escalations.get(reason, 0) + 1
+                    if reason == 'http_error' or (reason.startswith('status_') and is_transient_status(int(reason[7:]))):
+                        if self.circuit_breaker.record_failure(url):
+                            stats.circuits_opened += 1
+                    if self.circuit_breaker.is_open(url):
+                        result.error_message = HOST_PARKED
+                        stats.parked_urls += 1
+                        return result
+            
+            if job_data is None:
+                # Paso 1c: Navegar con Playwright / Paŝo 1c: Navigi per Playwright
+                await self._acquire_host(url, stats)
+                if not await self._navigate_with_retry(url, page or self.page, stats):
+                    self._collect_blocking_report(page, stats)
+                    result.error_message = "Failed to navigate to URL"
+                    stats.failed_scrapes += 1
+                    return result
+                
+                # Paso 2: Extraer datos / Paŝo 2: Ekstraki datumojn
+                job_data = await self.extract_job_data(url, page=page, stats=stats)
+                self._collect_blocking_report(page, stats)
+            
             if not job_data:
                 result.error_message = "Failed to extract job data"
-                self.stats.failed_scrapes += 1
+                stats.failed_scrapes += 1
                 return result
             
-            # Paso 3: Guardar en BD / Paŝo 3: Stoki en datumbazon
-            if self.save_to_db(job_data):
+            # Paso 2b: Archivar la página cruda fuera del event loop / Arkivi la krudan paĝon
+            raw_page = job_data.pop('raw_page', None)
+            if raw_page and self.page_archive:
+                job_data['raw_page_type'] = raw_page[0]
+                job_data['raw_page_key'] = await asyncio.to_thread(self.page_archive.put, raw_page[1])
+            
+            # Paso 3: Encolar para la escritura por lotes / Paŝo 3: Envicigi por la ara skribado
+            # Guardados y duplicados se cuentan al vaciar el lote (flush_jobs), y la
+            # URL se marca vista solo cuando su lote se confirma en BD
+            validated = await self.job_writer.put(job_data)
+            if validated:
                 result.success = True
-                result.job_data = JobCreate(**job_data)
-                self.stats.successful_scrapes += 1
+                result.job_data = validated
+                stats.successful_scrapes += 1
                 logger.info(f"✅ Scraping completado exitosamente")
             else:
-                result.error_message = "Failed to save to database"
-                self.stats.failed_scrapes += 1
+                result.error_message = "Failed to validate job data"
+                stats.failed_scrapes += 1
             
             return result
             
@@ -527,65 +692,343 @@ class LabortroviloScraper:
             logger.error(f"✗ Error en scrape_job: {e}")
             logger.error(traceback.format_exc())
             result.error_message = str(e)
-            self.stats.failed_scrapes += 1
+            stats.failed_scrapes += 1
             return result
     
-    async def scrape_multiple_jobs(self, urls: List[str]) -> List[ScrapingResult]:
+    async def _recycle_if_due(self, slot: List[Any], stats: ScrapingStats):
         """
-        Scrapea múltiples URLs con manejo de errores individual
-        Skrapas multajn URL-ojn kun individua erartraktado
+        Cambia el contexto de un worker por la reserva si superó sus límites
+        Interŝanĝas la kuntekston de laboristo kontraŭ la rezervo se ĝi superis siajn limojn
+        
+        Args:
+            slot: [contexto, página] del worker; se actualiza en el sitio
+            stats: Estadísticas del worker (reciclajes y pico de RSS)
         """
-        results = []
+        context, page = slot
+        reason = self.context_recycler.due(page, stats)
+        if not reason:
+            return
         
-        logger.info(f"📋 Iniciando scraping de {len(urls)} URLs...")
+        navigations = self.context_recycler.navigations.get(page, 0)
+        slot[0], slot[1] = await self.context_recycler.replacement()
+        if page is self.page:
+            self.context, self.page = slot
+        self.context_recycler.forget(page)
+        self.resource_blockers.pop(page, None)
+        stats.contexts_recycled += 1
+        logger.info(f"♻️ Contexto reciclado ({reason}) tras {navigations} navegaciones (RSS pico {stats.max_rss_mb} MB)")
         
-        for i, url in enumerate(urls, 1):
-            logger.info(f"\n🔄 Procesando {i}/{len(urls)}")
-            
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error cerrando contexto reciclado: {e}")
+    
+    async def scrape_multiple_jobs(
+        self,
+        urls: List[str],
+        concurrency: Optional[int] = None
+    ) -> List[ScrapingResult]:
+        """
+        Scrapea múltiples URLs con un pool acotado de páginas concurrentes
+        Skrapas multajn URL-ojn kun limigita aro de samtempaj paĝoj
+        
+        Cada worker tiene su propio contexto de navegador (tomado del pool
+        caliente) y sus propias estadísticas, que se agregan en self.stats al
+        terminar. Los resultados se devuelven en el mismo orden que las URLs
+        de entrada.
+        
+        Args:
+            urls: URLs a scrapear
+            concurrency: Número de páginas en paralelo (por defecto SCRAPER_CONCURRENCY)
+        """
+        concurrency = concurrency or settings.SCRAPER_CONCURRENCY
+        concurrency = max(1, min(concurrency, len(urls)))
+        results: Dict[int, ScrapingResult] = {}
+        
+        logger.info(f"📋 Iniciando scraping de {len(urls)} URLs con {concurrency} worker(s)...")
+        
+        # Cola de trabajo con índice para preservar el orden / Vico kun indekso por konservi la ordon
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, url in enumerate(urls):
+            queue.put_nowait((index, url))
+        for _ in range(concurrency):
+            queue.put_nowait(None)
+        
+        await self._run_workers(queue, concurrency, results, len(urls))
+        
+        return [
+            results.get(index) or ScrapingResult(success=False, url=url, error_message="URL not processed")
+            for index, url in enumerate(urls)
+        ]
+    
+    async def scrape_stream(
+        self,
+        urls: AsyncIterable[str],
+        concurrency: Optional[int] = None
+    ) -> List[ScrapingResult]:
+        """
+        Scrapea URLs a medida que llegan de un generador asíncrono
+        Skrapas URL-ojn laŭ ili alvenas el nesinkrona generatoro
+        
+        Mismo pool de workers que scrape_multiple_jobs, alimentado por una
+        cola acotada: la extracción empieza mientras la fuente (ej:
+        DiscoveryCrawler.discover) sigue produciendo, y si el pool va más
+        lento la fuente espera.
+        
+        Args:
+            urls: Fuente asíncrona de URLs
+            concurrency: Número de páginas en paralelo (por defecto SCRAPER_CONCURRENCY)
+        
+        Returns:
+            Resultados en el orden de llegada de las URLs
+        """
+        concurrency = max(1, concurrency or settings.SCRAPER_CONCURRENCY)
+        results: Dict[int, ScrapingResult] = {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        
+        logger.info(f"📋 Iniciando scraping en streaming con {concurrency} worker(s)...")
+        
+        async def produce():
             try:
-                result = await self.scrape_job(url)
-                results.append(result)
+                index = 0
+                async for url in urls:
+                    await queue.put((index, url))
+                    index += 1
+            except Exception as e:
+                logger.error(f"✗ Error en la fuente de URLs: {e}")
+            # Un marcador de fin por worker / Unu fina marko po laboristo
+            for _ in range(concurrency):
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            await self._run_workers(queue, concurrency, results)
+        finally:
+            producer.cancel()
+        
+        return [results[index] for index in sorted(results)]
+    
+    async def _run_workers(
+        self,
+        queue: asyncio.Queue,
+        concurrency: int,
+        results: Dict[int, ScrapingResult],
+        total: Optional[int] = None
+    ):
+        """
+        Consume (índice, URL) de la cola hasta un marcador None por worker
+        Konsumas (indekso, URL) el la vico ĝis marko None po laboristo
+        """
+        # El primer worker reutiliza la página principal / La unua laboristo reuzas la ĉefan paĝon
+        # Cada slot es [contexto, página] y cambia al reciclar / Ĉiu slot ŝanĝiĝas je reciklado
+        worker_slots: List[List[Any]] = [[self.context, self.page]]
+        for _ in range(concurrency - 1):
+            worker_slots.append(list(await self.context_recycler.acquire()))
+        
+        worker_stats = [ScrapingStats(start_time=self.stats.start_time) for _ in worker_slots]
+        
+        async def worker(worker_id: int, slot: List[Any], stats: ScrapingStats):
+            while True:
+                await self._recycle_if_due(slot, stats)
+                page = slot[1]
+
+                item = await queue.get()
+                if item is None:
+                    return
+                index, url = item
                 
-                # Pequeña pausa entre requests / Malgranda paŭzo inter petoj
-                await asyncio.sleep(2)
+                logger.info(f"\n🔄 [worker {worker_id}] Procesando {index + 1}/{total or '?'}")
                 
-            except Exception as e:
-                logger.error(f"✗ Error procesando {url}: {e}")
-                results.append(ScrapingResult(
-                    success=False,
-                    url=url,
-                    error_message=str(e)
-                ))
+                try:
+                    # La pausa entre requests la aplica el limitador por host
+                    # La paŭzon inter petoj aplikas la limigilo po gastiganto
+                    results[index] = await self.scrape_job(url, page=page, stats=stats)
+                except Exception as e:
+                    logger.error(f"✗ Error procesando {url}: {e}")
+                    results[index] = ScrapingResult(
+                        success=False,
+                        url=url,
+                        error_message=str(e)
+                    )
+        
+        try:
+            await asyncio.gather(*(
+                worker(worker_id, slot, stats)
+                for worker_id, (slot, stats) in enumerate(zip(worker_slots, worker_stats), 1)
+            ))
+        finally:
+            # Los contextos vuelven al pool caliente / La kuntekstoj revenas al la varma aro
+            for context, page in worker_slots[1:]:
+                self.context_recycler.release(context, page)
+            
+            # Agregar estadísticas de los workers / Agregi statistikojn de la laboristoj
+            for stats in worker_stats:
+                self.stats.merge(stats)
+            
+            await self.flush_jobs()
         
-        # Resumen final / Fina resumo
+        self._log_summary()
+    
+    def _log_summary(self):
+        """Resumen final / Fina resumo"""
         logger.info(f"\n{'='*80}")
         logger.info(f"📊 RESUMEN DE SCRAPING:")
         logger.info(f"   Total URLs: {self.stats.total_urls}")
         logger.info(f"   Exitosos: {self.stats.successful_scrapes}")
         logger.info(f"   Fallidos: {self.stats.failed_scrapes}")
-        logger.info(f"   Duplicados: {self.stats.duplicates_found}")
+        logger.info(f"   Duplicados: {self.stats.duplicates_found} ({self.stats.skipped_known} sin navegar)")
         logger.info(f"   Guardados en BD: {self.stats.saved_to_db}")
         logger.info(f"   Tasa de éxito: {self.stats.calculate_success_rate()}%")
+        for host, seconds in sorted(self.stats.host_wait_seconds.items()):
+            logger.info(f"   Espera por cortesía en {host}: {seconds:.1f}s")
+        for path, count in sorted(self.stats.extraction_paths.items()):
+            logger.info(f"   Extracción {path}: {count}")
+        for reason, count in sorted(self.stats.static_escalations.items()):
+            logger.info(f"   Escalado a Playwright ({reason}): {count}")
+        for platform, histogram in sorted(self.stats.ready_histograms.items()):
+            logger.info(f"   Tiempo hasta lista ({platform}): {histogram}")
+        if self.stats.requests_blocked:
+            logger.info(
+                f"   Recursos bloqueados: {self.stats.requests_blocked} "
+                f"(~{self.stats.estimated_bytes_saved / (1024 * 1024):.1f} MB ahorrados, estimado)"
+            )
+        if self.stats.db_flushes:
+            logger.info(
+                f"   Escritor BD: {self.stats.db_flushes} lotes, "
+                f"{self.stats.db_flush_seconds / self.stats.db_flushes:.3f}s/lote, "
+                f"latencia máx {self.stats.db_max_latency_seconds:.2f}s, "
+                f"cola máx {self.stats.db_queue_max_depth}, "
+                f"esperas por backpressure {self.stats.db_backpressure_waits}"
+            )
+        if self.stats.retries or self.stats.parked_urls:
+            logger.info(
+                f"   Reintentos: {self.stats.retries}, circuitos abiertos: {self.stats.circuits_opened}, "
+                f"URLs aparcadas: {self.stats.parked_urls}"
+            )
+        if self.stats.contexts_recycled or self.stats.max_rss_mb:
+            logger.info(
+                f"   Contextos reciclados: {self.stats.contexts_recycled} "
+                f"(RSS pico {self.stats.max_rss_mb} MB)"
+            )
         logger.info(f"{'='*80}\n")
+    
+    @staticmethod
+    async def _renew_lease(frontier: CrawlFrontier, batch: List[Dict[str, Any]]):
+        """
+        Extiende el lease del lote cada tercio de su duración hasta ser cancelada
+        Plilongigas la luon de la aro ĉiun trionon de ĝia daŭro ĝis nuligo
+        """
+        while True:
+            await asyncio.sleep(frontier.lease_seconds / 3)
+            try:
+                held = await asyncio.to_thread(frontier.renew, batch)
+            except SQLAlchemyError as e:
+                logger.warning(f"⚠️ No se pudo renovar el lease del lote: {e}")
+                continue
+            if held < len(batch):
+                logger.warning(f"⚠️ Lease perdido para {len(batch) - held} URLs del lote")
+    
+    async def scrape_frontier(
+        self,
+        frontier: Optional[CrawlFrontier] = None,
+        batch_size: Optional[int] = None,
+        max_urls: Optional[int] = None
+    ) -> int:
+        """
+        Consume la frontera persistente por lotes con lease
+        Konsumas la persistan limon per luitaj aroj
+        
+        Cada lote se confirma en BD (ofertas y estado de la frontera) antes de
+        tomar el siguiente, así que si el proceso muere solo se repite el lote
+        en curso cuando caduque su lease.
+        
+        Args:
+            frontier: Frontera a consumir (por defecto CrawlFrontier())
+            batch_size: URLs por lote (por defecto FRONTIER_BATCH_SIZE)
+            max_urls: Límite de URLs en esta ejecución (por defecto sin límite)
+        
+        Returns:
+            Número de URLs procesadas
+        """
+        frontier = frontier or CrawlFrontier()
+        batch_size = batch_size or settings.FRONTIER_BATCH_SIZE
+        processed = 0
         
-        return results
+        while max_urls is None or processed < max_urls:
+            size = batch_size if max_urls is None else min(batch_size, max_urls - processed)
+            # Saltar hosts con el circuito abierto / Transsalti gastigantojn kun malfermita cirkvito
+            open_hosts = self.circuit_breaker.open_hosts()
+            batch = await asyncio.to_thread(frontier.lease, size, None, open_hosts)
+            if not batch:
+                logger.info("🧭 Frontera vacía" + (f" (hosts aparcados: {len(open_hosts)})" if open_hosts else ""))
+                break
+            
+            logger.info(f"🧭 Lote de frontera: {len(batch)} URLs (worker {frontier.worker_id})")
+            # Renovar el lease mientras dure el lote / Renovigi la luon dum la aro daŭras
+            renewal = asyncio.create_task(self._renew_lease(frontier, batch))
+            try:
+                results = await self.scrape_multiple_jobs([entry['url'] for entry in batch])
+            except BaseException:
+                # Parada ordenada: devolver el lote sin gastar intento
+                # Orda halto: redoni la aron sen elspezi provon
+                await asyncio.to_thread(frontier.release, batch)
+                raise
+            finally:
+                renewal.cancel()
+            
+            # URLs de hosts con el circuito abierto: aparcar hasta su reapertura
+            # URL-oj de gastigantoj kun malfermita cirkvito: parkumi ĝis remalfermo
+            parked: Dict[str, List[Dict[str, Any]]] = {}
+            finished, outcomes = [], []
+            for entry, result in zip(batch, results):
+                if result.error_message == HOST_PARKED:
+                    parked.setdefault(self.rate_limiter.host_for(entry['url']), []).append(entry)
+                    continue
+                if entry['url'] in self.unsaved_urls:
+                    # Extraída pero su lote no llegó a BD: reintentar / Ekstraktita sed ne konservita
+                    self.unsaved_urls.discard(entry['url'])
+                    result.success, result.error_message = False, WRITE_FAILED
+                finished.append(entry)
+                outcomes.append((
+                    result.success or result.error_message == ALREADY_STORED,
+                    result.error_message,
+                    result.error_message != POSTING_GONE,
+                ))
+            
+            await asyncio.to_thread(frontier.complete, finished, outcomes)
+            for host, entries in parked.items():
+                wait = max(1.0, self.circuit_breaker.retry_after(entries[0]['url']))
+                await asyncio.to_thread(frontier.park, entries, wait)
+                logger.info(f"🅿️ {len(entries)} URLs de {host} aparcadas {wait:.0f}s")
+            processed += len(batch)
+        
+        return processed
 
 
 # ============================================================
-# FUNCIÓN MAIN PARA TEST / ĈEFA FUNKCIO POR TESTO
+# FUNCIÓN MAIN / ĈEFA FUNKCIO
 # ============================================================
 
 async def main():
     """
-    Función principal para ejecutar test básico del scraper
-    Ĉefa funkcio por plenumi bazan teston de la skrapilo
+    Encola las URLs recibidas como argumentos y consume la frontera
+    Envicigas la URL-ojn ricevitajn kiel argumentoj kaj konsumas la limon
+    
+    Uso / Uzo / Usage:
+        python -m src.scraper_engine [URL ...]
     """
-    logger.info("🚀 Iniciando Labortrovilo Scraper Engine - TEST MODE")
+    import sys
+    logger.info("🚀 Iniciando Labortrovilo Scraper Engine")
     
     # Inicializar base de datos / Ekigi datumbazon
     from src.database import init_db
     init_db()
     
+    frontier = CrawlFrontier()
+    if len(sys.argv) > 1:
+        frontier.enqueue(sys.argv[1:], source='manual')
+    logger.info(f"🧭 Frontera: {frontier.counts()}")
+    
     # Crear instancia del scraper / Krei ekzempleron de la skrapilo
     scraper = LabortroviloScraper(headless=True)
     
@@ -593,18 +1036,9 @@ async def main():
         # Inicializar navegador / Ekigi retumilon
         await scraper.initialize()
         
-        # URLs de prueba (reemplazar con URLs reales)
-        # Provaj URL-oj (anstataŭigi per realaj URL-oj)
-        test_urls = [
-            "https://boards.greenhouse.io/embed/job_app?token=example",
-            # Agregar más URLs aquí / Aldoni pli da URL-oj ĉi tie
-        ]
-        
-        logger.warning("⚠️ NOTA: Usar URLs reales de ATS para pruebas reales")
-        logger.warning("⚠️ Los selectores genéricos deben personalizarse por ATS")
-        
-        # Scrapear trabajos / Skrapi laborojn
-        results = await scraper.scrape_multiple_jobs(test_urls)
+        # Consumir la frontera (reanuda lotes de ejecuciones caídas)
+        # Konsumi la limon (daŭrigas arojn de falintaj ruloj)
+        await scraper.scrape_frontier(frontier)
         
         # Mostrar estadísticas de BD / Montri datumbazajn statistikojn
         db_stats = db_manager.get_stats()
@@ -0,0 +1,181 @@
+"""
+Índice de URLs Conocidas / Indekso de Konataj URL-oj
+Senior Data Engineer Architecture - Pre-navigation URL dedupe
+
+Filtro de Bloom sobre la URL canónica (src/url_canonicalizer.py), precargado
+desde Job.url y persistido entre ejecuciones. Se
+consulta antes de navegar: una oferta ya guardada se descarta sin abrir el
+navegador. Los positivos del filtro se confirman contra la BD, así que un
+falso positivo nunca hace perder una oferta nueva.
+"""
+import hashlib
+import logging
+import math
+import os
+import struct
+from typing import Optional, Iterable, Set
+
+from sqlalchemy import select, func
+
+from src.database import get_db
+from src.models import Job
+from src.url_canonicalizer import canonicalize
+from config import settings
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Cabecera del archivo persistido: magic, bits, hashes, elementos
+# Kaplinio de la konservita dosiero: magio, bitoj, haketoj, elementoj
+_HEADER = struct.Struct('<4sQIQ')
+# Cambia si cambian las claves del filtro (fuerza reconstrucción) / Ŝanĝu se la ŝlosiloj ŝanĝiĝas
+_MAGIC = b'LTB2'
+
+
+def url_key(url: str) -> str:
+    """Clave del filtro: la URL canónica / Ŝlosilo de la filtrilo: la kanona URL"""
+    return canonicalize(url).url
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom con doble hashing sobre blake2b
+    Bloom-filtrilo kun duobla haketado super blake2b
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: Elementos esperados
+            error_rate: Tasa de falsos positivos a esa capacidad
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        """Añade un elemento / Aldonas elementon"""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def save(self, path: str):
+        """Persiste el filtro en disco / Konservas la filtrilon sur disko"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"  # Varios procesos pueden guardar a la vez
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BloomFilter"]:
+        """Carga un filtro persistido, o None si no es válido / Ŝargas konservitan filtrilon"""
+        try:
+            with open(path, 'rb') as f:
+                magic, num_bits, num_hashes, count = _HEADER.unpack(f.read(_HEADER.size))
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8:
+            return None
+
+        bloom = cls.__new__(cls)
+        bloom.num_bits, bloom.num_hashes, bloom.count, bloom.bits = num_bits, num_hashes, count, bits
+        return bloom
+
+
+class SeenUrlIndex:
+    """
+    Conjunto de URLs ya guardadas, consultado antes de navegar
+    Aro de jam konservitaj URL-oj, konsultata antaŭ navigi
+
+    Uso / Uzo / Usage:
+        index = SeenUrlIndex.open()
+        if index.is_known(url): ...   # saltar sin navegador
+        index.add(url)                # tras confirmar su lote en BD
+        index.save()
+    """
+
+    def __init__(self, bloom: BloomFilter, path: Optional[str] = None):
+        self.bloom = bloom
+        self.path = path
+        # URLs añadidas en esta ejecución (ya confirmadas en BD)
+        # URL-oj aldonitaj en ĉi tiu rulo (jam konfirmitaj en la datumbazo)
+        self.session_urls: Set[str] = set()
+        self.false_positives = 0
+
+    @classmethod
+    def open(cls, path: Optional[str] = None) -> "SeenUrlIndex":
+        """
+        Carga el filtro persistido o lo reconstruye desde Job.url
+        Ŝargas la konservitan filtrilon aŭ rekonstruas ĝin el Job.url
+
+        Se reconstruye si no existe, si está corrupto o si la tabla tiene más
+        filas de las que el filtro conoce (escrituras de otro proceso).
+        """
+        path = path or settings.SEEN_URLS_PATH
+        with get_db() as db:
+            total = db.scalar(select(func.count(Job.id))) or 0
+
+        bloom = BloomFilter.load(path)
+        if bloom is not None and bloom.count >= total:
+            logger.info(f"🧮 Índice de URLs cargado: {bloom.count} URLs ({path})")
+            return cls(bloom, path)
+
+        capacity = max(settings.SEEN_URLS_CAPACITY, total * 2)
+        bloom = BloomFilter(capacity, settings.SEEN_URLS_ERROR_RATE)
+        with get_db() as db:
+            for url in db.scalars(select(Job.url).execution_options(yield_per=10_000)):
+                bloom.add(url_key(url))
+        logger.info(f"🧮 Índice de URLs reconstruido desde BD: {bloom.count} URLs")
+        return cls(bloom, path)
+
+    def might_contain(self, url: str) -> bool:
+        """Consulta solo en memoria (puede dar falsos positivos) / Nur-memora konsulto"""
+        key = url_key(url)
+        return key in self.session_urls or key in self.bloom
+
+    def is_known(self, url: str) -> bool:
+        """
+        ¿La oferta ya está guardada?
+        Ĉu la oferto jam estas konservita?
+
+        Solo toca la BD cuando el filtro da positivo, para descartar falsos positivos.
+        """
+        key = url_key(url)
+        if key in self.session_urls:
+            return True
+        if key not in self.bloom:
+            return False
+
+        with get_db() as db:
+            exists = db.scalar(select(Job.id).where(Job.url.in_({url, key})).limit(1)) is not None
+        if not exists:
+            self.false_positives += 1
+        return exists
+
+    def add(self, url: str):
+        """Marca una URL como vista / Markas URL-on kiel viditan"""
+        key = url_key(url)
+        if key not in self.session_urls:
+            self.session_urls.add(key)
+            self.bloom.add(key)
+
+    def save(self):
+        """Persiste el filtro para la siguiente ejecución / Konservas la filtrilon"""
+        if self.path:
+            self.bloom.save(self.path)
+            logger.info(f"💾 Índice de URLs guardado: {self.bloom.count} URLs ({self.path})")
@@ -0,0 +1,140 @@
+"""
+Nivel de Extracción sobre HTML Estático / Ekstrakta Nivelo super Statika HTML
+Senior Data Engineer Architecture - Static-HTML extraction tier
+
+Descarga el HTML crudo con httpx y extrae con lxml/selectores CSS. Solo si la
+página parece renderizada por JavaScript (body vacío, shell de SPA, campos
+clave ausentes) se escala a Playwright.
+"""
+import logging
+import re
+from typing import Optional, Dict, Any, Tuple
+
+import httpx
+
+from src.ats_api import create_http_client
+from src.extractors import JobExtractor
+
+# Configurar logging / Agordi registradon / Configure logging
+logger = logging.getLogger(__name__)
+
+# Tamaño máximo de HTML a procesar / Maksimuma grandeco de HTML
+MAX_HTML_BYTES = 5 * 1024 * 1024
+
+# Contenedores vacíos típicos de SPAs (React, Vue, Next, Angular)
+_SPA_SHELL_PATTERN = re.compile(
+    r'<(?:div|main)[^>]+id=["\'](?:root|app|__next|__nuxt)["\'][^>]*>\s*</(?:div|main)>|<app-root[^>]*>\s*</app-root>',
+    re.IGNORECASE
+)
+_NOSCRIPT_PATTERN = re.compile(r'<noscript[^>]*>[^<]*(?:enable|habilit)[^<]*javascript', re.IGNORECASE)
+_STRIP_PATTERN = re.compile(r'<(script|style|noscript|template)[^>]*>.*?</\1>|<[^>]+>', re.IGNORECASE | re.DOTALL)
+
+# Texto mínimo en el body para considerar la página renderizada en servidor
+MIN_BODY_TEXT = 200
+
+
+def detect_js_rendering(html_text: str) -> Optional[str]:
+    """
+    Detecta si el HTML necesita JavaScript para mostrar el contenido
+    Detektas ĉu la HTML bezonas JavaScript por montri la enhavon
+
+    Returns:
+        Motivo para escalar a Playwright, o None si el HTML es utilizable
+    """
+    if _SPA_SHELL_PATTERN.search(html_text):
+        return 'spa_shell'
+    if _NOSCRIPT_PATTERN.search(html_text):
+        return 'noscript'
+
+    body_match = re.search(r'<body[^>]*>(.*)</body>', html_text, re.IGNORECASE | re.DOTALL)
+    body = body_match.group(1) if body_match else html_text
+    text = ' '.join(_STRIP_PATTERN.sub(' ', body).split())
+    if len(text) < MIN_BODY_TEXT:
+        return 'empty_body'
+    return None
+
+
+class StaticHtmlFetcher:
+    """
+    Extracción sin navegador para páginas renderizadas en servidor
+    Senretumila ekstraktado por servile bildigitaj paĝoj
+
+    Uso / Uzo / Usage:
+        fetcher = StaticHtmlFetcher()
+        fields, reason = await fetcher.fetch_fields(url, extractor)
+        if fields is None:
+            ...  # escalar a Playwright (reason explica por qué)
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Cliente httpx compartido (por defecto uno propio con pool)
+        """
+        self._owns_client = client is None
+        self.client = client or create_http_client()
+
+    async def fetch_html(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Descarga el HTML crudo / Elŝutas la krudan HTML
+
+        Returns:
+            (html, None) o (None, motivo del fallo)
+        """
+        try:
+            response = await self.client.get(url, headers={'Accept': 'text/html,application/xhtml+xml'})
+        except httpx.HTTPError as e:
+            logger.debug(f"Error descargando HTML de {url}: {e}")
+            return None, 'http_error'
+
+        if response.status_code != 200:
+            return None, f"status_{response.status_code}"
+        if 'html' not in response.headers.get('content-type', 'text/html').lower():
+            return None, 'not_html'
+        if len(response.content) > MAX_HTML_BYTES:
+            return None, 'too_large'
+        return response.text, None
+
+    def extract(self, html_text: str, extractor: JobExtractor) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Extrae campos del HTML o indica por qué hay que escalar
+        Ekstraktas kampojn el la HTML aŭ indikas kial eskaladi
+
+        Returns:
+            (campos, None) si el HTML basta, o (None, motivo)
+        """
+        fields = extractor.extract_html(html_text)
+
+        # Con título y descripción completos el HTML es suficiente, aunque sea una SPA con SSR
+        if fields.get('title') and fields.get('description'):
+            fields['extraction_path'] = f"static:{fields['extraction_path']}"
+            return fields, None
+
+        return None, detect_js_rendering(html_text) or 'missing_fields'
+
+    async def fetch_fields(self, url: str, extractor: JobExtractor) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Descarga y extrae la oferta sin navegador
+        Elŝutas kaj ekstraktas la oferton sen retumilo
+
+        Returns:
+            (campos, None) o (None, motivo para escalar a Playwright)
+        """
+        html_text, reason = await self.fetch_html(url)
+        fields = None
+        if html_text is not None:
+            fields, reason = self.extract(html_text, extractor)
+            if fields:
+                # HTML crudo para el archivo de páginas (src/page_archive.py)
+                fields['raw_page'] = ('html', html_text)
+
+        if fields is None:
+            logger.info(f"↗️ Escalando a Playwright ({reason}): {url}")
+        else:
+            logger.info(f"⚡ Oferta extraída de HTML estático: {fields['title']}")
+        return fields, reason
+
+    async def close(self):
+        """Cierra el pool de conexiones / Fermas la konektan aron"""
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,205 @@
+"""
+Canonicalización de URLs de Ofertas / Kanonigo de Oferto-URL-oj
+Senior Data Engineer Architecture - Job posting URL canonicalization
+
+La misma oferta llega con gh_jid, utm_*, lever-source, barras finales o como
+embed en vez de board; cada variante pasaba la restricción única de Job.url.
+Aquí cada ATS tiene sus reglas para producir una URL canónica estable y el
+external_id, que usan tanto el scraper como el índice de deduplicación.
+"""
+import re
+from typing import Optional, NamedTuple, Callable, Dict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, SplitResult
+
+from src.schemas import SourcePlatform
+
+# Dominio → plataforma ATS / Domajno → ATS-platformo
+PLATFORM_DOMAINS: Dict[str, SourcePlatform] = {
+    'greenhouse.io': SourcePlatform.GREENHOUSE,
+    'lever.co': SourcePlatform.LEVER,
+    'myworkdayjobs.com': SourcePlatform.WORKDAY,
+    'smartrecruiters.com': SourcePlatform.SMARTRECRUITERS,
+    'workable.com': SourcePlatform.WORKABLE,
+    'bamboohr.com': SourcePlatform.BAMBOOHR,
+    'jobvite.com': SourcePlatform.JOBVITE,
+    'icims.com': SourcePlatform.ICIMS,
+    'linkedin.com': SourcePlatform.LINKEDIN,
+    'indeed.com': SourcePlatform.INDEED,
+}
+
+# Parámetros de tracking que no identifican la oferta / Spuraj parametroj
+_TRACKING_PREFIXES = ('utm_', 'lever-', 'gh_')
+_TRACKING_PARAMS = {'ref', 'source', 'src', 'fbclid', 'gclid', 'trk', 'refid', 'trackingid'}
+
+
+class CanonicalUrl(NamedTuple):
+    """URL canónica de una oferta / Kanona URL de oferto"""
+    url: str
+    platform: SourcePlatform
+    external_id: Optional[str]
+
+
+def detect_source_platform(url: str) -> SourcePlatform:
+    """
+    Detecta la plataforma ATS basándose en la URL
+    Detektas la ATS-platformon bazite sur la URL
+    """
+    domain = urlsplit(url).netloc.lower()
+    for key, platform in PLATFORM_DOMAINS.items():
+        if key in domain:
+            return platform
+    return SourcePlatform.CUSTOM
+
+
+def _build(parts: SplitResult, path: str, query: str = '') -> str:
+    return urlunsplit(('https', parts.netloc.lower(), path, query, ''))
+
+
+def normalize_url(url: str) -> str:
+    """
+    Limpieza genérica: minúsculas en esquema y host, sin fragmento, sin barra
+    final ni parámetros de tracking
+    Ĝenerala purigo: minuskla skemo kaj gastiganto, sen fragmento, fina
+    oblikvo aŭ spuraj parametroj
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PREFIXES)
+    ))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+# ============================================================
+# REGLAS POR ATS / REGULOJ PO ATS
+# Cada regla devuelve (url canónica, external_id) o None si no reconoce la forma
+# ============================================================
+
+def _greenhouse(parts: SplitResult, query: Dict[str, str]):
+    host = parts.netloc.lower()
+    if re.match(r'^(?:boards|job-boards)\.greenhouse\.io$', host):
+        if parts.path.startswith('/embed/job_app'):
+            board, job_id = query.get('for'), query.get('token')
+        else:
+            match = re.match(r'^/([^/]+)/jobs/(\d+)', parts.path)
+            board, job_id = match.groups() if match else (None, None)
+        if board and job_id and job_id.isdigit():
+            return f"https://boards.greenhouse.io/{board.lower()}/jobs/{job_id}", job_id
+    return None
+
+
+def _gh_jid(parts: SplitResult, query: Dict[str, str]):
+    # Sitio de empleo propio con Greenhouse embebido: ?gh_jid=123
+    job_id = query.get('gh_jid')
+    if job_id and job_id.isdigit():
+        return _build(parts, parts.path.rstrip('/') or '/', urlencode({'gh_jid': job_id})), job_id
+    return None
+
+
+def _lever(parts: SplitResult, query: Dict[str, str]):
+    match = re.match(r'^/([^/]+)/([0-9a-f-]{36})', parts.path, re.IGNORECASE)
+    if match:
+        board, job_id = match.group(1).lower(), match.group(2).lower()
+        return f"https://jobs.lever.co/{board}/{job_id}", job_id
+    return None
+
+
+def _smartrecruiters(parts: SplitResult, query: Dict[str, str]):
+    match = re.match(r'^/([^/]+)/(\d+)', parts.path)
+    if match:
+        board, job_id = match.group(1).lower(), match.group(2)
+        return f"https://jobs.smartrecruiters.com/{board}/{job_id}", job_id
+    return None
+
+
+def _workable(parts: SplitResult, query: Dict[str, str]):
+    match = re.match(r'^/([^/]+)/j/([0-9A-Za-z]+)', parts.path)
+    if match:
+        board, job_id = match.group(1).lower(), match.group(2).upper()
+        return f"https://apply.workable.com/{board}/j/{job_id}", job_id
+    return None
+
+
+def _workday(parts: SplitResult, query: Dict[str, str]):
+    # /en-US/External/job/Buenos-Aires/Data-Engineer_JR-0042/apply
+    path = re.sub(r'^/[a-z]{2}-[A-Z]{2}(?=/)', '', parts.path)
+    path = re.sub(r'/apply(?:/.*)?$', '', path).rstrip('/')
+    match = re.search(r'/job/.+_([A-Za-z0-9-]+)$', path)
+    if match:
+        return _build(parts, path), match.group(1)
+    return None
+
+
+def _jobvite(parts: SplitResult, query: Dict[str, str]):
+    match = re.match(r'^/([^/]+)/job/([0-9A-Za-z]+)', parts.path)
+    if match:
+        return _build(parts, f"/{match.group(1).lower()}/job/{match.group(2)}"), match.group(2)
+    return None
+
+
+def _icims(parts: SplitResult, query: Dict[str, str]):
+    match = re.match(r'^/jobs/(\d+)', parts.path)
+    if match:
+        return _build(parts, f"/jobs/{match.group(1)}/job"), match.group(1)
+    return None
+
+
+def _bamboohr(parts: SplitResult, query: Dict[str, str]):
+    match = re.match(r'^/(?:careers|jobs)/(\d+)', parts.path)
+    job_id = match.group(1) if match else query.get('id') if parts.path.endswith('view.php') else None
+    if job_id and job_id.isdigit():
+        return _build(parts, f"/careers/{job_id}"), job_id
+    return None
+
+
+def _linkedin(parts: SplitResult, query: Dict[str, str]):
+    match = re.search(r'/jobs/view/(?:[^/]*?-)?(\d+)', parts.path)
+    job_id = match.group(1) if match else query.get('currentJobId')
+    if job_id and job_id.isdigit():
+        return f"https://www.linkedin.com/jobs/view/{job_id}", job_id
+    return None
+
+
+def _indeed(parts: SplitResult, query: Dict[str, str]):
+    job_key = query.get('jk') or query.get('vjk')
+    if job_key:
+        return _build(parts, '/viewjob', urlencode({'jk': job_key})), job_key
+    return None
+
+
+CANONICAL_RULES: Dict[SourcePlatform, Callable] = {
+    SourcePlatform.GREENHOUSE: _greenhouse,
+    SourcePlatform.LEVER: _lever,
+    SourcePlatform.SMARTRECRUITERS: _smartrecruiters,
+    SourcePlatform.WORKABLE: _workable,
+    SourcePlatform.WORKDAY: _workday,
+    SourcePlatform.JOBVITE: _jobvite,
+    SourcePlatform.ICIMS: _icims,
+    SourcePlatform.BAMBOOHR: _bamboohr,
+    SourcePlatform.LINKEDIN: _linkedin,
+    SourcePlatform.INDEED: _indeed,
+}
+
+
+def canonicalize(url: str) -> CanonicalUrl:
+    """
+    URL canónica, plataforma y external_id de una oferta
+    Kanona URL, platformo kaj external_id de oferto
+
+    Si ninguna regla reconoce la forma se aplica solo la limpieza genérica
+    (normalize_url) y external_id queda en None.
+    """
+    platform = detect_source_platform(url)
+    parts = urlsplit(url.strip())
+    query = {key: value for key, value in parse_qsl(parts.query)}
+
+    rule = CANONICAL_RULES.get(platform)
+    canonical = rule(parts, query) if rule else None
+    if canonical is None:
+        canonical = _gh_jid(parts, query)
+    if canonical is None:
+        return CanonicalUrl(normalize_url(url), platform, None)
+
+    canonical_url, external_id = canonical
+    return CanonicalUrl(canonical_url, platform, external_id)
@@ -0,0 +1,119 @@
+"""
+Test de la Ruta Rápida HTTP para APIs de ATS
+Testo de la Rapida HTTP-vojo por ATS-API-oj
+Test for the ATS JSON API fast path
+
+Levanta un servidor HTTP local con payloads de ejemplo (sin red ni navegador)
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.ats_api import ATSApiFetcher, resolve_posting
+from src.schemas import SourcePlatform
+
+
+# Payloads de ejemplo / Ekzemplaj payloads
+FIXTURES = {
+    '/greenhouse/acme/4012345': {
+        'id': 4012345,
+        'title': 'Senior Python Engineer',
+        'company_name': 'Acme Corp',
+        'location': {'name': 'Buenos Aires, Argentina'},
+        'content': '&lt;p&gt;We build &lt;strong&gt;data pipelines&lt;/strong&gt;.&lt;/p&gt;',
+        'first_published': '2025-11-01T12:00:00-03:00',
+    },
+    '/lever/globex/0b6a3c4e-1111-2222-3333-444455556666': {
+        'id': '0b6a3c4e-1111-2222-3333-444455556666',
+        'text': 'Backend Developer',
+        'categories': {'location': 'Remote - LATAM'},
+        'descriptionPlain': 'Join our platform team.',
+        'lists': [{'text': 'Requirements', 'content': '<li>Go</li><li>Postgres</li>'}],
+        'workplaceType': 'remote',
+        'createdAt': 1730462400000,
+        'salaryRange': {'min': 60000, 'max': 80000, 'currency': 'USD', 'interval': 'per-year-salary'},
+    },
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        payload = FIXTURES.get(self.path)
+        body = json.dumps(payload or {'error': 'not found'}).encode()
+        self.send_response(200 if payload else 404)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _fetch(urls):
+    server = _start_server()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    fetcher = ATSApiFetcher(endpoints={
+        SourcePlatform.GREENHOUSE: base + "/greenhouse/{board}/{job_id}",
+        SourcePlatform.LEVER: base + "/lever/{board}/{job_id}",
+    })
+
+    async def run():
+        try:
+            return [await fetcher.fetch_fields(url) for url in urls]
+        finally:
+            await fetcher.close()
+
+    try:
+        return asyncio.run(run())
+    finally:
+        server.shutdown()
+
+
+def test_resolve_posting():
+    """Reconoce URLs de oferta con API pública"""
+    assert resolve_posting('https://boards.greenhouse.io/acme/jobs/4012345?gh_jid=4012345') == \
+        (SourcePlatform.GREENHOUSE, 'acme', '4012345')
+    assert resolve_posting('https://boards.greenhouse.io/embed/job_app?for=acme&token=4012345') == \
+        (SourcePlatform.GREENHOUSE, 'acme', '4012345')
+    assert resolve_posting('https://jobs.lever.co/globex/0b6a3c4e-1111-2222-3333-444455556666/apply')[0] == \
+        SourcePlatform.LEVER
+    assert resolve_posting('https://apply.workable.com/initech/j/AB12CD34EF/')[2] == 'AB12CD34EF'
+    assert resolve_posting('https://careers.example.com/jobs/1') is None
+
+
+def test_fetch_greenhouse_and_lever():
+    """Convierte payloads JSON a campos del scraper"""
+    greenhouse, lever, missing = _fetch([
+        'https://boards.greenhouse.io/acme/jobs/4012345',
+        'https://jobs.lever.co/globex/0b6a3c4e-1111-2222-3333-444455556666',
+        'https://boards.greenhouse.io/acme/jobs/999',
+    ])
+
+    assert greenhouse['title'] == 'Senior Python Engineer'
+    assert greenhouse['company'] == 'Acme Corp'
+    assert greenhouse['description'] == 'We build data pipelines.'
+    assert greenhouse['external_id'] == '4012345'
+    assert greenhouse['posted_date'].hour == 15
+    assert greenhouse['extraction_path'] == 'greenhouse:api'
+
+    assert lever['company'] == 'Globex'
+    assert lever['is_remote'] is True
+    assert 'Postgres' in lever['description']
+    assert (lever['salary_min'], lever['salary_max'], lever['salary_currency']) == (60000.0, 80000.0, 'USD')
+
+    # 404 → None para que el scraper use Playwright
+    assert missing is None
+
+
+if __name__ == "__main__":
+    test_resolve_posting()
+    test_fetch_greenhouse_and_lever()
+    print("✅ Tests de ATS API completados")
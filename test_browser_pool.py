@@ -0,0 +1,34 @@
+"""
+Test del Reciclaje de Contextos
+Testo de la Reciklado de Kuntekstoj
+Test for RSS-triggered context recycling
+"""
+from src import browser_pool
+from src.browser_pool import ContextRecycler
+
+
+def _recycler(monkeypatch, rss: float) -> ContextRecycler:
+    monkeypatch.setattr(browser_pool, 'process_tree_rss_mb', lambda root_pid=None: rss)
+    return ContextRecycler(None, max_navigations=0, max_rss_mb=1500, sample_every=1, warm_spare=False)
+
+
+def test_rss_breach_recycles_one_context(monkeypatch):
+    """Solo el contexto con más navegaciones se recicla, luego hay pausa"""
+    recycler = _recycler(monkeypatch, 2000.0)
+    light, heavy = object(), object()
+    for page, navigations in ((light, 2), (heavy, 5)):
+        for _ in range(navigations):
+            recycler.record_navigation(page)
+
+    assert recycler.due(light) is None
+    assert recycler.due(heavy) == 'rss'
+    assert recycler.due(light) is None  # En pausa / En paŭzo
+
+
+def test_remote_browser_skips_rss(monkeypatch):
+    """Con navegador compartido la RSS local no decide / Kun komuna retumilo"""
+    recycler = _recycler(monkeypatch, 2000.0)
+    recycler.remote_browser = True
+    page = object()
+    recycler.record_navigation(page)
+    assert recycler.due(page) is None
@@ -0,0 +1,81 @@
+"""
+Test de la Frontera Persistente
+Testo de la Persista Limo
+Test for frontier leases: expiry, re-lease and stale-token rejection
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from src.database import get_db
+from src.frontier import CrawlFrontier, LEASED, PENDING, DONE, FAILED
+from src.models import FrontierUrl
+
+URLS = [
+    'https://boards.greenhouse.io/acme/jobs/1',
+    'https://boards.greenhouse.io/acme/jobs/2',
+]
+
+
+def _expire_leases():
+    with get_db() as db:
+        db.execute(update(FrontierUrl).values(lease_until=datetime.utcnow() - timedelta(seconds=1)))
+
+
+def _states():
+    with get_db() as db:
+        return dict(db.execute(select(FrontierUrl.url, FrontierUrl.status)).all())
+
+
+def test_lease_is_exclusive_until_it_expires(temp_db):
+    """Un lote vigente no se reparte; al caducar lo retoma otro worker"""
+    first, second = CrawlFrontier('a', lease_seconds=60), CrawlFrontier('b', lease_seconds=60)
+    assert first.enqueue(URLS + URLS[:1]) == 2
+
+    batch = first.lease(10)
+    assert {entry['url'] for entry in batch} == set(URLS)
+    assert second.lease(10) == []
+
+    _expire_leases()
+    retaken = second.lease(10)
+    assert {entry['url'] for entry in retaken} == set(URLS)
+    assert all(entry['attempts'] == 2 for entry in retaken)
+    assert retaken[0]['lease_token'] != batch[0]['lease_token']
+
+
+def test_stale_lease_cannot_close_entries(temp_db):
+    """Tras perder el lease, complete/renew/park/release no pisan al nuevo dueño"""
+    first, second = CrawlFrontier('a', lease_seconds=60), CrawlFrontier('b', lease_seconds=60)
+    first.enqueue(URLS)
+    stale = first.lease(10)
+    _expire_leases()
+    current = second.lease(10)
+
+    first.complete(stale, [(True, None)] * len(stale))
+    first.park(stale, 60)
+    first.release(stale)
+    assert first.renew(stale) == 0
+    assert set(_states().values()) == {LEASED}
+
+    assert second.renew(current) == len(current)
+    by_url = {entry['url']: entry for entry in current}
+    second.complete(
+        [by_url[URLS[0]], by_url[URLS[1]]],
+        [(True, None), (False, 'Posting not found', False)],
+    )
+    assert _states() == {URLS[0]: DONE, URLS[1]: FAILED}
+
+
+def test_retryable_failure_backs_off(temp_db):
+    """Un fallo reintentable vuelve a pending con backoff y no se re-toma al instante"""
+    frontier = CrawlFrontier('a', lease_seconds=60)
+    frontier.enqueue(URLS[:1])
+    frontier.complete(frontier.lease(1), [(False, 'timeout')])
+
+    with get_db() as db:
+        status, not_before, error = db.execute(
+            select(FrontierUrl.status, FrontierUrl.not_before, FrontierUrl.last_error)
+        ).one()
+    assert (status, error) == (PENDING, 'timeout')
+    assert not_before > datetime.utcnow()
+    assert frontier.lease(1) == []
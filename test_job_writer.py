@@ -0,0 +1,74 @@
+"""
+Test del Escritor por Lotes
+Testo de la Ara Skribilo
+Test for the buffered job writer and its writer thread
+"""
+import asyncio
+
+from sqlalchemy import select, func
+
+from src.database import get_db
+from src.job_writer import BufferedJobWriter, JobWriterThread
+from src.models import Job, Company
+
+
+def _job(n: int, company: str = 'Acme') -> dict:
+    return {
+        'title': f'Engineer {n}',
+        'company_name': company,
+        'url': f'https://boards.greenhouse.io/acme/jobs/{n}',
+        'source_platform': 'greenhouse',
+    }
+
+
+def _count(model) -> int:
+    with get_db() as db:
+        return db.scalar(select(func.count(model.id)))
+
+
+def test_batch_insert_and_duplicates(temp_db):
+    """Un lote crea empresas en bloque y descarta duplicados del lote y de la BD"""
+    writer = BufferedJobWriter(batch_size=100, flush_interval=3600)
+    for job in [_job(1), _job(2, 'Globex'), _job(1)]:
+        writer.add(job)
+    assert writer.flush() == 2
+    counts = writer.take_counts()
+    assert (counts['saved'], counts['duplicates'], counts['failed']) == (2, 1, 0)
+    assert sorted(counts['committed_urls']) == [_job(1)['url'], _job(2)['url']]
+
+    writer.add(_job(2))
+    writer.add(_job(3))
+    assert writer.flush() == 1
+    assert (writer.take_counts()['duplicates'], _count(Job), _count(Company)) == (1, 3, 2)
+    assert writer.add({'title': 'Sin URL'}) is None
+
+
+def test_failed_batch_reports_its_urls(temp_db):
+    """Un error de BD no confirma el lote: sus URLs vuelven como failed_urls"""
+    Job.__table__.drop(temp_db)
+    writer = BufferedJobWriter(batch_size=100, flush_interval=3600)
+    writer.add(_job(1))
+    writer.add(_job(2))
+    assert writer.flush() == 0
+
+    counts = writer.take_counts()
+    assert (counts['saved'], counts['failed'], counts['committed_urls']) == (0, 2, [])
+    assert sorted(counts['failed_urls']) == [_job(1)['url'], _job(2)['url']]
+    assert writer.take_counts()['failed_urls'] == []
+
+
+def test_writer_thread_flush_and_close(temp_db):
+    """El hilo confirma lo encolado en flush() y termina en close()"""
+    async def run():
+        thread = JobWriterThread(BufferedJobWriter(batch_size=100, flush_interval=3600), maxsize=2)
+        for n in range(5):
+            assert await thread.put(_job(n)) is not None
+        await thread.flush()
+        metrics = thread.take_metrics()
+        await thread.close()
+        return metrics
+
+    metrics = asyncio.run(run())
+    assert metrics['saved'] == 5 and metrics['flushes'] >= 1
+    assert len(metrics['committed_urls']) == 5
+    assert _count(Job) == 5
@@ -0,0 +1,54 @@
+"""
+Test del Buscador de Palabras Clave
+Testo de la Ŝlosilvorta Serĉilo
+Test for the compiled keyword matcher (same semantics as `keyword in text`)
+"""
+from src.keyword_matcher import KeywordMatcher, job_signals, URGENCY, IT_NICHE, SENIORITY, REMOTE
+
+
+def _naive(classes, *texts):
+    hits = {}
+    for name, keywords in classes.items():
+        for keyword in keywords:
+            if any(keyword.lower() in (text or '').lower() for text in texts):
+                hits.setdefault(name, set()).add(keyword.lower())
+    return hits
+
+
+def test_matches_substring_semantics():
+    """Solapes, prefijos compartidos y mayúsculas como `in` / Kiel `in`"""
+    classes = {
+        'ml': ['machine', 'machine learning', 'Deep Learning'],
+        'data': ['data', 'database', 'learning'],
+        'lang': ['go', 'golang'],
+    }
+    matcher = KeywordMatcher(classes)
+    for text in [
+        'Machine Learning engineer with DATABASE skills',
+        'machine learnt nothing; deep learning only',
+        'We use Golang and Google',
+        'nothing relevant here',
+        '',
+    ]:
+        assert matcher.scan(text) == _naive(classes, text), text
+
+
+def test_texts_are_scanned_separately():
+    """Una palabra no cruza de un texto al siguiente / Vorto ne transiras tekstojn"""
+    matcher = KeywordMatcher({'ml': ['machine learning']})
+    assert matcher.classes('machine', 'learning') == set()
+    assert matcher.classes(None, 'Machine learning') == {'ml'}
+
+
+def test_empty_keyword_matches_everything():
+    """'' in texto es siempre cierto / '' in teksto ĉiam veras"""
+    matcher = KeywordMatcher({'all': [''], 'none': []})
+    assert matcher.scan('anything') == {'all': set()}
+    assert matcher.classes(None) == {'all'}
+
+
+def test_job_signals():
+    """Señales del título y de la descripción por separado / Signaloj aparte"""
+    title, description = job_signals('Senior ML Engineer - URGENT', 'Remote team doing computer vision')
+    assert title == {SENIORITY, URGENCY}
+    assert description == {REMOTE, IT_NICHE}
@@ -0,0 +1,40 @@
+"""
+Test del Normalizador de Ubicaciones
+Testo de la Loka Normaligilo
+Test for gazetteer-based location normalization
+"""
+from src.location_normalizer import normalize_location, named_place, NormalizedLocation, Place
+
+
+def test_city_and_country():
+    """Ciudad con país, sin acentos y con alias / Urbo kun lando"""
+    assert normalize_location('Buenos Aires, AR') == NormalizedLocation('Argentina', 'Buenos Aires', None)
+    assert normalize_location('Sao Paulo, Brasil') == NormalizedLocation('Brazil', 'São Paulo', None)
+    assert normalize_location('San Francisco, CA') == NormalizedLocation('United States', 'San Francisco', None)
+    assert normalize_location('Remote (US)') == NormalizedLocation('United States', None, 'full_remote')
+
+
+def test_ambiguous_names():
+    """El país mencionado decide entre ciudades homónimas / La menciita lando decidas"""
+    assert normalize_location('London') == NormalizedLocation('United Kingdom', 'London', None)
+    assert normalize_location('London, Ontario') == NormalizedLocation('Canada', 'London', None)
+    assert normalize_location('Valencia, Venezuela') == NormalizedLocation('Venezuela', 'Valencia', None)
+    assert normalize_location('Toronto, CA') == NormalizedLocation('Canada', 'Toronto', None)
+    assert normalize_location('Remoto en la Argentina') == NormalizedLocation('Argentina', None, 'full_remote')
+
+
+def test_remote_policy():
+    """Política remota del texto o del flag is_remote / Fora politiko"""
+    assert normalize_location('Hybrid - Madrid') == NormalizedLocation('Spain', 'Madrid', 'hybrid')
+    assert normalize_location('New York, NY (On-site)').remote_policy == 'onsite'
+    assert normalize_location('Berlin', is_remote=True).remote_policy == 'full_remote'
+    assert normalize_location('Nowhere in particular') == NormalizedLocation(None, None, None)
+
+
+def test_named_place_for_filters():
+    """Solo un nombre completo de país o ciudad; las regiones no son países"""
+    assert named_place('España') == Place('Spain', None)
+    assert named_place('nyc') == Place('United States', 'New York')
+    assert named_place('California') is None
+    assert named_place('Ontario') is None
+    assert normalize_location('California') == NormalizedLocation('United States', None, None)
@@ -0,0 +1,43 @@
+"""
+Test del Parser de Salarios
+Testo de la Salajra Analizilo
+Test for structured salary parsing
+"""
+from src.salary_parser import parse_salary, ParsedSalary, to_usd, period_of_unit
+
+
+def test_ranges_and_currencies():
+    """Rangos con k, códigos, símbolos y separadores de miles locales"""
+    assert parse_salary('$120k–$180k') == ParsedSalary(120000.0, 180000.0, 'USD', 'year')
+    assert parse_salary('$120-180K') == ParsedSalary(120000.0, 180000.0, 'USD', 'year')
+    assert parse_salary('USD 90,000 - 110,000/yr') == ParsedSalary(90000.0, 110000.0, 'USD', 'year')
+    assert parse_salary('€45.000 - €55.000') == ParsedSalary(45000.0, 55000.0, 'EUR', 'year')
+    assert parse_salary('€ 50 000 – 60 000') == ParsedSalary(50000.0, 60000.0, 'EUR', 'year')
+
+
+def test_periods_are_annualized():
+    """Por hora y por mes se guardan como salario anual"""
+    assert parse_salary('$45-60/hr') == ParsedSalary(93600.0, 124800.0, 'USD', 'hour')
+    assert parse_salary('ARS 1.500.000 - 2.000.000 por mes') == ParsedSalary(18e6, 24e6, 'ARS', 'month')
+    # En BRL sin periodo explícito se asume mensual
+    assert parse_salary('R$ 8.000 a 12.000') == ParsedSalary(96000.0, 144000.0, 'BRL', 'month')
+
+
+def test_descriptions_and_noise():
+    """En descripciones solo cuentan importes con moneda"""
+    description = 'We raised $50M last year. Compensation: USD 5,000 - 7,000 per month plus equity.'
+    assert parse_salary(description, require_currency=True) == ParsedSalary(60000.0, 84000.0, 'USD', 'month')
+    assert parse_salary('Up to $150,000') == ParsedSalary(None, 150000.0, 'USD', 'year')
+    assert parse_salary('5+ years of experience with 100 engineers', require_currency=True) is None
+    assert parse_salary('3-5 years') is None
+    assert parse_salary('Competitive') is None
+
+
+def test_dollar_sign_and_usd_conversion():
+    """Un '$' suelto cede ante un código explícito o la moneda del país"""
+    assert parse_salary('$80,000 - $100,000 CAD') == ParsedSalary(80000.0, 100000.0, 'CAD', 'year')
+    assert parse_salary('$ 300.000 mensuales') is None
+    assert parse_salary('$ 300.000 mensuales', dollar_currency='ARS') == ParsedSalary(3.6e6, 3.6e6, 'ARS', 'month')
+    assert to_usd(ParsedSalary(18e6, 24e6, 'ARS', 'month')) == ParsedSalary(18000.0, 24000.0, 'USD', 'month')
+    assert to_usd(ParsedSalary(None, 1e6, 'CLP', 'year')) is None
+    assert period_of_unit('per-month-salary') == 'month' and period_of_unit('HOUR') == 'hour'
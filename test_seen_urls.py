@@ -0,0 +1,47 @@
+"""
+Test del Índice de URLs Conocidas
+Testo de la Indekso de Konataj URL-oj
+Test for the Bloom filter persistence and DB-confirmed lookups
+"""
+from src.database import get_db
+from src.models import Job
+from src.seen_urls import BloomFilter, SeenUrlIndex
+
+
+def test_bloom_save_and_load(tmp_path):
+    """El filtro guardado conserva bits y cuenta; un archivo dañado se descarta"""
+    path = str(tmp_path / 'seen.bloom')
+    bloom = BloomFilter(1000, 0.01)
+    urls = [f'https://jobs.lever.co/acme/{i}' for i in range(200)]
+    for url in urls:
+        bloom.add(url)
+    bloom.save(path)
+
+    loaded = BloomFilter.load(path)
+    assert (loaded.num_bits, loaded.num_hashes, loaded.count) == (bloom.num_bits, bloom.num_hashes, 200)
+    assert all(url in loaded for url in urls)
+
+    with open(path, 'r+b') as f:
+        f.truncate(f.seek(0, 2) - 1)
+    assert BloomFilter.load(path) is None
+    assert BloomFilter.load(str(tmp_path / 'missing.bloom')) is None
+
+
+def test_index_rebuilds_and_confirms_in_db(temp_db, tmp_path):
+    """Se reconstruye desde Job.url y los positivos se confirman en BD"""
+    path = str(tmp_path / 'seen.bloom')
+    with get_db() as db:
+        db.add(Job(title='Dev', company_name='Acme', url='https://boards.greenhouse.io/acme/jobs/1'))
+
+    index = SeenUrlIndex.open(path)
+    assert index.is_known('https://boards.greenhouse.io/Acme/jobs/1?utm_source=x')
+    assert not index.is_known('https://boards.greenhouse.io/acme/jobs/2')
+
+    index.add('https://boards.greenhouse.io/acme/jobs/2')
+    index.save()
+    reopened = SeenUrlIndex.open(path)
+    assert reopened.bloom.count == 2
+    assert reopened.might_contain('https://boards.greenhouse.io/acme/jobs/2')
+    # Positivo del filtro sin fila en BD: falso positivo / Falsa pozitivo
+    assert not reopened.is_known('https://boards.greenhouse.io/acme/jobs/2')
+    assert reopened.false_positives == 1
@@ -0,0 +1,66 @@
+"""
+Test de Canonicalización de URLs de Ofertas
+Testo de Kanonigo de Oferto-URL-oj
+Test for job posting URL canonicalization
+"""
+from src.schemas import SourcePlatform
+from src.url_canonicalizer import canonicalize, detect_source_platform
+
+
+def test_variants_share_canonical_url():
+    """Las variantes de una misma oferta producen la misma URL"""
+    greenhouse = {
+        canonicalize(url)
+        for url in [
+            'https://boards.greenhouse.io/acme/jobs/4012345',
+            'https://boards.greenhouse.io/acme/jobs/4012345?gh_jid=4012345&utm_source=linkedin',
+            'https://boards.greenhouse.io/embed/job_app?for=acme&token=4012345',
+            'https://job-boards.greenhouse.io/Acme/jobs/4012345/',
+        ]
+    }
+    assert greenhouse == {('https://boards.greenhouse.io/acme/jobs/4012345', SourcePlatform.GREENHOUSE, '4012345')}
+
+    lever = {
+        canonicalize(url).url
+        for url in [
+            'https://jobs.lever.co/globex/0b6a3c4e-1111-2222-3333-444455556666',
+            'https://jobs.lever.co/globex/0b6a3c4e-1111-2222-3333-444455556666/apply?lever-source=LinkedIn',
+        ]
+    }
+    assert lever == {'https://jobs.lever.co/globex/0b6a3c4e-1111-2222-3333-444455556666'}
+
+    smartrecruiters = {
+        canonicalize(url).url
+        for url in [
+            'https://jobs.smartrecruiters.com/Initech/743999-backend-dev',
+            'https://jobs.smartrecruiters.com/initech/743999?trid=abc',
+        ]
+    }
+    assert smartrecruiters == {'https://jobs.smartrecruiters.com/initech/743999'}
+
+
+def test_external_id_per_ats():
+    """Cada ATS expone su identificador de oferta"""
+    assert canonicalize('https://acme.wd5.myworkdayjobs.com/en-US/External/job/Remote/Data-Engineer_JR-0042/apply') == (
+        'https://acme.wd5.myworkdayjobs.com/External/job/Remote/Data-Engineer_JR-0042',
+        SourcePlatform.WORKDAY,
+        'JR-0042',
+    )
+    assert canonicalize('https://jobs.smartrecruiters.com/Initech/743999-backend-dev').external_id == '743999'
+    assert canonicalize('https://www.linkedin.com/jobs/view/python-developer-at-acme-3812345678/?trk=x').url == \
+        'https://www.linkedin.com/jobs/view/3812345678'
+    assert canonicalize('https://careers.acme.com/jobs?gh_jid=55&utm_medium=x').external_id == '55'
+
+
+def test_custom_sites_only_drop_tracking():
+    """En sitios desconocidos solo se limpian tracking, fragmento y barra final"""
+    result = canonicalize('https://Careers.Example.com/jobs/42/?utm_campaign=x&lang=es#apply')
+    assert result == ('https://careers.example.com/jobs/42?lang=es', SourcePlatform.CUSTOM, None)
+    assert detect_source_platform('https://apply.workable.com/x/j/ABC/') == SourcePlatform.WORKABLE
+
+
+if __name__ == "__main__":
+    test_variants_share_canonical_url()
+    test_external_id_per_ats()
+    test_custom_sites_only_drop_tracking()
+    print("✅ Tests de canonicalización completados")